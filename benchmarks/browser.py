@@ -0,0 +1,171 @@
+import argparse
+import json
+import os
+import shutil
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from benchmarks.offline import build_page
+from extractors import browser
+
+# 실제 크롬으로 web3 페이지를 열어서 브라우저 프로필별 페이지 준비 시간 / 메모리를 비교하는 벤치마크
+#
+#   python -m benchmarks.browser                       # full / lean 프로필 비교
+#   python -m benchmarks.browser --profiles lean --repeat 10 --asset-delay-ms 300
+#
+# 저장된 web3 페이지를 로컬 서버로 띄우고, 페이지가 참조하는 CSS / JS / 이미지도 asset-delay 만큼
+# 늦게 응답하는 로컬 파일로 바꿔서 리소스 차단 효과가 네트워크 상태와 무관하게 드러나도록 함
+# 크롬이 없으면 건너뜀 (exit 0)
+PROFILES = ("full", "lean")
+REPEAT = 5
+SIZE = 50
+CHROME_BINARIES = ("google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome")
+
+# 페이지에 끼워 넣는 무거운 리소스 (실제 web3.career 의 배너 / 로고 이미지 대신)
+EXTRA_ASSETS = (
+    '<style>@font-face{font-family:bench;src:url(/assets/font.woff2)} body{font-family:bench}</style>'
+    '<img src="/assets/banner.png"><img src="/assets/logo.png">'
+)
+
+READY_SCRIPT = 'return document.querySelectorAll("h2[data-jobid]").length;'
+
+
+def find_chrome():
+    for name in CHROME_BINARIES:
+        path = shutil.which(name)
+        if path:
+            return path
+    return None
+
+
+def serve_page(page, asset_delay):
+
+    class Handler(BaseHTTPRequestHandler):
+
+        def do_GET(self):
+            if self.path.startswith("/assets/"):
+                time.sleep(asset_delay)
+                body = b"x" * 64 * 1024
+                content_type = "application/octet-stream"
+            else:
+                body = page.encode("utf-8")
+                content_type = "text/html; charset=utf-8"
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, name="bench-page", daemon=True).start()
+    return server
+
+
+def process_tree_rss_kb(pid):
+    # pid 와 그 자식 프로세스(크롬 렌더러 / GPU 등)의 VmRSS 합계, 리눅스 /proc 기준
+    children = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(ppid, []).append(int(entry))
+
+    total = 0
+    stack = [pid]
+    while stack:
+        current = stack.pop()
+        stack.extend(children.get(current, []))
+        try:
+            with open(f"/proc/{current}/status") as f:
+                for line in f:
+                    if line.startswith("VmRSS:"):
+                        total += int(line.split()[1])
+        except OSError:
+            continue
+    return total
+
+
+def measure(profile, url, repeat=REPEAT, timeout=30):
+    # 프로필 하나로 크롬을 띄워 repeat 번 페이지를 열고 공고 행이 보일 때까지의 시간을 잼
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+    from webdriver_manager.chrome import ChromeDriverManager
+
+    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()),
+                              options=browser.chrome_options("web3", profile))
+    try:
+        browser.apply_blocking(driver, "web3", profile)
+
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            driver.get(url)
+            while not driver.execute_script(READY_SCRIPT):
+                if time.perf_counter() - start > timeout:
+                    raise TimeoutError(f"{profile}: job rows not found within {timeout}s")
+                time.sleep(0.01)
+            samples.append(time.perf_counter() - start)
+        rss = process_tree_rss_kb(driver.service.process.pid)
+    finally:
+        driver.quit()
+
+    samples.sort()
+    return {
+        "profile": profile,
+        "ready_ms_min": samples[0] * 1000,
+        "ready_ms_median": samples[len(samples) // 2] * 1000,
+        "rss_kb": rss,
+    }
+
+
+def run(profiles=PROFILES, repeat=REPEAT, size=SIZE, asset_delay=0.2):
+    page = build_page("web3", size).replace("https://web3.career/assets/", "/assets/")
+    page = page.replace("</body>", EXTRA_ASSETS + "</body>")
+    server = serve_page(page, asset_delay)
+    try:
+        url = f"http://127.0.0.1:{server.server_port}/python-jobs"
+        return [measure(profile, url, repeat) for profile in profiles]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def format_table(results):
+    lines = [f"{'profile':<8}{'ready ms (min)':>16}{'ready ms (median)':>19}{'RSS KB':>10}"]
+    for r in results:
+        lines.append(f"{r['profile']:<8}{r['ready_ms_min']:>16.0f}{r['ready_ms_median']:>19.0f}{r['rss_kb']:>10}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless Chrome profile benchmark for web3")
+    parser.add_argument("--profiles", default=",".join(PROFILES))
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    parser.add_argument("--size", type=int, default=SIZE, help="number of job rows on the page")
+    parser.add_argument("--asset-delay-ms", type=float, default=200)
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args(argv)
+
+    profiles = [p for p in args.profiles.split(",") if p]
+    unknown = [p for p in profiles if p not in browser.PROFILES]
+    if unknown:
+        parser.error(f"unknown profiles: {', '.join(unknown)}")
+    if find_chrome() is None:
+        print("chrome not found, skipping browser benchmark", file=sys.stderr)
+        return 0
+
+    results = run(profiles, args.repeat, args.size, args.asset_delay_ms / 1000)
+    print(json.dumps(results, indent=2) if args.json else format_table(results))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+# main 을 import 하는 데 걸리는 시간 (콜드 스타트 비용) 벤치마크, python -X importtime 기반
+#
+#   python -m benchmarks.importtime                       # 결과 출력
+#   python -m benchmarks.importtime --save benchmarks/importtime.json
+#   python -m benchmarks.importtime --baseline benchmarks/importtime.json --tolerance 0.25
+#                                                         # 기준보다 느려지거나 무거운 의존성이 다시 import 되면 exit 1
+#
+# 매번 새 인터프리터로 재므로 .pyc 캐시가 있는 상태(운영 컨테이너와 같은 조건)의 시간
+MODULE = "main"
+REPEAT = 5
+TOP = 10
+# main import 시점에는 불러오지 않아야 하는 무거운 의존성 (첫 스크래핑 때 불러옴, lazy.py)
+HEAVY = ("selenium", "webdriver_manager", "cloudscraper", "bs4", "requests")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def parse_importtime(stderr):
+    # "import time: self [us] | cumulative | imported package" -> {모듈: (self, cumulative)}
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative, name = line[len("import time:"):].split("|", 2)
+        modules[name.strip()] = (int(self_us), int(cumulative))
+    return modules
+
+
+def sample(module=MODULE):
+    # 새 프로세스에서 module 을 import 하고 (importtime 결과, 로드된 무거운 의존성) 반환
+    code = f"import sys, {module}; print(','.join(m for m in {HEAVY!r} if m in sys.modules))"
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    heavy = [m for m in proc.stdout.strip().split(",") if m]
+    return parse_importtime(proc.stderr), heavy
+
+
+def measure(module=MODULE, repeat=REPEAT, top=TOP):
+    totals = []
+    runs = []
+    heavy = []
+    for _ in range(repeat):
+        modules, heavy = sample(module)
+        totals.append(modules[module][1])
+        runs.append(modules)
+    # 가장 느린 import (최상위 패키지 기준, 중앙값)
+    names = {name.strip() for modules in runs for name in modules if "." not in name.strip()}
+    slowest = sorted(
+        ((name, statistics.median(m.get(name, (0, 0))[1] for m in runs) / 1000) for name in names if name != module),
+        key=lambda item: -item[1],
+    )[:top]
+    return {
+        "module": module,
+        "import_ms": statistics.median(totals) / 1000,
+        "import_ms_min": min(totals) / 1000,
+        "heavy_loaded": heavy,
+        "slowest": [{"module": name, "ms": ms} for name, ms in slowest],
+    }
+
+
+def compare(result, baseline, tolerance):
+    failures = []
+    if result["import_ms"] > baseline["import_ms"] * (1 + tolerance):
+        failures.append(f"{result['module']} import {result['import_ms']:.0f}ms > baseline {baseline['import_ms']:.0f}ms")
+    for name in result["heavy_loaded"]:
+        failures.append(f"{result['module']} eagerly imports {name}")
+    return failures
+
+
+def format_report(result):
+    lines = [
+        f"import {result['module']}  median {result['import_ms']:.1f} ms  (min {result['import_ms_min']:.1f} ms)",
+        f"heavy modules loaded at import: {', '.join(result['heavy_loaded']) or 'none'}",
+        "slowest top-level imports:",
+    ]
+    lines += [f"  {item['module']:<24}{item['ms']:>8.1f} ms" for item in result["slowest"]]
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cold-start import time benchmark")
+    parser.add_argument("--module", default=MODULE)
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    parser.add_argument("--top", type=int, default=TOP)
+    parser.add_argument("--baseline", help="baseline JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--save", help="write the result as a baseline JSON")
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args(argv)
+
+    result = measure(args.module, args.repeat, args.top)
+    print(json.dumps(result, indent=2) if args.json else format_report(result))
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        failures = compare(result, baseline, args.tolerance)
+        for failure in failures:
+            print(f"REGRESSION {failure}", file=sys.stderr)
+        if failures:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,128 @@
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from benchmarks.offline import SOURCES, build_page, offline
+
+# 저장된 페이지로 추출기 파싱 성능을 재는 오프라인 벤치마크 (네트워크 / 크롬 불필요)
+#
+#   python -m benchmarks.run                                  # 결과 출력
+#   python -m benchmarks.run --save benchmarks/baseline.json  # 기준값 저장
+#   python -m benchmarks.run --baseline benchmarks/baseline.json --tolerance 0.25
+#                                                             # 기준 대비 느려지거나 메모리가 늘면 exit 1
+#
+# web3 는 크롬 대신 저장된 페이지를 읽는 FixtureDriver 로 돌리므로 브라우저 비용은 빠지고
+# 추출기 쪽 파이썬 코드 비용만 측정됨
+SIZES = (10, 100, 1000)
+REPEAT = 5
+
+
+def measure(source, size, repeat=REPEAT, keyword="python"):
+    page = build_page(source, size)
+    with offline(source, page) as extract:
+        # 1. 워밍업 (import / 정규식 컴파일 등 1회성 비용 제외)
+        jobs = extract(keyword)
+
+        # 2. 처리량
+        start = time.perf_counter()
+        for _ in range(repeat):
+            jobs = extract(keyword)
+        elapsed = time.perf_counter() - start
+
+        # 3. 메모리 (최대 사용량, 추출 중에 할당되어 끝난 뒤에도 남아 있는 메모리 블록 수)
+        # tracemalloc 은 해제된 할당을 세지 않으므로 할당 횟수가 아니라 남은(retained) 블록 수
+        tracemalloc.start()
+        try:
+            jobs = extract(keyword)
+            _, peak = tracemalloc.get_traced_memory()
+            snapshot = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+    retained = sum(stat.count for stat in snapshot.statistics("filename"))
+
+    return {
+        "source": source,
+        "size": size,
+        "jobs": len(jobs),
+        "seconds_per_page": elapsed / repeat,
+        "pages_per_sec": repeat / elapsed,
+        "jobs_per_sec": len(jobs) * repeat / elapsed,
+        "peak_kb": peak / 1024,
+        "retained_blocks": retained,
+    }
+
+
+def run(sources=SOURCES, sizes=SIZES, repeat=REPEAT):
+    return [measure(source, size, repeat) for source in sources for size in sizes]
+
+
+def result_key(result):
+    return f"{result['source']}:{result['size']}"
+
+
+def compare(results, baseline, tolerance):
+    # 처리량이 (1 - tolerance) 배 아래로 떨어지거나 최대 메모리가 (1 + tolerance) 배를 넘으면 회귀
+    failures = []
+    for result in results:
+        base = baseline.get(result_key(result))
+        if not base:
+            continue
+        if result["jobs_per_sec"] < base["jobs_per_sec"] * (1 - tolerance):
+            failures.append(
+                f"{result_key(result)} jobs/s {result['jobs_per_sec']:.0f} < baseline {base['jobs_per_sec']:.0f}"
+            )
+        if result["peak_kb"] > base["peak_kb"] * (1 + tolerance):
+            failures.append(
+                f"{result_key(result)} peak {result['peak_kb']:.0f}KB > baseline {base['peak_kb']:.0f}KB"
+            )
+    return failures
+
+
+def format_table(results):
+    lines = [f"{'source':<8}{'size':>6}{'jobs':>6}{'pages/s':>10}{'jobs/s':>11}{'peak KB':>10}{'retained':>9}"]
+    for r in results:
+        lines.append(
+            f"{r['source']:<8}{r['size']:>6}{r['jobs']:>6}{r['pages_per_sec']:>10.1f}"
+            f"{r['jobs_per_sec']:>11.0f}{r['peak_kb']:>10.0f}{r['retained_blocks']:>9}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Offline extractor benchmarks")
+    parser.add_argument("--sources", default=",".join(SOURCES))
+    parser.add_argument("--sizes", default=",".join(str(size) for size in SIZES))
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    parser.add_argument("--baseline", help="baseline JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--save", help="write results as a baseline JSON")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args(argv)
+
+    sources = [s for s in args.sources.split(",") if s]
+    unknown = [s for s in sources if s not in SOURCES]
+    if unknown:
+        parser.error(f"unknown sources: {', '.join(unknown)}")
+    sizes = [int(size) for size in args.sizes.split(",") if size]
+    results = run(sources, sizes, args.repeat)
+
+    print(json.dumps(results, indent=2) if args.json else format_table(results))
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump({result_key(r): r for r in results}, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        failures = compare(results, baseline, args.tolerance)
+        for failure in failures:
+            print(f"REGRESSION {failure}", file=sys.stderr)
+        if failures:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+import json
+import os
+import threading
+import time
+
+# 배치 스크래핑 진행 상황을 남기는 추가 전용(append-only) JSONL 로그
+#
+#   {"keyword": "python", "source": "web3", "page": 1, "status": "started", "time": ...}
+#   {"keyword": "python", "source": "web3", "page": 1, "status": "done", "jobs": 20, "offset": 4096, "time": ...}
+#   {"keyword": "java", "source": "berlin", "page": 1, "status": "failed", "error": "...", "time": ...}
+#
+# 같은 단위(keyword, source, page)는 마지막 줄의 상태가 현재 상태
+# done 만 건너뛰고, failed 와 started(실행 중에 죽은 것)는 다시 실행
+# 기록 도중 죽어서 잘린 마지막 줄은 무시 (다시 열 때 줄바꿈을 먼저 써서 다음 기록이 잘린 줄에 붙지 않도록)
+STARTED = "started"
+DONE = "done"
+FAILED = "failed"
+
+
+class Checkpoint:
+
+    def __init__(self, path):
+        self.path = path
+        self.units = {}  # (keyword, source, page) -> 마지막 기록
+        self._lock = threading.Lock()
+        self._file = None
+        self.load()
+
+    def load(self):
+        self.units = {}
+        if not os.path.exists(self.path):
+            return self.units
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                    unit = (record["keyword"], record["source"], record.get("page", 1))
+                except (ValueError, KeyError, TypeError):
+                    continue
+                self.units[unit] = record
+        return self.units
+
+    def status(self, keyword, source, page=1):
+        record = self.units.get((keyword, source, page))
+        return record["status"] if record else None
+
+    def is_done(self, keyword, source, page=1):
+        return self.status(keyword, source, page) == DONE
+
+    @property
+    def offset(self):
+        # 완료된 단위까지 출력 파일에 쓰인 위치, 이 뒤는 완료 기록 없이 쓰다 만 내용
+        return max((r.get("offset", 0) for r in self.units.values() if r["status"] == DONE), default=0)
+
+    def mark(self, keyword, source, status, page=1, **fields):
+        record = {"keyword": keyword, "source": source, "page": page, "status": status, **fields, "time": time.time()}
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        # 여러 작업 스레드에서 부르므로 한 줄씩 통째로 기록
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, "a", encoding="utf-8")
+                if not self._ends_with_newline():
+                    self._file.write("\n")
+            self._file.write(line)
+            self._file.flush()
+            self.units[(keyword, source, page)] = record
+        return record
+
+    def _ends_with_newline(self):
+        # 비어 있거나 마지막 줄이 온전하면 True
+        with open(self.path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell() == 0:
+                return True
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+
+    def reset(self):
+        # 처음부터 다시 실행
+        self.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        self.units = {}
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
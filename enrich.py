@@ -0,0 +1,257 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait as wait_futures
+from urllib.parse import urlsplit
+import metrics
+import scheduler
+from log import get_logger
+from links import link_index
+
+# 공고 상세 페이지(설명, 연봉, 태그)를 읽어서 검색 결과에 붙이는 단계 (기본은 요청할 때만)
+#   /api/search?keyword=python&enrich=1   요청한 페이지의 공고만 상세 정보를 붙여서 응답
+#   ENRICH_BACKGROUND=1                   검색할 때마다 결과의 상세 페이지를 백그라운드에서 미리 읽어 둠
+#
+# enrich=1 요청은 목록 스크래핑과 같은 풀을 쓰지 않도록 별도 풀에서 읽고,
+# 백그라운드 미리 읽기는 스크래핑 공유 풀(scheduler)의 prefetch 클래스로 넣어서 검색이 밀리지 않게 함
+# 같은 host 에는 간격을 두고 요청함
+# 상세 정보는 목록보다 잘 바뀌지 않으므로 표준 링크(links.py)를 키로 오래 보관
+#   ENRICH_WORKERS        enrich=1 요청에서 동시에 읽는 상세 페이지 수 (기본 4)
+#   ENRICH_HOST_INTERVAL  같은 host 요청 사이 최소 간격 초 (기본 0.5)
+#   ENRICH_TTL            상세 정보 캐시 유지 초 (기본 86400)
+#   ENRICH_ERROR_TTL      읽기에 실패한 상세 페이지(404, 타임아웃 등)를 빈 상세 정보로 두는 초 (기본 300)
+#                         그동안은 다시 읽지 않고 필드 없이(None) 응답, pending 에도 세지 않음
+#   ENRICH_CACHE_SIZE     캐시에 둘 공고 수 (기본 10000)
+#   ENRICH_MAX_PENDING    대기 중인 요청이 이보다 많으면 백그라운드 요청은 버림 (기본 200)
+#   ENRICH_WAIT           enrich=1 요청이 상세 페이지를 기다리는 최대 초 (기본 5), 못 받은 공고는 필드 없이 응답
+WORKERS = int(os.environ.get("ENRICH_WORKERS", "4"))
+HOST_INTERVAL = float(os.environ.get("ENRICH_HOST_INTERVAL", "0.5"))
+TTL = float(os.environ.get("ENRICH_TTL", "86400"))
+ERROR_TTL = float(os.environ.get("ENRICH_ERROR_TTL", "300"))
+CACHE_SIZE = int(os.environ.get("ENRICH_CACHE_SIZE", "10000"))
+MAX_PENDING = int(os.environ.get("ENRICH_MAX_PENDING", "200"))
+WAIT = float(os.environ.get("ENRICH_WAIT", "5"))
+BACKGROUND = os.environ.get("ENRICH_BACKGROUND", "").lower() in ("1", "true", "yes")
+
+FIELDS = ("description", "salary", "tags")
+
+logger = get_logger("enrich")
+
+fetches = metrics.counter(
+    "enrich_fetches_total",
+    "Job detail page fetches by host and result (ok or error)",
+    ("host", "result"),
+)
+lookups = metrics.counter(
+    "enrich_cache_total",
+    "Job detail cache lookups by result (hit or miss)",
+    ("result",),
+)
+dropped = metrics.counter(
+    "enrich_dropped_total",
+    "Background detail fetches dropped because too many were pending",
+)
+rate_limited = metrics.histogram(
+    "enrich_rate_limit_wait_seconds",
+    "Time a detail fetch waited for its per-host request slot",
+    ("host",),
+)
+
+
+class DetailCache:
+    # 표준 링크 -> (만료 시각, 상세 정보), 오래 안 쓴 것부터 버림
+
+    def __init__(self, ttl=TTL, max_entries=CACHE_SIZE, clock=time.monotonic):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, link):
+        with self._lock:
+            entry = self._entries.get(link)
+            if entry is None:
+                return None
+            if entry[0] <= self.clock():
+                del self._entries[link]
+                return None
+            self._entries.move_to_end(link)
+            return entry[1]
+
+    def set(self, link, details, ttl=None):
+        ttl = self.ttl if ttl is None else ttl
+        with self._lock:
+            self._entries[link] = (self.clock() + ttl, details)
+            self._entries.move_to_end(link)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class HostLimiter:
+    # host 마다 요청 시작 시각을 interval 간격으로 예약 (대기는 락 밖에서)
+
+    def __init__(self, interval=HOST_INTERVAL, clock=time.monotonic, sleep=time.sleep):
+        self.interval = interval
+        self.clock = clock
+        self.sleep = sleep
+        self._next = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, host):
+        with self._lock:
+            now = self.clock()
+            start = max(now, self._next.get(host, now))
+            self._next[host] = start + self.interval
+        delay = start - now
+        if delay > 0:
+            self.sleep(delay)
+        rate_limited.observe(delay, host=host)
+        return delay
+
+
+limiter = HostLimiter()
+
+
+def source_for(link):
+    # 링크의 host 로 추출기 모듈을 찾음 (모르는 사이트면 None)
+    from extractors import berlin, web3, wework
+    host = urlsplit(link).hostname
+    for module in (berlin, wework, web3):
+        if urlsplit(module.BASE_URL).hostname == host:
+            return module
+    return None
+
+
+def fetch_detail(link):
+    from extractors import engine
+    module = source_for(link)
+    if module is None:
+        return {}
+    limiter.acquire(urlsplit(link).hostname)
+    response = module.scraper().get(link, headers=module.HEADERS, timeout=module.TIMEOUT)
+    # 오류 페이지를 빈 상세 정보로 오래 캐시하지 않도록
+    response.raise_for_status()
+    rows = engine.extract(module.DETAIL, engine.parse(response.text), base=link)
+    return rows[0] if rows else {}
+
+
+class Enricher:
+
+    def __init__(self, fetch=fetch_detail, cache=None, workers=WORKERS, max_pending=MAX_PENDING,
+                 error_ttl=ERROR_TTL):
+        self.fetch = fetch
+        self.cache = cache if cache is not None else DetailCache()
+        self.error_ttl = error_ttl
+        self.workers = workers
+        self.max_pending = max_pending
+        self._executor = None
+        self._inflight = {}  # link -> Future
+        self._lock = threading.Lock()
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="enrich")
+            return self._executor
+
+    def _run(self, link):
+        host = urlsplit(link).hostname or ""
+        try:
+            details = self.fetch(link)
+            details = {field: details.get(field) for field in FIELDS}
+            # 캐시에 넣은 뒤에 _inflight 에서 지워야 그 사이에 같은 링크를 다시 읽지 않음
+            self.cache.set(link, details)
+        except Exception as e:
+            fetches.inc(host=host, result="error")
+            logger.warning("detail fetch failed", extra={"link": link, "error": str(e)})
+            # 없는 페이지를 요청마다 다시 읽으며 기다리지 않도록 잠깐 빈 상세 정보로 둠
+            self.cache.set(link, dict.fromkeys(FIELDS), self.error_ttl)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(link, None)
+        fetches.inc(host=host, result="ok")
+        return details
+
+    def submit(self, link, background=False):
+        # 이미 읽고 있는 링크는 그 작업을 공유, 백그라운드 요청은 대기열이 가득 차면 버림
+        if background:
+            executor = scheduler.get_executor()
+            options = {"priority": scheduler.PREFETCH}
+        else:
+            executor = self._get_executor()
+            options = {}
+        with self._lock:
+            future = self._inflight.get(link)
+            if future is not None:
+                return future
+            if background and len(self._inflight) >= self.max_pending:
+                dropped.inc()
+                return None
+            future = self._inflight[link] = executor.submit(self._run, link, **options)
+        return future
+
+    def lookup(self, job):
+        link = link_index.key(job)
+        if not link:
+            return None, None
+        details = self.cache.get(link)
+        lookups.inc(result="hit" if details is not None else "miss")
+        return link, details
+
+    def enrich(self, jobs, wait=WAIT):
+        # 상세 정보를 붙인 새 공고 리스트와 아직 못 받은 공고 수 (읽기에 실패한 공고는 세지 않음)
+        # wait 초 안에 못 받은 공고는 필드 없이 돌려주고, 읽기는 계속해서 다음 요청 때 캐시에서 붙임
+        found = {}
+        futures = {}
+        for job in jobs:
+            link, details = self.lookup(job)
+            if details is not None:
+                found[link] = details
+            elif link and link not in futures:
+                futures[link] = self.submit(link)
+        if futures:
+            wait_futures(futures.values(), timeout=wait)
+        for link, future in futures.items():
+            if future.done():
+                # 실패한 공고는 필드 없이 끝난 것으로 (다시 요청해도 error_ttl 동안은 그대로)
+                found[link] = future.result() if future.exception() is None else dict.fromkeys(FIELDS)
+        results = []
+        pending = 0
+        for job in jobs:
+            details = found.get(link_index.key(job))
+            if details is None:
+                if job.get("link"):
+                    pending += 1
+                results.append(job)
+            else:
+                results.append({**job, **details})
+        return results, pending
+
+    def prefetch(self, jobs):
+        # 캐시에 없는 공고의 상세 페이지를 기다리지 않고 백그라운드로 요청, 요청한 수를 반환
+        submitted = set()
+        for job in jobs:
+            link, details = self.lookup(job)
+            if link and details is None and link not in submitted:
+                if self.submit(link, background=True) is not None:
+                    submitted.add(link)
+        return len(submitted)
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+enricher = Enricher()
@@ -1,38 +1,55 @@
-import requests
-import cloudscraper
-from bs4 import BeautifulSoup
-from bs4.element import Tag
+import os
+from metrics import timed
+from log import get_logger
+from lazy import Lazy
+from extractors import engine
+from extractors.engine import Field, Spec, squash
 
 
 HEADERS = {
     "User-Agent":
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/135.0.0.0 Safari/537.36"
 }
-BASE_URL = "https://berlinstartupjobs.com"
+# 부하 테스트 등에서 가짜 서버로 돌릴 수 있도록 환경 변수로 덮어쓰기 가능
+BASE_URL = os.environ.get("BERLIN_BASE_URL", "https://berlinstartupjobs.com")
 
-scraper = cloudscraper.create_scraper()  # returns a requests.Session object
+TIMEOUT = 15
 
 
+def create_scraper():
+    import cloudscraper
+    return cloudscraper.create_scraper()  # returns a requests.Session object
+
+
+# 요청마다 새 연결을 맺지 않도록 keep-alive 세션(scraper)을 모듈 단위로 공유
+# cloudscraper 는 import 가 무거우므로 첫 스크래핑 때 만듦 (lazy.py)
+scraper = Lazy(create_scraper)
+
+logger = get_logger("berlin")
+
+# 공고 한 줄 = li.bjs-jlid, 링크는 행의 첫 번째 <a> (페이지 주소 기준 표준 링크)
+SPEC = Spec("berlin", row="li.bjs-jlid", fields={
+    "title": Field("h4"),
+    "company": Field("a.bjs-jlid__b"),
+    "link": Field("a", attr="href", link=True),
+})
+
+# 공고 상세 페이지 (enrich.py 에서 요청할 때만 읽음), 없는 필드는 None
+DETAIL = Spec("berlin", row=None, fields={
+    "description": Field("div.job-details, div.entry-content", normalize=squash, required=False),
+    "salary": Field(".bjs-salary, .salary", required=False),
+    "tags": Field("div.links-box a.bjs-bl", many=True, required=False),
+})
+
+
+@timed("berlin", "total")
 def extract_berlin_jobs(keyword):
     url = f"{BASE_URL}/skill-areas/{keyword}/"
-    response = requests.get(url, headers=HEADERS)
-    soup = BeautifulSoup(response.text, "html.parser")
-    jobs = soup.find_all("li", class_="bjs-jlid")
-
-    results = []
-
-    for job in jobs:
-        title = job.find("h4").text.strip()  # type: ignore
-        company = job.find("a", class_="bjs-jlid__b").text.strip()  # type: ignore
-        link = job.find("a")["href"]  # type: ignore
-        #description = job.find("div", class_="bjs-jlid__description").text.strip()
-
-        # 💡 딕셔너리로 정리
-        job_info = {
-            "title": title,
-            "company": company,
-            "link": link,
-        }
-
-        results.append(job_info)
+    with timed("berlin", "fetch"):
+        response = scraper().get(url, headers=HEADERS, timeout=TIMEOUT)
+    with timed("berlin", "parse"):
+        soup = engine.parse(response.text)
+    with timed("berlin", "extract"):
+        results = engine.extract(SPEC, soup, base=url)
+    logger.info("scraped", extra={"source": "berlin", "keyword": keyword, "jobs": len(results)})
     return results
@@ -0,0 +1,532 @@
+import atexit
+import os
+import signal
+import threading
+import time
+from contextlib import contextmanager
+import metrics
+from metrics import timed
+from log import get_logger
+
+# 스크래핑용 헤드리스 크롬 설정
+# 텍스트만 읽으므로 이미지 / 폰트 / CSS / 분석 스크립트는 받지 않도록 막음
+
+# 확장자 기준으로 막을 리소스
+BLOCKED_RESOURCES = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*.css",
+    "*.mp4", "*.webm",
+]
+# 분석 / 광고 / 트래커 도메인
+BLOCKED_TRACKERS = [
+    "*googletagmanager.com*",
+    "*google-analytics.com*",
+    "*doubleclick.net*",
+    "*googlesyndication.com*",
+    "*facebook.net*",
+    "*connect.facebook.com*",
+    "*hotjar.com*",
+    "*segment.io*",
+    "*cdn.segment.com*",
+    "*clarity.ms*",
+    "*intercom.io*",
+    "*crisp.chat*",
+    "*plausible.io*",
+]
+
+PROFILES = {
+    # 모든 리소스를 받는 기본 크롬 (비교 / 디버깅용)
+    "full": {
+        "page_load_strategy": "normal",
+        "block_images": False,
+        "blocked_urls": [],
+    },
+    # DOMContentLoaded 에서 바로 돌아오고 텍스트 외 리소스는 받지 않음
+    "lean": {
+        "page_load_strategy": "eager",
+        "block_images": True,
+        "blocked_urls": BLOCKED_RESOURCES + BLOCKED_TRACKERS,
+    },
+}
+
+# 소스별 프로필, 환경 변수로 바꿀 수 있음 (예: WEB3_BROWSER_PROFILE=full)
+SOURCE_PROFILES = {
+    "web3": os.environ.get("WEB3_BROWSER_PROFILE", "lean"),
+}
+
+
+def get_profile(source, name=None):
+    # name 을 주면 소스 설정 대신 그 프로필을 씀 (벤치마크 등)
+    name = name or SOURCE_PROFILES.get(source, "full")
+    if name not in PROFILES:
+        raise ValueError(f"unknown browser profile: {name}")
+    return PROFILES[name]
+
+
+def chrome_options(source, profile=None):
+    # selenium 은 import 가 무거우므로 브라우저를 띄울 때 불러옴
+    from selenium.webdriver.chrome.options import Options
+    profile = get_profile(source, profile)
+    options = Options()
+    options.add_argument("--headless=new")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--disable-extensions")
+    options.add_argument("--disable-background-networking")
+    options.add_argument("--mute-audio")
+    options.page_load_strategy = profile["page_load_strategy"]
+    if profile["block_images"]:
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+        })
+    return options
+
+
+def apply_blocking(driver, source, profile=None):
+    # 페이지를 열기 전에 DevTools 로 URL 패턴 차단을 걸어둠
+    urls = get_profile(source, profile)["blocked_urls"]
+    if not urls:
+        return
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": urls})
+
+
+# --- 브라우저 수명 관리 ---------------------------------------------------------
+# 드라이버는 성공 / 실패와 관계없이 항상 종료하고, 그래도 남은 크롬(고아 프로세스)은
+# 리퍼(reaper)가 주기적으로 찾아서 정리
+#   BROWSER_REAPER_INTERVAL   검사 주기 초 (기본 60, 0 이면 끔)
+#   BROWSER_ORPHAN_AGE        이보다 오래된 고아 프로세스 정리 (초, 기본 300)
+#   BROWSER_ORPHAN_RSS_MB     이보다 메모리를 많이 쓰는 고아 프로세스는 나이와 관계없이 정리 (기본 1024)
+# 정리 대상은 이 프로세스가 띄운 것(조상이 이 pid)과 부모 프로세스가 죽어서 init(pid 1)에 입양된 것뿐
+# gunicorn 워커마다 리퍼가 돌아도 다른 워커의 브라우저나 같은 사용자의 다른 헤드리스 크롬은 건드리지 않음
+REAPER_INTERVAL = float(os.environ.get("BROWSER_REAPER_INTERVAL", "60"))
+ORPHAN_AGE = float(os.environ.get("BROWSER_ORPHAN_AGE", "300"))
+ORPHAN_RSS_KB = int(float(os.environ.get("BROWSER_ORPHAN_RSS_MB", "1024")) * 1024)
+PROCESS_NAMES = ("chromedriver", "chrome", "chromium", "headless_shell")
+
+logger = get_logger("browser")
+reaped = metrics.counter(
+    "browser_reaped_total",
+    "Orphaned chromedriver / Chrome processes killed by the reaper",
+    ("reason",),
+)
+active_sessions = metrics.gauge("browser_sessions_active", "Browser sessions currently open")
+
+_active = set()  # 사용 중인 드라이버의 chromedriver pid
+_active_lock = threading.Lock()
+_reaper = None
+
+
+def _service_pid(driver):
+    process = getattr(getattr(driver, "service", None), "process", None)
+    return getattr(process, "pid", None)
+
+
+@contextmanager
+def driver_session(driver, source):
+    # with 블록이 어떻게 끝나든 드라이버를 종료, 사용 중인 동안은 리퍼 대상에서 제외
+    pid = _service_pid(driver)
+    with _active_lock:
+        _active.add(pid)
+    active_sessions.inc()
+    try:
+        yield driver
+    finally:
+        try:
+            with timed(source, "quit"):
+                quit_driver(driver)
+        finally:
+            with _active_lock:
+                _active.discard(pid)
+            active_sessions.dec()
+
+
+def quit_driver(driver):
+    try:
+        driver.quit()
+    except Exception as e:
+        # quit 이 실패하면 chromedriver 와 그 아래 크롬을 직접 종료
+        pid = _service_pid(driver)
+        logger.warning("driver quit failed", extra={"pid": pid, "error": str(e)})
+        if isinstance(pid, int):
+            for child in process_tree(pid):
+                _kill(child)
+
+
+def _read_proc(pid, uptime):
+    # (이름, 명령줄, 부모 pid, 시작 후 경과 초, RSS KB, uid), 읽을 수 없으면 None
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            stat = f.read()
+        with open(f"/proc/{pid}/cmdline", "rb") as f:
+            cmdline = f.read().replace(b"\0", b" ").decode("utf-8", "replace").strip()
+        status = {}
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                key, _, value = line.partition(":")
+                status[key] = value.split()
+    except OSError:
+        return None
+    name = stat[stat.index("(") + 1:stat.rindex(")")]
+    fields = stat[stat.rindex(")") + 2:].split()
+    ppid = int(fields[1])
+    age = uptime - int(fields[19]) / os.sysconf("SC_CLK_TCK")
+    rss = int(status.get("VmRSS", ["0"])[0])
+    uid = int(status.get("Uid", ["-1"])[0])
+    return name, cmdline, ppid, age, rss, uid
+
+
+def _list_processes():
+    processes = {}
+    try:
+        with open("/proc/uptime") as f:
+            uptime = float(f.read().split()[0])
+    except OSError:
+        # /proc 가 없는 환경 (리눅스 외)
+        return processes
+    for entry in os.listdir("/proc"):
+        if entry.isdigit():
+            info = _read_proc(int(entry), uptime)
+            if info is not None:
+                processes[int(entry)] = info
+    return processes
+
+
+def process_tree(pid, processes=None):
+    # pid 와 그 자손 pid (자식부터 종료할 수 있도록 자손이 앞에 옴)
+    processes = processes if processes is not None else _list_processes()
+    children = {}
+    for child, info in processes.items():
+        children.setdefault(info[2], []).append(child)
+    tree = []
+    stack = [pid]
+    while stack:
+        current = stack.pop()
+        tree.append(current)
+        stack.extend(children.get(current, []))
+    return tree[::-1]
+
+
+def _is_browser(name, cmdline):
+    if name.startswith("chromedriver"):
+        return True
+    return any(name.startswith(n) for n in PROCESS_NAMES) and "--headless" in cmdline
+
+
+def _kill(pid):
+    try:
+        os.kill(pid, signal.SIGKILL)
+        return True
+    except OSError:
+        return False
+
+
+def _owner(pid, processes):
+    # 브라우저 프로세스 트리(chromedriver -> chrome -> ...) 위에서 처음 만나는 브라우저가 아닌 조상 pid
+    # 프로세스 목록에 없는 조상(이미 죽었거나 다른 네임스페이스)까지 올라가면 그 pid
+    seen = set()
+    while pid in processes and pid not in seen:
+        seen.add(pid)
+        name, _, ppid = processes[pid][:3]
+        if not name.startswith(PROCESS_NAMES):
+            return pid
+        pid = ppid
+    return pid
+
+
+def _reapable(pid, processes):
+    # 이 프로세스가 띄웠거나 init 에 입양된(띄운 프로세스가 죽은) 브라우저만 정리
+    owner = _owner(pid, processes)
+    return owner in (0, 1, os.getpid()) or owner not in processes
+
+
+def find_orphans(max_age=None, max_rss_kb=None, processes=None):
+    # 사용 중인 세션에 속하지 않은 chromedriver / 헤드리스 크롬 중 나이나 메모리 기준을 넘은 것
+    max_age = ORPHAN_AGE if max_age is None else max_age
+    max_rss_kb = ORPHAN_RSS_KB if max_rss_kb is None else max_rss_kb
+    processes = processes if processes is not None else _list_processes()
+    with _active_lock:
+        active = [pid for pid in _active if isinstance(pid, int)]
+    protected = {pid for root in active for pid in process_tree(root, processes)}
+    uid = os.getuid()
+
+    orphans = []
+    for pid, (name, cmdline, _, age, rss, owner) in processes.items():
+        if pid in protected or owner != uid or not _is_browser(name, cmdline):
+            continue
+        if not _reapable(pid, processes):
+            # 살아 있는 다른 프로세스(다른 워커 등)가 띄운 브라우저
+            continue
+        if rss > max_rss_kb:
+            orphans.append({"pid": pid, "name": name, "age": age, "rss_kb": rss, "reason": "memory"})
+        elif age > max_age:
+            orphans.append({"pid": pid, "name": name, "age": age, "rss_kb": rss, "reason": "age"})
+    return orphans
+
+
+def reap_orphans(max_age=None, max_rss_kb=None):
+    # 고아 프로세스를 종료하고 정리한 목록을 돌려줌
+    reclaimed = []
+    for orphan in find_orphans(max_age, max_rss_kb):
+        if _kill(orphan["pid"]):
+            reaped.inc(reason=orphan["reason"])
+            logger.warning("reaped orphan browser", extra={
+                "pid": orphan["pid"], "binary": orphan["name"], "age": round(orphan["age"]),
+                "rss_kb": orphan["rss_kb"], "reason": orphan["reason"],
+            })
+            reclaimed.append(orphan)
+    if reclaimed:
+        logger.info("reaper finished", extra={
+            "reclaimed": len(reclaimed),
+            "rss_kb": sum(o["rss_kb"] for o in reclaimed),
+        })
+    return reclaimed
+
+
+def start_reaper(interval=None):
+    # 백그라운드 스레드에서 interval 초마다 reap_orphans 실행
+    global _reaper
+    interval = REAPER_INTERVAL if interval is None else interval
+    if interval <= 0 or (_reaper is not None and _reaper.is_alive()):
+        return _reaper
+    stop = threading.Event()
+
+    def loop():
+        while not stop.wait(interval):
+            try:
+                browser_pool.prune()
+                reap_orphans()
+            except Exception:
+                logger.exception("reaper failed")
+
+    _reaper = threading.Thread(target=loop, name="browser-reaper", daemon=True)
+    _reaper.stop = stop
+    _reaper.start()
+    return _reaper
+
+
+def stop_reaper():
+    global _reaper
+    if _reaper is not None:
+        _reaper.stop.set()
+        _reaper = None
+
+
+# --- 동시 실행 제한 (governor) ----------------------------------------------------
+# 헤드리스 크롬 하나가 수백 MB 를 쓰므로 슬롯 수와 메모리 예산 안에서만 브라우저를 띄움
+# 자리가 없으면 QUEUE_TIMEOUT 동안 기다리고, 그래도 없으면 BrowserBusy (호출한 쪽에서 부하 차단)
+#   BROWSER_SLOTS           동시에 띄울 수 있는 브라우저 수 (기본 2)
+#   BROWSER_MEMORY_MB       브라우저 전체 메모리 예산 (기본 1024)
+#   BROWSER_SESSION_MB      브라우저 하나의 예상 메모리, 실제 사용량이 더 작으면 이 값으로 계산 (기본 300)
+#   BROWSER_QUEUE_TIMEOUT   자리를 기다리는 최대 시간 초 (기본 30)
+# 실제 메모리는 /proc 을 훑어서 재므로 락 밖에서 재고, MEMORY_CHECK_INTERVAL 초 동안은 잰 값을 다시 씀
+MEMORY_CHECK_INTERVAL = 1.0
+SLOTS = int(os.environ.get("BROWSER_SLOTS", "2"))
+MEMORY_BUDGET_KB = int(float(os.environ.get("BROWSER_MEMORY_MB", "1024")) * 1024)
+SESSION_KB = int(float(os.environ.get("BROWSER_SESSION_MB", "300")) * 1024)
+QUEUE_TIMEOUT = float(os.environ.get("BROWSER_QUEUE_TIMEOUT", "30"))
+
+slots_in_use = metrics.gauge("browser_slots_in_use", "Browser slots currently admitted")
+slots_limit = metrics.gauge("browser_slots_limit", "Configured browser slot limit")
+queue_depth = metrics.gauge("browser_queue_depth", "Scrapes waiting for a browser slot")
+queue_wait = metrics.histogram("browser_queue_wait_seconds", "Time spent waiting for a browser slot")
+memory_in_use = metrics.gauge("browser_memory_kb", "Memory charged against the browser budget")
+shed = metrics.counter(
+    "browser_shed_total",
+    "Browser scrapes refused by the governor, by how the request was served instead",
+    ("source", "fallback"),
+)
+
+
+class BrowserBusy(Exception):
+    pass
+
+
+class Governor:
+
+    def __init__(self, slots=SLOTS, memory_budget_kb=MEMORY_BUDGET_KB, session_kb=SESSION_KB,
+                 queue_timeout=QUEUE_TIMEOUT, check_interval=MEMORY_CHECK_INTERVAL):
+        self.slots = slots
+        self.memory_budget_kb = memory_budget_kb
+        self.session_kb = session_kb
+        self.queue_timeout = queue_timeout
+        self.check_interval = check_interval
+        self.in_use = 0
+        self.waiting = 0
+        self._cond = threading.Condition()
+        self._measured = None  # (잰 시각, KB)
+        self._measure_lock = threading.Lock()
+        slots_limit.set(slots)
+
+    def measured_kb(self):
+        # 실행 중인 브라우저 프로세스 트리의 RSS 합계, check_interval 초 안에 다시 부르면 잰 값을 그대로 씀
+        now = time.monotonic()
+        with self._measure_lock:
+            if self._measured is not None and now - self._measured[0] < self.check_interval:
+                return self._measured[1]
+        with _active_lock:
+            active = [pid for pid in _active if isinstance(pid, int)]
+        measured = 0
+        if active:
+            processes = _list_processes()
+            measured = sum(processes[pid][4] for root in active for pid in process_tree(root, processes)
+                           if pid in processes)
+        with self._measure_lock:
+            self._measured = (now, measured)
+        return measured
+
+    def memory_kb(self):
+        # 실행 중인 브라우저가 실제로 쓰는 메모리, 막 띄운 브라우저는 예상치로 계산
+        return max(self.measured_kb(), self.in_use * self.session_kb)
+
+    def _fits(self, used):
+        # self._cond 를 잡고 부름, used 는 락 밖에서 잰 메모리
+        if self.in_use >= self.slots:
+            return False
+        used = max(used, self.in_use * self.session_kb)
+        memory_in_use.set(used)
+        return used + self.session_kb <= self.memory_budget_kb
+
+    def acquire(self, timeout=None):
+        timeout = self.queue_timeout if timeout is None else timeout
+        start = time.monotonic()
+        deadline = start + timeout
+        with self._cond:
+            self.waiting += 1
+            queue_depth.set(self.waiting)
+        try:
+            while True:
+                # /proc 읽기는 락 밖에서 (슬롯이 다 찼으면 잴 필요 없음), 슬롯 수는 락 안에서 다시 확인
+                used = self.memory_kb() if self.in_use < self.slots else 0
+                with self._cond:
+                    if self._fits(used):
+                        self.in_use += 1
+                        slots_in_use.set(self.in_use)
+                        return
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise BrowserBusy(f"no browser slot within {timeout:g}s "
+                                          f"({self.in_use}/{self.slots} slots in use)")
+                    # 메모리는 알림 없이 줄어들 수 있으므로 주기적으로 다시 확인
+                    self._cond.wait(min(remaining, 0.5))
+        finally:
+            with self._cond:
+                self.waiting -= 1
+                queue_depth.set(self.waiting)
+            queue_wait.observe(time.monotonic() - start)
+
+    def release(self):
+        # 브라우저가 끝났으므로 다음 확인 때는 다시 잼
+        with self._measure_lock:
+            self._measured = None
+        with self._cond:
+            self.in_use -= 1
+            slots_in_use.set(self.in_use)
+            self._cond.notify()
+
+    @contextmanager
+    def slot(self, timeout=None):
+        self.acquire(timeout)
+        try:
+            yield
+        finally:
+            self.release()
+
+
+governor = Governor()
+
+
+# --- 미리 띄워 둔 브라우저 ----------------------------------------------------------
+# 워밍업(warmup.py)이 띄워 둔 브라우저를 첫 검색들이 바로 가져다 씀
+# 세션 상태(쿠키 등)가 섞이지 않도록 한 번 쓰면 종료하고 다시 채우지 않음
+# 꺼낼 때 chromedriver 가 살아 있는지 확인하고, 죽었거나 오래 대기한 브라우저는 종료하고 건너뜀
+#   BROWSER_POOL_MAX_IDLE   미리 띄운 브라우저를 쓰지 않고 둘 최대 초 (기본 600), 리퍼가 돌 때도 정리
+POOL_MAX_IDLE = float(os.environ.get("BROWSER_POOL_MAX_IDLE", "600"))
+
+pooled = metrics.gauge("browser_pool_idle", "Pre-spawned browsers waiting to be used")
+discarded = metrics.counter(
+    "browser_pool_discarded_total",
+    "Pre-spawned browsers quit without being used, by reason (dead or idle)",
+    ("reason",),
+)
+
+
+def _alive(driver):
+    process = getattr(getattr(driver, "service", None), "process", None)
+    return process is not None and process.poll() is None
+
+
+class BrowserPool:
+
+    def __init__(self, max_idle=POOL_MAX_IDLE, clock=time.monotonic):
+        self.max_idle = max_idle
+        self.clock = clock
+        self._drivers = []  # (넣은 시각, 드라이버)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._drivers)
+
+    def put(self, driver):
+        # 대기 중인 브라우저도 리퍼가 고아로 보지 않도록 사용 중으로 등록
+        with _active_lock:
+            _active.add(_service_pid(driver))
+        with self._lock:
+            self._drivers.append((self.clock(), driver))
+            pooled.set(len(self._drivers))
+
+    def _pop(self):
+        with self._lock:
+            if not self._drivers:
+                return None, None
+            added, driver = self._drivers.pop()
+            pooled.set(len(self._drivers))
+        # driver_session 이 다시 등록함
+        with _active_lock:
+            _active.discard(_service_pid(driver))
+        return added, driver
+
+    def _discard(self, driver, reason):
+        discarded.inc(reason=reason)
+        logger.warning("pooled browser discarded", extra={"pid": _service_pid(driver), "reason": reason})
+        quit_driver(driver)
+
+    def take(self):
+        # 바로 쓸 수 있는 브라우저, 없으면 None (호출한 쪽에서 새로 띄움)
+        while True:
+            added, driver = self._pop()
+            if driver is None:
+                return None
+            if self.clock() - added > self.max_idle:
+                self._discard(driver, "idle")
+            elif not _alive(driver):
+                self._discard(driver, "dead")
+            else:
+                return driver
+
+    def prune(self):
+        # 오래 대기한 브라우저를 종료, 종료한 수를 반환
+        now = self.clock()
+        with self._lock:
+            expired = [driver for added, driver in self._drivers if now - added > self.max_idle]
+            self._drivers = [(added, driver) for added, driver in self._drivers if now - added <= self.max_idle]
+            pooled.set(len(self._drivers))
+        for driver in expired:
+            with _active_lock:
+                _active.discard(_service_pid(driver))
+            self._discard(driver, "idle")
+        return len(expired)
+
+    def close(self):
+        while True:
+            _, driver = self._pop()
+            if driver is None:
+                return
+            quit_driver(driver)
+
+
+browser_pool = BrowserPool()
+# 쓰지 않고 남은 브라우저는 프로세스 종료 때 정리
+atexit.register(browser_pool.close)
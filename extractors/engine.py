@@ -0,0 +1,139 @@
+import metrics
+from links import link_index
+from log import get_logger
+
+# 사이트별 선택자 명세(Spec)로 공고를 뽑는 공통 추출 엔진
+#
+#   SPEC = Spec("berlin", row="li.bjs-jlid", fields={
+#       "title": Field("h4"),                    # 텍스트 (앞뒤 공백 제거)
+#       "company": Field("a.bjs-jlid__b"),
+#       "link": Field("a", attr="href", link=True),  # 속성값, link=True 면 base 기준 표준 링크로 (links.py)
+#   })
+#   jobs = extract(SPEC, parse(html), base=url)
+#
+# 선택자는 처음 쓸 때 한 번만 컴파일(soupsieve)하고, 문서는 행 선택 한 번 + 행마다 필드 선택으로 한 번에 읽음
+# 필수 필드가 없거나 값 정리에 실패한 행은 건너뛰고 scrape_rows_skipped_total 에 셈 (한 행 때문에 페이지 / 검색 전체가 실패하지 않음)
+# strict=True 면 건너뛰지 않고 MissingField 를 그대로 냄 (픽스처 확인용)
+# bs4 / soupsieve 는 import 가 무거우므로 처음 파싱 / 컴파일할 때 불러옴
+
+logger = get_logger("engine")
+
+skipped = metrics.counter(
+    "scrape_rows_skipped_total",
+    "Listing rows skipped because a required field could not be extracted",
+    ("source", "field", "selector"),
+)
+
+
+class MissingField(AttributeError):
+    # 행에 필드가 없음 (기존 .find(...).text 가 내던 AttributeError 와 호환)
+
+    def __init__(self, source, field, selector):
+        super().__init__(f"{source}: {field} ({selector!r}) not found")
+        self.source = source
+        self.field = field
+        self.selector = selector
+
+
+class Field:
+
+    def __init__(self, selector, attr=None, normalize=None, required=True, link=False, many=False):
+        self.selector = selector
+        self.attr = attr
+        self.link = link
+        # many=True 면 맞는 요소 전체의 값 리스트 (빈 값 제외, 하나도 없으면 None)
+        self.many = many
+        # 값 정리 함수, 기본은 텍스트만 앞뒤 공백 제거
+        self.normalize = normalize if normalize is not None else (None if attr else str.strip)
+        self.required = required
+        self.compiled = None
+
+    def read(self, row, base=None):
+        if self.many:
+            values = [self._value(element, base) for element in self.compiled.select(row)]
+            return [value for value in values if value] or None
+        element = self.compiled.select_one(row)
+        if element is None:
+            return None
+        return self._value(element, base)
+
+    def _value(self, element, base):
+        if self.attr:
+            value = element.get(self.attr)
+            if isinstance(value, list):  # class 처럼 여러 값인 속성
+                value = " ".join(value)
+        else:
+            value = element.get_text()
+        if self.link and value is not None:
+            value = link_index.canonical(value, base) or None
+        if value is not None and self.normalize is not None:
+            value = self.normalize(value)
+        return value
+
+
+class Spec:
+    # row=None 이면 문서 전체를 한 행으로 읽음 (공고 상세 페이지)
+
+    def __init__(self, source, row, fields):
+        self.source = source
+        self.row = row
+        self.fields = fields
+        self._row = None
+        self._compiled = False
+
+    def compile(self):
+        if not self._compiled:
+            import soupsieve
+            for field in self.fields.values():
+                field.compiled = soupsieve.compile(field.selector)
+            self._row = soupsieve.compile(self.row) if self.row else None
+            self._compiled = True
+        return self
+
+    def rows(self, soup):
+        return self._row.select(soup) if self._row is not None else [soup]
+
+
+def squash(text):
+    # 줄바꿈 / 연속 공백을 공백 하나로
+    return " ".join(text.split())
+
+
+def parse(html):
+    from bs4 import BeautifulSoup
+    return BeautifulSoup(html, "html.parser")
+
+
+def _read_row(spec, fields, row, base):
+    job = {}
+    for name, field in fields:
+        try:
+            value = field.read(row, base)
+        except Exception as e:
+            raise MissingField(spec.source, name, field.selector) from e
+        if value is None and field.required:
+            raise MissingField(spec.source, name, field.selector)
+        job[name] = value
+    return job
+
+
+def extract(spec, soup, base=None, strict=False):
+    spec.compile()
+    fields = list(spec.fields.items())
+    results = []
+    missing = {}
+    rows = 0
+    for row in spec.rows(soup):
+        rows += 1
+        try:
+            results.append(_read_row(spec, fields, row, base))
+        except MissingField as e:
+            if strict:
+                raise
+            skipped.inc(source=spec.source, field=e.field, selector=e.selector)
+            missing[e.field] = missing.get(e.field, 0) + 1
+    if missing:
+        # 모든 행을 건너뛰었으면 사이트 마크업이 바뀌었을 가능성이 큼
+        log = logger.error if not results else logger.warning
+        log("rows skipped", extra={"source": spec.source, "rows": rows, "skipped": rows - len(results), "fields": missing})
+    return results
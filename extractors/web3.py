@@ -1,62 +1,169 @@
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
-import cloudscraper
+import os
+import json
+import logging
 import time
+from urllib.parse import urljoin
+from metrics import timed
+from log import get_logger
+from lazy import Lazy
+from links import link_index
+from extractors.engine import Field, Spec, squash
+from extractors.browser import (
+    BrowserBusy, apply_blocking, browser_pool, chrome_options, driver_session, governor, shed,
+)
 
 HEADERS = {
     "User-Agent":
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/135.0.0.0 Safari/537.36"
 }
-BASE_URL = "https://web3.career"
+# 부하 테스트 등에서 가짜 서버로 돌릴 수 있도록 환경 변수로 덮어쓰기 가능
+BASE_URL = os.environ.get("WEB3_BASE_URL", "https://web3.career")
 
-scraper = cloudscraper.create_scraper()  # returns a requests.Session object
+TIMEOUT = 15
 
 
+def create_scraper():
+    import cloudscraper
+    return cloudscraper.create_scraper()  # returns a requests.Session object
+
+
+# selenium / webdriver_manager / cloudscraper / bs4 는 import 가 무거우므로 쓰는 함수 안에서 불러옴 (lazy.py)
+scraper = Lazy(create_scraper)
+
+# 공고 상세 페이지 (enrich.py 에서 브라우저 없이 scraper 로 요청), 없는 필드는 None
+DETAIL = Spec("web3", row=None, fields={
+    "description": Field("div.job-description, div.text-dark-grey-text", normalize=squash, required=False),
+    "salary": Field("p.text-salary, .salary", required=False),
+    "tags": Field("span.my-badge a, div.job-tags a", many=True, required=False),
+})
+
+# ChromeDriverManager().install() 은 매번 버전 확인 요청을 보내므로 한 번만 확인
+_driver_path = None
+
+logger = get_logger("web3")
+
+# 공고 행(제목, 회사, 링크)을 한 번의 WebDriver 왕복으로 읽어오는 스크립트
+# 요소마다 .text / get_attribute 를 부르면 그때마다 WebDriver HTTP 요청이 나감
+# 세 요소는 zip 순서가 아니라 data-jobid 로 묶음
+JOBS_SCRIPT = """
+const rows = new Map();
+const row = (el) => {
+  const id = el.getAttribute("data-jobid");
+  if (!rows.has(id)) rows.set(id, {jobid: id, title: "", company: "", link: ""});
+  return rows.get(id);
+};
+document.querySelectorAll("h2[data-jobid]").forEach((el) => { row(el).title = el.innerText.trim(); });
+document.querySelectorAll("h3[data-jobid]").forEach((el) => { row(el).company = el.innerText.trim(); });
+document.querySelectorAll("a[data-jobid]").forEach((el) => { const r = row(el); if (!r.link) r.link = el.href; });
+return JSON.stringify(Array.from(rows.values()));
+"""
+
+
+@timed("web3", "total")
 def extract_web3_jobs(keyword):
+    # 브라우저 자리가 없으면 (extractors/browser.py 의 governor) 크롬 없이 HTTP 로 읽어서 부하를 덜어냄
+    try:
+        governor.acquire()
+    except BrowserBusy as busy:
+        return extract_web3_jobs_http(keyword, busy)
+    try:
+        rows = browse(keyword)
+    finally:
+        governor.release()
+    return to_jobs(keyword, rows)
+
+
+def driver_path():
+    global _driver_path
+    if _driver_path is None:
+        from webdriver_manager.chrome import ChromeDriverManager
+        _driver_path = ChromeDriverManager().install()
+    return _driver_path
+
+
+def new_driver():
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+    #selennium 옵션 (이미지 / 폰트 / CSS / 트래커 차단, extractors/browser.py 의 web3 프로필)
+    options = chrome_options("web3")
+    return webdriver.Chrome(service=Service(driver_path()), options=options)
+
+
+def browse(keyword):
+    # 1. 크롬 드라이버 실행 (워밍업으로 미리 띄워 둔 브라우저가 있으면 사용)
+    with timed("web3", "driver"):
+        driver = browser_pool.take() or new_driver()
+
+    # 성공 / 실패와 관계없이 블록을 나갈 때 브라우저 종료 (extractors/browser.py)
+    with driver_session(driver, "web3"):
+        apply_blocking(driver, "web3")
+
+        # 2. 웹 페이지 열기
+        with timed("web3", "navigate"):
+            driver.get(f"{BASE_URL}/{keyword}-jobs")
+
+        # 3. 자바스크립트 로딩 대기 (너무 빨리 읽으면 아무것도 안 나올 수 있음)
+        with timed("web3", "wait"):
+            time.sleep(3)
+
+        with timed("web3", "extract"):
+            # 4. 채용 공고 행을 한 번에 가져오기 (data-jobid 기준)
+            return json.loads(driver.execute_script(JOBS_SCRIPT) or "[]")
+
+
+def extract_web3_jobs_http(keyword, busy):
+    # 부하 차단용: 서버가 렌더링한 HTML 을 그대로 읽음 (자바스크립트로 채워지는 공고는 빠질 수 있음)
+    try:
+        with timed("web3", "fetch"):
+            response = scraper().get(f"{BASE_URL}/{keyword}-jobs", headers=HEADERS, timeout=TIMEOUT)
+            response.raise_for_status()
+        with timed("web3", "parse"):
+            rows = rows_from_html(response.text)
+    except Exception as e:
+        shed.inc(source="web3", fallback="failed")
+        raise busy from e
+    shed.inc(source="web3", fallback="http")
+    logger.warning("browser busy, served over http", extra={"source": "web3", "keyword": keyword, "error": str(busy)})
+    return to_jobs(keyword, rows)
+
+
+def rows_from_html(html):
+    # JOBS_SCRIPT 와 같은 모양의 행을 BeautifulSoup 으로 만듦
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(html, "html.parser")
+    rows = {}
+
+    def row(tag):
+        jobid = tag["data-jobid"]
+        return rows.setdefault(jobid, {"jobid": jobid, "title": "", "company": "", "link": ""})
+
+    for tag in soup.select("h2[data-jobid]"):
+        row(tag)["title"] = tag.get_text(" ", strip=True)
+    for tag in soup.select("h3[data-jobid]"):
+        row(tag)["company"] = tag.get_text(" ", strip=True)
+    for tag in soup.select("a[data-jobid][href]"):
+        if not row(tag)["link"]:
+            row(tag)["link"] = urljoin(BASE_URL + "/", tag["href"])
+    return list(rows.values())
+
+
+def to_jobs(keyword, rows):
     job_list = []
-    #selennium 옵션
-    options = Options()
-    options.add_argument("--headless=new")  # 👈 이 옵션이 핵심
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    # 1. 크롬 드라이버 자동 설치 및 실행
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
-
-    # 2. 웹 페이지 열기
-    driver.get(f"{BASE_URL}/{keyword}-jobs")
-
-    # 3. 자바스크립트 로딩 대기 (너무 빨리 읽으면 아무것도 안 나올 수 있음)
-    time.sleep(3)
-
-    # 4. 채용 제목 가져오기 (data-jobid를 가진 h2)
-    titles = driver.find_elements(By.CSS_SELECTOR, "h2[data-jobid]")
-    compayies = driver.find_elements(By.CSS_SELECTOR, "h3[data-jobid]")
-    links = driver.find_elements(By.CSS_SELECTOR, "a[data-jobid]")
-
-    for title, company, link in zip(titles, compayies, links):
-        title_text = title.text.strip()
-        company_text = company.text.strip()
-        link_text = link.get_attribute("href").strip() # type: ignore
+    for row in rows:
+        # 제목/회사/링크 중 하나라도 없는 행은 건너뜀
+        if not (row.get("title") and row.get("company") and row.get("link")):
+            continue
 
         # 💡 딕셔너리로 정리
         job_info = {
-            "title": title_text,
-            "company": company_text,
-            "link": link_text,
+            "title": row["title"].strip(),
+            "company": row["company"].strip(),
+            "link": link_index.canonical(row["link"], BASE_URL + "/"),
         }
         job_list.append(job_info)
-    # 5. 출력
-    for job in job_list:
-        print("제목:", job["title"])
-        print("회사:", job["company"])
-        print("링크:", job["link"])
-        print("-" * 20)
-    
-    # 6. 브라우저 종료
-    driver.quit()
+    # 5. 로그 (공고별 로그는 DEBUG, LOG_DEBUG_SAMPLE 로 샘플링)
+    if logger.isEnabledFor(logging.DEBUG):
+        for job in job_list:
+            logger.debug("job", extra={"source": "web3", "keyword": keyword, **job})
+    logger.info("scraped", extra={"source": "web3", "keyword": keyword, "jobs": len(job_list)})
     return job_list
-
-
@@ -1,46 +1,63 @@
-import re
-import requests
-import cloudscraper
-from bs4 import BeautifulSoup
+import os
+from metrics import timed
+from log import get_logger
+from lazy import Lazy
+from extractors import engine
+from extractors.engine import Field, Spec, squash
 
 HEADERS = {
     "User-Agent":
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/135.0.0.0 Safari/537.36"
 }
-BASE_URL = "https://weworkremotely.com/remote-jobs/search?term="
+# 부하 테스트 등에서 가짜 서버로 돌릴 수 있도록 환경 변수로 덮어쓰기 가능
+BASE_URL = os.environ.get("WEWORK_BASE_URL", "https://weworkremotely.com/remote-jobs/search?term=")
 
-scraper = cloudscraper.create_scraper()  # returns a requests.Session object
+TIMEOUT = 15
 
 
+def create_scraper():
+    import cloudscraper
+    return cloudscraper.create_scraper()  # returns a requests.Session object
+
+
+# 요청마다 새 연결을 맺지 않도록 keep-alive 세션(scraper)을 모듈 단위로 공유
+# cloudscraper 는 import 가 무거우므로 첫 스크래핑 때 만듦 (lazy.py)
+scraper = Lazy(create_scraper)
+
+logger = get_logger("wework")
+
+# 공고 한 줄 = li.new-listing-container (추천 공고 "feature" 포함, 문서 순서대로), 링크는 행의 첫 번째 <a> (페이지 주소 기준 표준 링크)
+SPEC = Spec("wework", row="li.new-listing-container", fields={
+    "title": Field("h4.new-listing__header__title"),
+    "company": Field("p.new-listing__company-name"),
+    "link": Field("a", attr="href", link=True),
+})
+
+# 공고 상세 페이지 (enrich.py 에서 요청할 때만 읽음), 없는 필드는 None
+DETAIL = Spec("wework", row=None, fields={
+    "description": Field("div.lis-container__job__content__description", normalize=squash, required=False),
+    "salary": Field(
+        'li.lis-container__job__sidebar__job-about__list__item:-soup-contains("Salary") span.box',
+        required=False,
+    ),
+    "tags": Field("div.lis-container__job__sidebar__job-about span.box", many=True, required=False),
+})
+
+
+@timed("wework", "total")
 def extract_wework_jobs(keyword):
     # 1. URL 설정
     url = f"{BASE_URL}{keyword}"
     # 2. 웹페이지 요청
-    response = requests.get(url, headers=HEADERS)
+    with timed("wework", "fetch"):
+        response = scraper().get(url, headers=HEADERS, timeout=TIMEOUT)
 
-    # 3. BeautifulSoup으로 HTML 파싱
-    soup = BeautifulSoup(response.text, "html.parser")
+    # 3. HTML 파싱
+    with timed("wework", "parse"):
+        soup = engine.parse(response.text)
 
     # 4. 채용 공고 가져오기
-    jobs_keyword = soup.find_all("li", class_=" new-listing-container feature")
-    jobs_keyword += soup.find_all("li", class_="new-listing-container")
-
-    # 5. 출력
-    results = []
-    upper_keyword = keyword.capitalize()
-    jobs = soup.find_all("li", class_=" new-listing-container feature")
-    jobs += soup.find_all("li", class_="new-listing-container")
-
-    for job in jobs:
-        title = job.find("h4", class_="new-listing__header__title").text.strip() #type: ignore
-        company = job.find("p", class_="new-listing__company-name").text.strip() #type: ignore
-        link = job.find("a")["href"] #type: ignore  
-
-        job_info = {
-            "title": title,
-            "company": company,
-            "link": link,
-        }
-        results.append(job_info)
+    with timed("wework", "extract"):
+        results = engine.extract(SPEC, soup, base=url)
+    logger.info("scraped", extra={"source": "wework", "keyword": keyword, "jobs": len(results)})
     return results
-
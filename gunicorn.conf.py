@@ -0,0 +1,46 @@
+# 운영 서버 설정 (gunicorn -c gunicorn.conf.py wsgi:app)
+#
+# 동시성 모델
+#   - workers  : 프로세스 수. 각 워커는 자기 스크래핑 풀(SCRAPE_WORKERS)과 헤드리스 크롬을 따로 띄우므로
+#                메모리 기준으로 잡는다. (대략 워커당 크롬 1~2개 x 수백 MB)
+#   - threads  : 워커당 요청 처리 스레드 수. 스크래핑은 대부분 네트워크 대기라 스레드로 충분
+#   - timeout  : 캐시 미스 검색은 크롬 기동 + 페이지 로딩으로 수 초 ~ 수십 초 걸릴 수 있음
+#   - 캐시     : 워커끼리 같은 결과를 공유하도록 JOBSCRAPER_CACHE 를 SQLite 파일로 지정
+#                (지정하지 않으면 아래 기본값 사용, 워커마다 dict 를 두면 같은 키워드를 워커 수만큼 스크래핑함)
+#
+# 환경 변수
+#   PORT              바인딩 포트 (Cloud Run 이 넣어줌, 기본 5000)
+#   WEB_CONCURRENCY   워커 프로세스 수 (기본 2)
+#   WEB_THREADS       워커당 스레드 수 (기본 8)
+#   WEB_TIMEOUT       요청 타임아웃 초 (기본 120)
+#   JOBSCRAPER_CACHE  캐시 백엔드 (기본 sqlite:///.cache/jobs.db)
+#   SCRAPE_WORKERS    워커당 스크래핑 풀 크기 (scheduler.py, 기본 6, 우선순위 클래스는 SCRAPE_AGING / SCRAPE_RESERVED / SCRAPE_PREFETCH_MAX)
+#   JOBSCRAPER_WARMUP 1 이면 워커마다 백그라운드 워밍업 (warmup.py, WARMUP_* 참고)
+#   ENRICH_BACKGROUND 1 이면 검색 결과의 상세 페이지를 워커마다 백그라운드로 미리 읽음 (enrich.py, ENRICH_* 참고)
+#   SEARCH_WAIT       정하면 /search 가 그 초만큼만 기다리고 202 + 작업 id 를 돌려줌 (tasks.py, /tasks/<id>)
+#   METRICS_DIR       워커별 메트릭 스냅숏 디렉토리 (기본 .cache/metrics), /metrics 는 어느 워커가 받아도 전체 워커의 합계
+#                     (비우면 요청을 받은 워커의 메트릭만 보임, metrics.py)
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+workers = int(os.environ.get("WEB_CONCURRENCY", "2"))
+worker_class = "gthread"
+threads = int(os.environ.get("WEB_THREADS", "8"))
+timeout = int(os.environ.get("WEB_TIMEOUT", "120"))
+graceful_timeout = 30
+keepalive = 5
+
+# 앱은 워커마다 fork 후에 import (스레드 풀과 SQLite 연결을 fork 전에 만들지 않도록)
+preload_app = False
+
+os.environ.setdefault("JOBSCRAPER_CACHE", "sqlite:///.cache/jobs.db")
+os.environ.setdefault("METRICS_DIR", ".cache/metrics")
+
+
+def on_starting(server):
+    # 이전 실행에서 남은 워커 스냅숏을 지워서 카운터가 새 서버 기준으로 시작하도록
+    import metrics
+    metrics.clear_snapshots(os.environ["METRICS_DIR"])
+
+accesslog = "-"
+errorlog = "-"
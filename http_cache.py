@@ -0,0 +1,110 @@
+import gzip
+from flask import current_app, request
+from store import RenderCache
+
+try:
+    import brotli
+except ImportError:  # brotli 는 선택 의존성, 없으면 gzip 만 사용
+    brotli = None
+
+# 라우트(endpoint)별 기본 Cache-Control, app.config["CACHE_CONTROL"] 로 덮어쓸 수 있음
+CACHE_CONTROL = {
+    "home": "public, max-age=3600",
+    "search": "public, max-age=300",
+    "api_search": "public, max-age=300",
+    # since 별 변경분은 버전이 같으면 그대로이므로 ETag 로 재검증
+    "api_changes": "no-cache",
+    "export": "private, max-age=300",
+    "search_batch": "no-store",
+    "task_status": "no-store",
+    "metrics_endpoint": "no-store",
+}
+COMPRESS_MIMETYPES = {"text/html", "application/json", "text/csv"}
+COMPRESS_MIN_SIZE = 500
+COMPRESS_LEVEL = 6
+
+# ETag 는 결과 버전에서 만들고, 압축된 표현은 접미사로 구분
+ENCODING_SUFFIX = {"br": "-br", "gzip": "-gz"}
+
+# 같은 ETag 의 본문은 매번 다시 압축하지 않도록 압축 결과를 보관
+# 키에 요청 경로 + 쿼리를 넣어서 ETag 가 우연히 같은 다른 요청(다른 키워드 등)의 본문을 돌려주지 않도록 함
+compressed_cache = RenderCache(max_entries=128)
+
+
+def init_app(app):
+    app.config.setdefault("CACHE_CONTROL", dict(CACHE_CONTROL))
+    app.config.setdefault("COMPRESS_MIN_SIZE", COMPRESS_MIN_SIZE)
+    app.config.setdefault("COMPRESS_LEVEL", COMPRESS_LEVEL)
+    app.after_request(after_request)
+
+
+def not_modified(etag):
+    # If-None-Match 는 약한 비교를 쓰므로 압축 여부와 관계없이 같은 버전이면 304
+    candidates = [etag] + [etag + suffix for suffix in ENCODING_SUFFIX.values()]
+    return any(request.if_none_match.contains(candidate) for candidate in candidates)
+
+
+def choose_encoding():
+    if brotli is not None and request.accept_encodings.quality("br") > 0:
+        return "br"
+    if request.accept_encodings.quality("gzip") > 0:
+        return "gzip"
+    return None
+
+
+def compress(data, encoding, level):
+    if encoding == "br":
+        return brotli.compress(data, quality=min(level, 11))
+    return gzip.compress(data, compresslevel=level)
+
+
+def after_request(response):
+    # 1. 라우트별 Cache-Control
+    cache_control = current_app.config["CACHE_CONTROL"].get(request.endpoint)
+    if cache_control and response.status_code in (200, 304) and "Cache-Control" not in response.headers:
+        response.headers["Cache-Control"] = cache_control
+
+    # 2. HTML / JSON / CSV 압축
+    if response.status_code == 304:
+        return _not_modified_variant(response)
+    if response.status_code != 200 or response.mimetype not in COMPRESS_MIMETYPES:
+        return response
+    if "Content-Encoding" in response.headers:
+        return response
+    response.vary.add("Accept-Encoding")
+    encoding = choose_encoding()
+    if encoding is None:
+        return response
+
+    response.direct_passthrough = False  # send_file 응답도 본문을 읽어서 압축
+    data = response.get_data()
+    if len(data) < current_app.config["COMPRESS_MIN_SIZE"]:
+        return response
+
+    etag, weak = response.get_etag()
+    body = None
+    if etag and not weak:
+        body = compressed_cache.get((request.full_path, encoding), etag)
+    if body is None:
+        body = compress(data, encoding, current_app.config["COMPRESS_LEVEL"])
+        if etag and not weak:
+            compressed_cache.set((request.full_path, encoding), etag, body)
+
+    response.set_data(body)
+    response.headers["Content-Encoding"] = encoding
+    if etag:
+        response.set_etag(etag + ENCODING_SUFFIX[encoding], weak=weak)
+    return response
+
+
+def _not_modified_variant(response):
+    # 304 에도 200 이 보냈을 ETag / Vary 를 그대로 붙여야 캐시가 저장해 둔 압축 표현과 맞춰 봄
+    # 200 의 압축 여부는 본문 크기에도 달렸으므로, 클라이언트가 가진 압축 표현의 ETag 와 맞을 때만 접미사를 붙임
+    response.vary.add("Accept-Encoding")
+    etag, weak = response.get_etag()
+    encoding = choose_encoding()
+    if etag and encoding is not None:
+        variant = etag + ENCODING_SUFFIX[encoding]
+        if request.if_none_match.contains(variant):
+            response.set_etag(variant, weak=weak)
+    return response
@@ -0,0 +1,166 @@
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from checkpoint import Checkpoint, DONE, FAILED, STARTED
+from log import get_logger, setup_logging
+
+# Flask 없이 여러 키워드를 한꺼번에 스크래핑해서 파일로 저장하는 명령행 도구
+#
+#   python -m jobscraper scrape --keywords-file keywords.txt --format jsonl --concurrency 4 --output jobs.jsonl
+#
+# (keyword, source, page) 단위로 병렬 실행하고, 끝난 단위의 공고는 바로 파일에 이어 씀
+# 단위별 상태는 체크포인트 로그(기본 <output>.checkpoint, checkpoint.py)에 남겨서
+# 중간에 죽어도 다시 실행하면 끝난 단위는 건너뛰고 실패 / 미완료 단위만 다시 실행
+SOURCES = ("web3", "wework", "berlin")
+FORMATS = ("jsonl", "csv")
+FIELDS = ("keyword", "source", "title", "company", "link")
+CONCURRENCY = 4
+# 추출기는 검색 결과 첫 페이지만 읽음
+PAGE = 1
+
+logger = get_logger("cli")
+
+
+def extractors():
+    # 추출기 import 는 크롬 / cloudscraper 준비가 필요하므로 실제 실행할 때만
+    from extractors.web3 import extract_web3_jobs
+    from extractors.wework import extract_wework_jobs
+    from extractors.berlin import extract_berlin_jobs
+    return {
+        "web3": extract_web3_jobs,
+        "wework": extract_wework_jobs,
+        "berlin": extract_berlin_jobs,
+    }
+
+
+def read_keywords(path):
+    # 한 줄에 키워드 하나, 빈 줄과 # 주석은 무시, 중복 제거 (순서 유지)
+    with open(path, encoding="utf-8") as f:
+        keywords = [line.strip() for line in f]
+    return list(dict.fromkeys(k for k in keywords if k and not k.startswith("#")))
+
+
+class JsonlWriter:
+
+    def __init__(self, file):
+        self.file = file
+
+    def write(self, row):
+        self.file.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+
+class CsvWriter:
+
+    def __init__(self, file):
+        self.file = file
+        self.writer = csv.DictWriter(file, fieldnames=FIELDS, extrasaction="ignore")
+        # 이어 쓰는 경우에는 헤더를 다시 쓰지 않음
+        if file.tell() == 0:
+            self.writer.writeheader()
+
+    def write(self, row):
+        self.writer.writerow(row)
+
+
+WRITERS = {"jsonl": JsonlWriter, "csv": CsvWriter}
+
+
+def run_unit(checkpoint, keyword, name, extractor):
+    checkpoint.mark(keyword, name, STARTED, PAGE)
+    return extractor(keyword)
+
+
+def scrape(keywords, sources, output, fmt="jsonl", concurrency=CONCURRENCY, checkpoint=None):
+    # sources: [(name, extractor)], 결과 요약을 dict 로 반환
+    with Checkpoint(checkpoint or f"{output}.checkpoint") as log:
+        units = [(keyword, name, extractor) for keyword in keywords for name, extractor in sources]
+        pending = [unit for unit in units if not log.is_done(unit[0], unit[1], PAGE)]
+        retried = sum(1 for keyword, name, _ in pending if log.status(keyword, name, PAGE) is not None)
+        summary = {"units": len(units), "skipped": len(units) - len(pending), "retried": retried,
+                   "done": 0, "failed": 0, "jobs": 0}
+        if not pending:
+            return summary
+
+        start = time.perf_counter()
+        with open_output(output, log.offset) as out, \
+                ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="cli") as executor:
+            writer = WRITERS[fmt](out)
+            futures = {
+                executor.submit(run_unit, log, keyword, name, extractor): (keyword, name)
+                for keyword, name, extractor in pending
+            }
+            # 출력 파일 쓰기는 이 스레드에서만 하므로 파일 잠금이 필요 없음
+            for future in as_completed(futures):
+                keyword, name = futures[future]
+                try:
+                    jobs = future.result()
+                except Exception as e:
+                    logger.warning("unit failed", extra={"keyword": keyword, "source": name, "error": str(e)})
+                    log.mark(keyword, name, FAILED, PAGE, error=str(e))
+                    summary["failed"] += 1
+                    continue
+                for job in jobs:
+                    writer.write({"keyword": keyword, "source": name, **job})
+                out.flush()
+                # 공고를 파일에 쓴 뒤에 완료 기록, 다음 실행은 이 위치 뒤를 잘라내고 이어 씀
+                log.mark(keyword, name, DONE, PAGE, jobs=len(jobs), offset=out.tell())
+                summary["done"] += 1
+                summary["jobs"] += len(jobs)
+        summary["seconds"] = round(time.perf_counter() - start, 3)
+        return summary
+
+
+def open_output(path, offset):
+    # 완료 기록이 있으면 마지막 완료 위치까지만 남기고 이어 씀 (죽기 직전에 쓰다 만 공고 제거)
+    if offset and os.path.exists(path):
+        file = open(path, "r+", newline="", encoding="utf-8")
+        file.seek(offset)
+        file.truncate()
+        return file
+    return open(path, "w", newline="", encoding="utf-8")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="jobscraper", description="Job scraper command line tools")
+    commands = parser.add_subparsers(dest="command", required=True)
+    scrape_parser = commands.add_parser("scrape", help="scrape many keywords to a file")
+    scrape_parser.add_argument("--keywords-file", required=True, help="one keyword per line")
+    scrape_parser.add_argument("--format", choices=FORMATS, default="jsonl")
+    scrape_parser.add_argument("--output", help="output path (default jobs.<format>)")
+    scrape_parser.add_argument("--concurrency", type=int, default=CONCURRENCY)
+    scrape_parser.add_argument("--sources", default=",".join(SOURCES))
+    scrape_parser.add_argument("--checkpoint", help="checkpoint path (default <output>.checkpoint)")
+    scrape_parser.add_argument("--restart", action="store_true", help="ignore the checkpoint and start over")
+    args = parser.parse_args(argv)
+
+    names = [s for s in args.sources.split(",") if s]
+    unknown = [s for s in names if s not in SOURCES]
+    if unknown:
+        parser.error(f"unknown sources: {', '.join(unknown)}")
+    if args.concurrency < 1:
+        parser.error("--concurrency must be >= 1")
+    output = args.output or f"jobs.{args.format}"
+    checkpoint = args.checkpoint or f"{output}.checkpoint"
+    if args.restart:
+        Checkpoint(checkpoint).reset()
+
+    setup_logging()
+    available = extractors()
+    summary = scrape(
+        read_keywords(args.keywords_file),
+        [(name, available[name]) for name in names],
+        output,
+        fmt=args.format,
+        concurrency=args.concurrency,
+        checkpoint=checkpoint,
+    )
+    print(json.dumps(summary), file=sys.stderr)
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,34 @@
+import threading
+
+# 무거운 객체(cloudscraper 세션 등)를 처음 쓸 때 한 번만 만드는 접근자
+# main 을 import 하는 시점(콜드 스타트)에는 만들지 않고 첫 스크래핑에서 만듦
+#
+#   scraper = Lazy(create_scraper)
+#
+#   def extract(...):
+#       scraper().get(...)          # 처음 부를 때 create_scraper() 를 한 번만 호출
+#
+# 무거운 모듈(selenium, bs4 ...)은 쓰는 함수 안에서 import (create_scraper / browser.chrome_options 처럼)
+# 테스트는 접근자가 돌려주는 객체를 patch: patch.object(berlin.scraper(), "get")
+
+
+class Lazy:
+
+    def __init__(self, factory):
+        self.factory = factory
+        self._value = None
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        if self._loaded:
+            return self._value
+        with self._lock:
+            # 다른 스레드가 먼저 만들었으면 그대로 사용 (세션을 두 번 만들지 않음)
+            if not self._loaded:
+                self._value = self.factory()
+                self._loaded = True
+            return self._value
+
+    def loaded(self):
+        return self._loaded
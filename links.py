@@ -0,0 +1,114 @@
+import os
+import sys
+import threading
+from collections import OrderedDict
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
+import metrics
+
+# 공고 링크를 하나의 표준 형태(canonical)로 맞춤
+#   "/job/python-dev?utm_source=x#apply" (base https://Berlinstartupjobs.com)
+#   -> "https://berlinstartupjobs.com/job/python-dev"
+# 추출기가 만든 링크는 중복 제거(scheduler.collect), 결과 비교(store.diff_jobs), 검색 색인, 상세 정보 캐시의 키로 쓰임
+#
+# 표준화 규칙: base 기준 절대 경로, scheme / host 소문자, 기본 포트 / fragment / 추적용 파라미터 제거
+# 나머지 쿼리 파라미터는 순서 그대로 둠 (사이트가 순서를 의미로 쓸 수 있음)
+#   LINK_INDEX_SIZE   표준화 결과를 기억해 둘 링크 수 (기본 100000)
+INDEX_SIZE = int(os.environ.get("LINK_INDEX_SIZE", "100000"))
+
+TRACKING_PREFIXES = ("utm_",)
+TRACKING_PARAMS = frozenset((
+    "gclid", "dclid", "fbclid", "msclkid", "yclid", "mc_cid", "mc_eid",
+    "_hsenc", "_hsmi", "ref", "referrer", "trk",
+))
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+duplicates = metrics.counter(
+    "jobs_duplicates_total",
+    "Jobs dropped because another job with the same canonical link came first",
+)
+
+
+def is_tracking(name):
+    name = name.lower()
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PREFIXES)
+
+
+def strip_tracking(query):
+    pairs = parse_qsl(query, keep_blank_values=True)
+    kept = [(k, v) for k, v in pairs if not is_tracking(k)]
+    # 지울 게 없으면 원래 인코딩을 그대로 유지
+    return query if len(kept) == len(pairs) else urlencode(kept)
+
+
+def canonicalize(url, base=None):
+    url = (url or "").strip()
+    if not url:
+        return url
+    if base:
+        url = urljoin(base, url)
+    parts = urlsplit(url)
+    if parts.scheme and not parts.netloc:
+        # mailto: 등
+        return url
+    if not parts.netloc:
+        # base 없이 받은 상대 경로는 그대로 (추적 파라미터만 제거)
+        return urlunsplit(("", "", parts.path, strip_tracking(parts.query), ""))
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and parts.port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    return urlunsplit((scheme, host, parts.path or "/", strip_tracking(parts.query), ""))
+
+
+class LinkIndex:
+    # 프로세스 전체에서 공유하는 (원래 링크, base) -> 표준 링크 표
+    # 같은 공고가 여러 키워드 / 여러 번의 스크래핑에 나와도 urlsplit 을 다시 하지 않고,
+    # 표준 링크 문자열은 sys.intern 으로 하나만 두어서 캐시된 결과들이 같은 객체를 공유
+
+    def __init__(self, size=INDEX_SIZE):
+        self.size = size
+        self._links = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._links)
+
+    def canonical(self, url, base=None):
+        key = (url, base)
+        with self._lock:
+            link = self._links.get(key)
+            if link is not None:
+                self._links.move_to_end(key)
+                return link
+        link = sys.intern(canonicalize(url, base))
+        with self._lock:
+            self._links[key] = link
+            if len(self._links) > self.size:
+                self._links.popitem(last=False)
+        return link
+
+    def key(self, job):
+        # 중복 제거 / 비교용 키, 링크가 없는 공고는 None
+        link = job.get("link")
+        return self.canonical(link) if link else None
+
+    def dedup(self, jobs):
+        # 표준 링크가 같은 공고는 처음 나온 것만 남김 (링크가 없는 공고는 그대로)
+        seen = set()
+        results = []
+        for job in jobs:
+            key = self.key(job)
+            if key is not None:
+                if key in seen:
+                    duplicates.inc()
+                    continue
+                seen.add(key)
+            results.append(job)
+        return results
+
+    def clear(self):
+        with self._lock:
+            self._links.clear()
+
+
+link_index = LinkIndex()
@@ -0,0 +1,125 @@
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+from benchmarks.offline import build_page
+
+# berlin / wework / web3 와 같은 모양의 페이지를 돌려주는 로컬 가짜 채용 사이트
+#
+#   /berlin/skill-areas/<keyword>/            -> berlin 페이지
+#   /wework/remote-jobs/search?term=<keyword> -> wework 페이지
+#   /web3/<keyword>-jobs                      -> web3 페이지
+#
+# 소스별로 응답 지연(latency), 에러 비율(error_rate), 페이지당 공고 수(page_size)를 설정할 수 있음
+SOURCES = ("berlin", "wework", "web3")
+
+
+class BoardConfig:
+
+    def __init__(self, latency=0.0, jitter=0.0, error_rate=0.0, page_size=20):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.page_size = page_size
+
+
+class FakeBoards:
+
+    def __init__(self, host="127.0.0.1", port=0, seed=None, **defaults):
+        self.config = {source: BoardConfig(**defaults) for source in SOURCES}
+        self.hits = {source: 0 for source in SOURCES}
+        self.errors = {source: 0 for source in SOURCES}
+        self._pages = {}
+        self._lock = threading.Lock()
+        self._random = random.Random(seed)
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def base_urls(self):
+        # 각 추출기의 BASE_URL 에 넣을 값
+        return {
+            "berlin": f"{self.url}/berlin",
+            "wework": f"{self.url}/wework/remote-jobs/search?term=",
+            "web3": f"{self.url}/web3",
+        }
+
+    def configure(self, source, **options):
+        for name, value in options.items():
+            setattr(self.config[source], name, value)
+
+    def page(self, source):
+        size = self.config[source].page_size
+        key = (source, size)
+        with self._lock:
+            if key not in self._pages:
+                self._pages[key] = build_page(source, size).encode("utf-8")
+            return self._pages[key]
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fake-boards", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _route(self, path):
+        parts = urlsplit(path)
+        if parts.path.startswith("/berlin/skill-areas/"):
+            return "berlin"
+        if parts.path.startswith("/wework/remote-jobs/search"):
+            return "wework"
+        if parts.path.startswith("/web3/") and parts.path.endswith("-jobs"):
+            return "web3"
+        return None
+
+    def _handler(self):
+        boards = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                source = boards._route(self.path)
+                if source is None:
+                    self._send(404, b"not found")
+                    return
+                config = boards.config[source]
+                with boards._lock:
+                    boards.hits[source] += 1
+                    delay = max(config.latency + boards._random.uniform(-config.jitter, config.jitter), 0)
+                    failed = boards._random.random() < config.error_rate
+                if delay:
+                    time.sleep(delay)
+                if failed:
+                    with boards._lock:
+                        boards.errors[source] += 1
+                    self._send(500, b"internal error")
+                    return
+                self._send(200, boards.page(source))
+
+            def _send(self, status, body):
+                self.send_response(status)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
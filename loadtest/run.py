@@ -0,0 +1,210 @@
+import argparse
+import json
+import math
+import random
+import resource
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from unittest.mock import patch
+import requests
+from loadtest.fake_boards import FakeBoards
+from store import JobStore
+
+# 가짜 채용 사이트를 띄우고 /search 에 부하를 주는 부하 테스트
+#
+#   python -m loadtest.run --requests 500 --concurrency 16 --keywords 50 --latency-ms 300
+#   python -m loadtest.run --target http://127.0.0.1:5000 --target-pid 1234 --boards-port 8900
+#       (--target 으로 이미 떠 있는 앱을 칠 때는 앱을 아래 환경 변수로 가짜 사이트에 연결해서 띄워야 함
+#        BERLIN_BASE_URL / WEWORK_BASE_URL / WEB3_BASE_URL, 값은 실행 시 출력됨)
+#
+# 기본은 앱을 이 프로세스 안에서 띄우고, web3 는 크롬 대신 HTTP 로 가짜 페이지를 읽음 (--browser 로 실제 크롬 사용)
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    # nearest-rank
+    index = max(math.ceil(pct / 100 * len(ordered)) - 1, 0)
+    return ordered[min(index, len(ordered) - 1)]
+
+
+def keyword_stream(count, distinct, skew, seed=None):
+    # 인기 키워드에 요청이 몰리도록 zipf 비슷한 분포로 키워드를 뽑음
+    rng = random.Random(seed)
+    keywords = [f"kw{i}" for i in range(distinct)]
+    weights = [1 / (rank + 1) ** skew for rank in range(distinct)]
+    return rng.choices(keywords, weights=weights, k=count)
+
+
+def web3_over_http(base_url):
+    # 크롬 없이 가짜 web3 페이지를 HTTP 로 읽는 대체 추출기
+    # 행 추출 / 링크 표준화는 부하 차단 때의 HTTP 경로(extractors.web3.rows_from_html, to_jobs)를 그대로 씀
+    from extractors import web3
+    session = requests.Session()
+
+    def extract(keyword):
+        response = session.get(f"{base_url}/{keyword}-jobs", timeout=30)
+        response.raise_for_status()
+        return web3.to_jobs(keyword, web3.rows_from_html(response.text))
+
+    return extract
+
+
+def start_app(boards, browser=False):
+    # 앱을 이 프로세스 안에서 띄우고 추출기를 가짜 사이트로 연결
+    from werkzeug.serving import WSGIRequestHandler, make_server
+    import main
+    import extractors.berlin
+    import extractors.wework
+    import extractors.web3
+
+    urls = boards.base_urls()
+    stack = ExitStack()
+    stack.enter_context(patch.object(extractors.berlin, "BASE_URL", urls["berlin"]))
+    stack.enter_context(patch.object(extractors.wework, "BASE_URL", urls["wework"]))
+    stack.enter_context(patch.object(extractors.web3, "BASE_URL", urls["web3"]))
+    if not browser:
+        stack.enter_context(patch.object(main, "extract_web3_jobs", web3_over_http(urls["web3"])))
+    # 실제 캐시(JOBSCRAPER_CACHE)를 비우거나 가짜 결과로 채우지 않도록 빈 메모리 저장소로 바꿔 끼움
+    stack.enter_context(patch.object(main, "db", JobStore()))
+
+    class QuietHandler(WSGIRequestHandler):
+        def log_request(self, *args, **kwargs):
+            pass
+
+    server = make_server("127.0.0.1", 0, main.app, threaded=True, request_handler=QuietHandler)
+    threading.Thread(target=server.serve_forever, name="app", daemon=True).start()
+    stack.callback(server.server_close)
+    stack.callback(server.shutdown)
+    return stack, f"http://127.0.0.1:{server.server_port}"
+
+
+def peak_rss_kb(pid=None):
+    # 리눅스 기준 ru_maxrss 는 KB, 다른 프로세스는 /proc/<pid>/status 의 VmHWM
+    if pid:
+        try:
+            with open(f"/proc/{pid}/status") as f:
+                for line in f:
+                    if line.startswith("VmHWM:"):
+                        return int(line.split()[1])
+        except OSError:
+            return None
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return own + children
+
+
+def drive(target, keywords, concurrency, timeout):
+    local = threading.local()
+
+    def one(keyword):
+        session = getattr(local, "session", None)
+        if session is None:
+            session = local.session = requests.Session()
+        start = time.perf_counter()
+        try:
+            status = session.get(f"{target}/search", params={"keyword": keyword}, timeout=timeout).status_code
+        except requests.RequestException:
+            status = None
+        return time.perf_counter() - start, status
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        samples = list(executor.map(one, keywords))
+    return samples, time.perf_counter() - start
+
+
+def run(requests_count=200, concurrency=8, distinct=20, skew=1.1, latency=0.2, jitter=0.05,
+        error_rate=0.0, page_size=20, target=None, target_pid=None, browser=False, timeout=60, seed=None,
+        boards_port=0):
+    boards = FakeBoards(port=boards_port, seed=seed, latency=latency, jitter=jitter,
+                        error_rate=error_rate, page_size=page_size)
+    with boards, ExitStack() as stack:
+        in_process = target is None
+        if in_process:
+            app, target = start_app(boards, browser)
+            stack.enter_context(app)
+        else:
+            for source, url in boards.base_urls().items():
+                print(f"{source.upper()}_BASE_URL={url}", file=sys.stderr)
+
+        keywords = keyword_stream(requests_count, distinct, skew, seed)
+        samples, elapsed = drive(target, keywords, concurrency, timeout)
+
+        latencies = [seconds for seconds, status in samples if status == 200]
+        failures = sum(1 for _, status in samples if status != 200)
+        # 캐시 미스 한 번마다 berlin 페이지를 한 번 읽으므로 berlin 요청 수 = 스크래핑 횟수
+        scrapes = boards.hits["berlin"]
+        return {
+            "requests": len(samples),
+            "concurrency": concurrency,
+            "failures": failures,
+            "throughput_rps": len(samples) / elapsed if elapsed else 0.0,
+            "p50_ms": percentile(latencies, 50) * 1000,
+            "p95_ms": percentile(latencies, 95) * 1000,
+            "p99_ms": percentile(latencies, 99) * 1000,
+            "cache_hit_rate": max(1 - scrapes / len(samples), 0.0) if samples else 0.0,
+            "upstream_hits": dict(boards.hits),
+            "upstream_errors": dict(boards.errors),
+            "peak_rss_kb": peak_rss_kb(None if in_process else target_pid),
+        }
+
+
+def format_report(report):
+    return "\n".join([
+        f"requests        {report['requests']} (failures {report['failures']}, concurrency {report['concurrency']})",
+        f"throughput      {report['throughput_rps']:.1f} req/s",
+        f"latency p50     {report['p50_ms']:.0f} ms",
+        f"latency p95     {report['p95_ms']:.0f} ms",
+        f"latency p99     {report['p99_ms']:.0f} ms",
+        f"cache hit rate  {report['cache_hit_rate']:.1%}",
+        f"upstream hits   {report['upstream_hits']} errors {report['upstream_errors']}",
+        f"peak RSS        {report['peak_rss_kb']} KB",
+    ])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load test /search against local fake job boards")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--keywords", type=int, default=20, help="number of distinct keywords")
+    parser.add_argument("--skew", type=float, default=1.1, help="zipf skew of keyword popularity")
+    parser.add_argument("--latency-ms", type=float, default=200)
+    parser.add_argument("--jitter-ms", type=float, default=50)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--target", help="base URL of an already running app")
+    parser.add_argument("--target-pid", type=int, help="pid of the target app for peak RSS")
+    parser.add_argument("--boards-port", type=int, default=0, help="fixed port for the fake job boards")
+    parser.add_argument("--browser", action="store_true", help="use real Chrome for web3")
+    parser.add_argument("--timeout", type=float, default=60)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args(argv)
+
+    report = run(
+        requests_count=args.requests,
+        concurrency=args.concurrency,
+        distinct=args.keywords,
+        skew=args.skew,
+        latency=args.latency_ms / 1000,
+        jitter=args.jitter_ms / 1000,
+        error_rate=args.error_rate,
+        page_size=args.page_size,
+        target=args.target,
+        target_pid=args.target_pid,
+        browser=args.browser,
+        timeout=args.timeout,
+        seed=args.seed,
+        boards_port=args.boards_port,
+    )
+    print(json.dumps(report, indent=2) if args.json else format_report(report))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,119 @@
+import atexit
+import copy
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import sys
+import time
+
+# 구조화(JSON) / 레벨 / 비동기(QueueHandler) 로깅 설정
+#   LOG_LEVEL          기본 INFO
+#   LOG_FORMAT         json(기본) 또는 text
+#   LOG_DEBUG_SAMPLE   DEBUG 이벤트 중 남길 비율 (0.0 ~ 1.0, 기본 1.0)
+LOGGER_NAME = "jobscraper"
+
+# LogRecord 기본 속성, 이 외의 속성(extra=...)만 JSON 필드로 내보냄
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime", "taskName"}
+
+_listener = None
+
+
+def get_logger(name=None):
+    # 소스별 로거: get_logger("web3") -> "jobscraper.web3"
+    return logging.getLogger(f"{LOGGER_NAME}.{name}" if name else LOGGER_NAME)
+
+
+class JsonFormatter(logging.Formatter):
+
+    def format(self, record):
+        payload = {
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(record.created)) + f".{int(record.msecs):03d}Z",
+            # Cloud Logging 이 레벨로 읽는 필드
+            "severity": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                payload[key] = value
+        if record.exc_info:
+            payload["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            payload["exception"] = record.exc_text
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    # 기본 QueueHandler 는 traceback 을 message 에 붙여버리므로 exc_text 로 따로 넘김
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+class SamplingFilter(logging.Filter):
+    # 양이 많은 DEBUG 이벤트는 rate 비율만 통과, 그보다 높은 레벨은 항상 통과
+
+    def __init__(self, rate, level=logging.DEBUG):
+        super().__init__()
+        self.rate = rate
+        self.level = level
+        self._random = random.Random()
+
+    def filter(self, record):
+        if record.levelno > self.level:
+            return True
+        return self._random.random() < self.rate
+
+
+def setup_logging(level=None, fmt=None, debug_sample_rate=None, stream=None):
+    # 로그 기록은 큐에 넣기만 하고, 실제 출력은 별도 스레드(QueueListener)가 담당
+    global _listener
+    level = level or os.environ.get("LOG_LEVEL", "INFO")
+    fmt = fmt or os.environ.get("LOG_FORMAT", "json")
+    if debug_sample_rate is None:
+        debug_sample_rate = float(os.environ.get("LOG_DEBUG_SAMPLE", "1.0"))
+
+    stop_logging()
+
+    output = logging.StreamHandler(stream or sys.stdout)
+    if fmt == "json":
+        output.setFormatter(JsonFormatter())
+    else:
+        output.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+
+    log_queue = queue.SimpleQueue()
+    handler = _QueueHandler(log_queue)
+    if debug_sample_rate < 1.0:
+        handler.addFilter(SamplingFilter(debug_sample_rate))
+
+    logger = get_logger()
+    for old in list(logger.handlers):
+        logger.removeHandler(old)
+    logger.addHandler(handler)
+    logger.setLevel(level)
+    logger.propagate = False
+
+    _listener = logging.handlers.QueueListener(log_queue, output, respect_handler_level=True)
+    _listener.start()
+    return logger
+
+
+def stop_logging():
+    # 큐에 남은 로그를 모두 출력하고 리스너 스레드 종료
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(stop_logging)
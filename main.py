@@ -1,11 +1,102 @@
-from flask import Flask, render_template, request, redirect, send_file
+import os
+import json
+import hashlib
+from urllib.parse import quote
+from flask import Flask, render_template, request, redirect, send_file, jsonify, make_response, Response
+import scheduler
+import metrics
+import http_cache
+import warmup
+import enrich
+import tasks
+from store import RenderCache, create_store, jobs_version, merge_changes
+from search_index import SearchIndex, queries as index_queries
+from log import get_logger, setup_logging
 from file import save_to_file
 from extractors.berlin import extract_berlin_jobs
 from extractors.wework import extract_wework_jobs
 from extractors.web3 import extract_web3_jobs
+from extractors.browser import start_reaper
 
 app = Flask("JobScrapper")
-db = {}
+http_cache.init_app(app)
+# 기본은 프로세스 내부 캐시, 멀티 워커로 띄울 때는 JOBSCRAPER_CACHE=sqlite:///... 로 공유
+db = create_store(os.environ.get("JOBSCRAPER_CACHE"))
+# 키워드/페이지별로 렌더링된 search.html, 결과 버전이 바뀌면 다시 렌더링
+render_cache = RenderCache()
+PAGE_SIZE = 50
+# db 에 모인 모든 공고의 역색인, /api/search?mode=index 에서 사용
+search_index = SearchIndex()
+logger = get_logger("app")
+
+# /api/search 에서 선택할 수 있는 필드와 페이지 크기
+# 상세 필드(enrich.FIELDS)는 enrich=1 이거나 fields 로 직접 고르면 상세 페이지를 읽어서 붙임
+FIELDS = ("title", "company", "link")
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 100
+
+# 검색을 작업(tasks.py)으로 넘길 때 기다리는 초
+#   ?wait=초 또는 ?async=1 (wait=0) 로 요청마다 정하고, SEARCH_WAIT 를 정하면 기본값이 됨
+#   둘 다 없으면 예전처럼 스크래핑이 끝날 때까지 기다림
+SEARCH_WAIT = os.environ.get("SEARCH_WAIT")
+MAX_WAIT = 30
+# /tasks/<id>?stream=1 에서 연결 유지용 주석을 보내는 간격 초
+STREAM_HEARTBEAT = 15
+
+
+def sources():
+    # 테스트에서 main.extract_* 를 patch 할 수 있도록 호출 시점에 조회
+    return [
+        ("web3", extract_web3_jobs),
+        ("wework", extract_wework_jobs),
+        ("berlin", extract_berlin_jobs),
+    ]
+
+
+def keyword_etag(keyword, *parts):
+    # 결과 버전은 공고 내용의 해시라서 결과가 같은 (예: 둘 다 0건) 키워드끼리 겹치므로 키워드 해시를 앞에 붙임
+    tag = hashlib.sha1(keyword.encode("utf-8")).hexdigest()[:8]
+    return "-".join([tag, *map(str, parts)])
+
+
+def search_wait():
+    if request.args.get("async", "").lower() in ("1", "true", "yes"):
+        return 0.0
+    wait = request.args.get("wait", type=float)
+    if wait is None and SEARCH_WAIT:
+        wait = float(SEARCH_WAIT)
+    return None if wait is None else min(max(wait, 0.0), MAX_WAIT)
+
+
+def run_search(keyword, wait):
+    # (공고, None) 또는 wait 초 안에 끝나지 않았으면 (None, 작업)
+    if wait is None:
+        return scheduler.search(keyword, sources(), db), None
+    # 캐시에 있으면 작업을 만들지 않음 (요청마다 작업 상태를 저장소에 쓰지 않도록)
+    try:
+        return db[keyword], None
+    except KeyError:
+        pass
+    task = tasks.registry.submit(keyword, sources(), db)
+    if not task.wait(wait):
+        return None, task
+    return task.result(), None
+
+
+def task_info(task):
+    data = {**task.to_dict(), "url": f"/tasks/{task.id}"}
+    if task.status == tasks.DONE:
+        data["result"] = f"/api/search?keyword={quote(task.keyword)}"
+    return data
+
+
+def task_accepted(task):
+    response = jsonify(task_info(task))
+    response.status_code = 202
+    response.headers["Location"] = f"/tasks/{task.id}"
+    response.headers["Retry-After"] = "1"
+    response.headers["Cache-Control"] = "no-store"
+    return response
 
 
 @app.route("/")
@@ -18,19 +109,220 @@ def search():
     keyword = request.args.get("keyword")
     if not keyword:
         return redirect("/")
-    if keyword in db:
-        jobs = db[keyword]
+    page = request.args.get("page", type=int)
+    if page is not None:
+        page = max(page, 1)
+    # 인기 키워드 집계 (워밍업 때 미리 읽어 둘 키워드)
+    db.hit(keyword)
+    try:
+        jobs, task = run_search(keyword, search_wait())
+    except Exception:
+        logger.exception("search failed", extra={"keyword": keyword})
+        return "Internal Server Error", 500
+    if task is not None:
+        return task_accepted(task)
+    if enrich.BACKGROUND:
+        enrich.enricher.prefetch(jobs)
+
+    # 브라우저가 같은 버전을 갖고 있으면 렌더링 없이 304
+    version = db.version(keyword)
+    etag = keyword_etag(keyword, version, page or "all")
+    if http_cache.not_modified(etag):
+        return not_modified(etag)
+
+    html = render_cache.get((keyword, page), version)
+    if html is None:
+        html = render_search(keyword, jobs, page)
+        render_cache.set((keyword, page), version, html)
+    response = make_response(html)
+    response.set_etag(etag)
+    return response
+
+
+def not_modified(etag):
+    response = make_response("", 304)
+    response.set_etag(etag)
+    return response
+
+
+def render_search(keyword, jobs, page=None):
+    if page is None:
+        return render_template("search.html", keyword=keyword, jobs=jobs, total=len(jobs))
+    pages = max((len(jobs) + PAGE_SIZE - 1) // PAGE_SIZE, 1)
+    start = (page - 1) * PAGE_SIZE
+    return render_template(
+        "search.html",
+        keyword=keyword,
+        jobs=jobs[start:start + PAGE_SIZE],
+        total=len(jobs),
+        page=page,
+        pages=pages,
+    )
+
+
+@app.route("/search/batch", methods=["GET", "POST"])
+def search_batch():
+    # GET /search/batch?keyword=a&keyword=b 또는 POST {"keywords": ["a", "b"]}
+    if request.is_json:
+        payload = request.get_json(silent=True) or {}
+        # {"keywords": [...]} 가 아닌 본문(배열 등)은 잘못된 요청
+        keywords = (payload.get("keywords") or []) if isinstance(payload, dict) else None
     else:
+        keywords = request.args.getlist("keyword")
+    if not isinstance(keywords, list):
+        return jsonify({"error": "keywords must be a list"}), 400
+    keywords = [k.strip() for k in keywords if isinstance(k, str) and k.strip()]
+    if not keywords:
+        return jsonify({"error": "keywords required"}), 400
+    try:
+        results = scheduler.search_batch(keywords, sources(), db)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    return jsonify(results)
+
+
+@app.route("/api/search")
+def api_search():
+    keyword = request.args.get("keyword")
+    if not keyword:
+        return jsonify({"error": "keyword required"}), 400
+    offset = request.args.get("offset", 0, type=int)
+    limit = request.args.get("limit", DEFAULT_LIMIT, type=int)
+    if offset < 0 or not 0 < limit <= MAX_LIMIT:
+        return jsonify({"error": f"offset must be >= 0 and limit between 1 and {MAX_LIMIT}"}), 400
+    details = request.args.get("enrich", "").lower() in ("1", "true", "yes")
+    fields = request.args.get("fields")
+    if fields:
+        fields = [f.strip() for f in fields.split(",") if f.strip()]
+        details = details or any(f in enrich.FIELDS for f in fields)
+    else:
+        fields = list(FIELDS) + (list(enrich.FIELDS) if details else [])
+    unknown = [f for f in fields if f not in FIELDS + enrich.FIELDS]
+    if unknown:
+        return jsonify({"error": f"unknown fields: {', '.join(unknown)}"}), 400
+    mode = request.args.get("mode", "live")
+    if mode not in ("live", "index"):
+        return jsonify({"error": "mode must be live or index"}), 400
+    db.hit(keyword)
+
+    jobs = None
+    if mode == "index":
+        # 이미 모은 공고에서 먼저 찾고, 없을 때만 실제 사이트를 스크래핑
+        search_index.sync(db)
+        jobs = search_index.search(keyword)
+        index_queries.inc(result="hit" if jobs else "miss")
+        # 색인 결과는 워커마다 만들어지므로 결과 내용으로 버전을 정함
+        version = f"idx{jobs_version(jobs)}"
+    if not jobs:
+        mode = "live"
         try:
-            web3 = extract_web3_jobs(keyword)
-            wwr = extract_wework_jobs(keyword)
-            berlin = extract_berlin_jobs(keyword)
-            jobs = web3 + wwr + berlin
-            db[keyword] = jobs
-        except Exception as e:
-            print(f"error: {e}")
-            return "Internal Server Error", 500 
-    return render_template("search.html", keyword=keyword, jobs=jobs)
+            jobs, task = run_search(keyword, search_wait())
+        except Exception:
+            logger.exception("search failed", extra={"keyword": keyword})
+            return jsonify({"error": "Internal Server Error"}), 500
+        if task is not None:
+            return task_accepted(task)
+        version = db.version(keyword)
+    if enrich.BACKGROUND:
+        enrich.enricher.prefetch(jobs)
+    etag = keyword_etag(keyword, version, offset, limit, ".".join(fields))
+    page = jobs[offset:offset + limit]
+    pending = None
+    if details:
+        # 요청한 페이지의 공고에만 상세 정보를 붙임, 상세 정보는 읽히는 대로 바뀌므로 붙인 결과로 ETag 를 정함
+        page, pending = enrich.enricher.enrich(page)
+        etag = f"{etag}-{jobs_version(page)}"
+    if http_cache.not_modified(etag):
+        return still_pending(not_modified(etag), pending)
+
+    # 요청한 페이지의 요청한 필드만 직렬화
+    next_offset = offset + limit if offset + limit < len(jobs) else None
+    body = {
+        "keyword": keyword,
+        "mode": mode,
+        "total": len(jobs),
+        "offset": offset,
+        "limit": limit,
+        "next_offset": next_offset,
+        "jobs": [{field: job.get(field, "") for field in fields} for job in page],
+    }
+    if details:
+        # 아직 상세 정보를 못 받은 공고 수 (다시 요청하면 캐시에서 붙음)
+        body["pending"] = pending
+    response = jsonify(body)
+    response.set_etag(etag)
+    return still_pending(response, pending)
+
+
+def still_pending(response, pending):
+    # 상세 정보를 아직 다 못 붙인 응답은 곧 바뀌므로 캐시가 재검증하게 하고 다시 요청할 시점을 알려줌
+    if pending:
+        response.headers["Cache-Control"] = "no-cache"
+        response.headers["Retry-After"] = "1"
+    return response
+
+
+@app.route("/api/changes")
+def api_changes():
+    # since 버전 이후 새로 생긴 공고(added)와 사라진 공고(removed)만 돌려줌
+    # refresh=1 이면 다시 스크래핑해서 최신 결과와 비교
+    keyword = request.args.get("keyword")
+    if not keyword:
+        return jsonify({"error": "keyword required"}), 400
+    since = request.args.get("since") or None
+    refresh = request.args.get("refresh", "").lower() in ("1", "true", "yes")
+    try:
+        if refresh:
+            scheduler.refresh(keyword, sources(), db)
+        else:
+            scheduler.search(keyword, sources(), db)
+    except Exception:
+        logger.exception("search failed", extra={"keyword": keyword})
+        return jsonify({"error": "Internal Server Error"}), 500
+    version = db.version(keyword)
+    etag = keyword_etag(keyword, version, "changes", since or "all")
+    if http_cache.not_modified(etag):
+        return not_modified(etag)
+
+    changes = db.changes(keyword, since)
+    if changes is None:
+        # 기록에 없는 (너무 오래됐거나 모르는) 버전이면 전체 목록을 added 로 내려줌
+        added, removed, full = db[keyword], [], True
+    else:
+        (added, removed), full = merge_changes(changes), False
+    response = jsonify({
+        "keyword": keyword,
+        "since": since,
+        "version": version,
+        "full": full,
+        "added": added,
+        "removed": removed,
+    })
+    response.set_etag(etag)
+    return response
+
+
+@app.route("/tasks/<task_id>")
+def task_status(task_id):
+    # ?wait=초 면 끝날 때까지 최대 그만큼 기다렸다가 응답, ?stream=1 이면 끝날 때까지 server-sent events
+    task = tasks.registry.get(task_id, db)
+    if task is None:
+        return jsonify({"error": "unknown task"}), 404
+    if request.args.get("stream", "").lower() in ("1", "true", "yes"):
+        return Response(stream_task(task), mimetype="text/event-stream")
+    wait = request.args.get("wait", 0.0, type=float)
+    if wait > 0:
+        task.wait(min(wait, MAX_WAIT))
+    return jsonify(task_info(task))
+
+
+def stream_task(task):
+    yield f"event: {task.status}\ndata: {json.dumps(task_info(task))}\n\n"
+    if task.done():
+        return
+    while not task.wait(STREAM_HEARTBEAT):
+        yield ": keep-alive\n\n"
+    yield f"event: {task.status}\ndata: {json.dumps(task_info(task))}\n\n"
 
 
 @app.route("/export")
@@ -40,10 +332,25 @@ def export():
         return redirect("/")
     if keyword not in db:
         return redirect(f"/search?keyword={keyword}")
+    # 같은 버전의 CSV 를 이미 받은 클라이언트에게는 파일을 다시 만들지 않음
+    etag = keyword_etag(keyword, db.version(keyword), "csv")
+    if http_cache.not_modified(etag):
+        return not_modified(etag)
     save_to_file(keyword, db[keyword])
-    return send_file(f"{keyword}.csv", as_attachment=True)
+    response = make_response(send_file(f"{keyword}.csv", as_attachment=True))
+    response.set_etag(etag)
+    return response
+
+
+@app.route("/metrics")
+def metrics_endpoint():
+    return Response(metrics.render(), mimetype="text/plain; version=0.0.4")
 
 
 #pytest 를 위해 수정, 이 파일이 직접 실행될 때만 실행
 if __name__ == "__main__":
+    setup_logging()
+    start_reaper()
+    # JOBSCRAPER_WARMUP=1 이면 서버가 뜬 뒤 백그라운드에서 브라우저 / 연결 / 인기 키워드 준비
+    warmup.start(db, search_index)
     app.run("0.0.0.0", port=5001, debug=True)
@@ -0,0 +1,317 @@
+import glob
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from log import get_logger
+
+# Prometheus 텍스트 포맷으로 내보내는 간단한 메트릭 모음 (/metrics)
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# 멀티 워커(gunicorn)에서는 메트릭이 워커 프로세스마다 따로 쌓이고 /metrics 는 요청을 받은 워커 것만 보여줌
+# METRICS_DIR 을 정하면 워커마다 <pid>.json 으로 스냅숏을 쓰고, /metrics 는 모든 워커의 스냅숏을 합쳐서 내보냄
+#   METRICS_DIR             워커별 스냅숏 디렉토리 (기본 없음 = 이 프로세스 것만, gunicorn.conf.py 는 .cache/metrics)
+#   METRICS_FLUSH_INTERVAL  스냅숏을 쓰는 주기 초 (기본 5), /metrics 를 받은 워커는 자기 것을 바로 씀
+# 카운터 / 히스토그램은 끝난 워커 것까지 더하고, 게이지는 살아 있는 워커 것만 더함
+METRICS_DIR = os.environ.get("METRICS_DIR", "")
+FLUSH_INTERVAL = float(os.environ.get("METRICS_FLUSH_INTERVAL", "5"))
+
+
+def _format_labels(labelnames, values, extra=()):
+    pairs = list(zip(labelnames, values)) + list(extra)
+    if not pairs:
+        return ""
+    body = ",".join(f'{name}="{_escape(value)}"' for name, value in pairs)
+    return "{" + body + "}"
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value):
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Metric:
+    kind = ""
+
+    def __init__(self, name, help, labelnames=()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels):
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            lines.extend(self._render_sample(key, value))
+        return lines
+
+    def _render_sample(self, key, value):
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"]
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+
+    def snapshot(self):
+        with self._lock:
+            values = [[list(key), list(value) if isinstance(value, list) else value]
+                      for key, value in self._values.items()]
+        return {"kind": self.kind, "help": self.help, "labelnames": list(self.labelnames), "values": values}
+
+    def merge(self, values):
+        # 다른 워커의 값을 더함
+        with self._lock:
+            for key, value in values:
+                key = tuple(key)
+                self._values[key] = self._values.get(key, 0) + value
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels):
+        return self._values.get(self._key(labels), 0)
+
+
+class Gauge(Metric):
+    kind = "gauge"
+
+    def set(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount=1, **labels):
+        self.inc(-amount, **labels)
+
+    def value(self, **labels):
+        return self._values.get(self._key(labels), 0)
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(self, name, help, labelnames=(), buckets=BUCKETS):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(buckets) + (float("inf"),)
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            sample = self._values.get(key)
+            if sample is None:
+                # [버킷별 누적 개수..., 합계, 개수]
+                sample = self._values[key] = [0] * len(self.buckets) + [0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    sample[i] += 1
+            sample[-2] += value
+            sample[-1] += 1
+
+    def count(self, **labels):
+        sample = self._values.get(self._key(labels))
+        return sample[-1] if sample else 0
+
+    def snapshot(self):
+        data = super().snapshot()
+        data["buckets"] = list(self.buckets[:-1])
+        return data
+
+    def merge(self, values):
+        with self._lock:
+            for key, sample in values:
+                key = tuple(key)
+                current = self._values.get(key)
+                if current is None:
+                    self._values[key] = list(sample)
+                elif len(current) == len(sample):
+                    self._values[key] = [a + b for a, b in zip(current, sample)]
+
+    def _render_sample(self, key, sample):
+        lines = []
+        for bound, count in zip(self.buckets, sample):
+            labels = _format_labels(self.labelnames, key, [("le", _format_value(bound))])
+            lines.append(f"{self.name}_bucket{labels} {count}")
+        labels = _format_labels(self.labelnames, key)
+        lines.append(f"{self.name}_sum{labels} {_format_value(sample[-2])}")
+        lines.append(f"{self.name}_count{labels} {sample[-1]}")
+        return lines
+
+
+class Registry:
+
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def get_or_create(self, cls, name, help, labelnames=(), **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, help, labelnames, **kwargs)
+            elif not isinstance(metric, cls):
+                raise ValueError(f"metric {name} already registered as {metric.kind}")
+            return metric
+
+    def render(self):
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def snapshot(self):
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return {metric.name: metric.snapshot() for metric in metrics}
+
+    def merge(self, snapshot, gauges=True):
+        for name, data in snapshot.items():
+            cls = KINDS.get(data["kind"])
+            if cls is None or (cls is Gauge and not gauges):
+                continue
+            options = {"buckets": data["buckets"]} if cls is Histogram else {}
+            try:
+                metric = self.get_or_create(cls, name, data["help"], data["labelnames"], **options)
+            except ValueError:
+                continue
+            metric.merge(data["values"])
+
+
+logger = get_logger("metrics")
+KINDS = {cls.kind: cls for cls in (Counter, Gauge, Histogram)}
+REGISTRY = Registry()
+
+
+def counter(name, help, labelnames=()):
+    return REGISTRY.get_or_create(Counter, name, help, labelnames)
+
+
+def gauge(name, help, labelnames=()):
+    return REGISTRY.get_or_create(Gauge, name, help, labelnames)
+
+
+def histogram(name, help, labelnames=(), buckets=BUCKETS):
+    return REGISTRY.get_or_create(Histogram, name, help, labelnames, buckets=buckets)
+
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def write_snapshot(directory=None):
+    # 이 프로세스의 메트릭을 <directory>/<pid>.json 으로 (읽는 쪽이 반쯤 쓴 파일을 보지 않도록 바꿔치기)
+    directory = directory or METRICS_DIR
+    if not directory:
+        return None
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{os.getpid()}.json")
+    tmp = f"{path}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(REGISTRY.snapshot(), f)
+    os.replace(tmp, path)
+    return path
+
+
+def clear_snapshots(directory=None):
+    # 서버를 새로 띄울 때 이전 실행의 스냅숏을 지움 (gunicorn.conf.py 의 on_starting)
+    directory = directory or METRICS_DIR
+    for path in glob.glob(os.path.join(directory, "*.json")) if directory else ():
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def render_workers(directory):
+    write_snapshot(directory)
+    merged = Registry()
+    for path in sorted(glob.glob(os.path.join(directory, "*.json"))):
+        try:
+            pid = int(os.path.basename(path)[:-len(".json")])
+            with open(path) as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError):
+            continue
+        merged.merge(snapshot, gauges=_pid_alive(pid))
+    return merged.render()
+
+
+def render():
+    if METRICS_DIR:
+        return render_workers(METRICS_DIR)
+    return REGISTRY.render()
+
+
+_flusher = None
+
+
+def start_flusher(interval=None, directory=None):
+    # METRICS_DIR 이 있으면 백그라운드 스레드에서 interval 초마다 스냅숏을 씀
+    global _flusher
+    interval = FLUSH_INTERVAL if interval is None else interval
+    directory = directory or METRICS_DIR
+    if not directory or interval <= 0 or (_flusher is not None and _flusher.is_alive()):
+        return _flusher
+
+    def loop():
+        while True:
+            time.sleep(interval)
+            try:
+                write_snapshot(directory)
+            except OSError as e:
+                logger.warning("metrics snapshot failed", extra={"directory": directory, "error": str(e)})
+
+    _flusher = threading.Thread(target=loop, name="metrics-flusher", daemon=True)
+    _flusher.start()
+    return _flusher
+
+
+# 추출기 단계별 소요 시간 (driver, navigate, wait, fetch, parse, extract, ...)
+stage_seconds = histogram(
+    "scrape_stage_seconds",
+    "Time spent in each extractor stage",
+    ("source", "stage"),
+)
+
+
+@contextmanager
+def timed(source, stage):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        stage_seconds.observe(time.perf_counter() - start, source=source, stage=stage)
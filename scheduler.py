@@ -0,0 +1,274 @@
+import heapq
+import itertools
+import os
+import threading
+import time
+from concurrent.futures import Future
+import metrics
+from log import get_logger
+from links import link_index
+
+# 키워드 x 소스 단위의 스크래핑을 하나의 공유 풀에서 실행
+MAX_WORKERS = int(os.environ.get("SCRAPE_WORKERS", "6"))
+MAX_BATCH = int(os.environ.get("SCRAPE_MAX_BATCH", "50"))
+
+# 우선순위 클래스: 사용자가 기다리는 검색(interactive) > 배치 / 다시 스크래핑(batch) > 미리 읽기(prefetch)
+#   SCRAPE_AGING         대기열에서 이 초만큼 기다릴 때마다 한 단계 높은 클래스처럼 취급 (낮은 클래스가 굶지 않도록, 기본 10)
+#   SCRAPE_RESERVED      interactive 만 쓸 수 있는 워커 수 (기본 1)
+#   SCRAPE_PREFETCH_MAX  prefetch 가 동시에 쓸 수 있는 최대 워커 수 (기본 워커 수의 절반)
+# 이미 돌고 있는 스크래핑은 멈추지 않고, 빈 워커가 생길 때 어느 작업을 먼저 꺼낼지를 정함
+INTERACTIVE = "interactive"
+BATCH = "batch"
+PREFETCH = "prefetch"
+PRIORITIES = {INTERACTIVE: 0, BATCH: 1, PREFETCH: 2}
+AGING = float(os.environ.get("SCRAPE_AGING", "10"))
+RESERVED = int(os.environ.get("SCRAPE_RESERVED", "1"))
+PREFETCH_MAX = int(os.environ.get("SCRAPE_PREFETCH_MAX", str(max(MAX_WORKERS // 2, 1))))
+
+_executor = None
+_lock = threading.Lock()
+_inflight = {}  # (keyword, source) -> Future
+
+logger = get_logger("scheduler")
+
+queue_wait = metrics.histogram(
+    "scrape_queue_wait_seconds",
+    "Time scrape jobs waited for a worker, by priority class",
+    ("priority",),
+)
+queue_depth = metrics.gauge(
+    "scrape_queue_depth",
+    "Scrape jobs waiting for a worker, by priority class",
+    ("priority",),
+)
+
+
+class _WorkItem:
+
+    def __init__(self, fn, args, priority):
+        self.future = Future()
+        self.fn = fn
+        self.args = args
+        self.priority = priority
+        self.enqueued = time.monotonic()
+        self.taken = False
+
+
+class PriorityExecutor:
+    # 우선순위 대기열을 가진 스레드 풀 (concurrent.futures.Future 를 돌려줌)
+    # 대기열 순서 키 = 클래스 순위 * aging + 넣은 시각 -> 기다린 시간만큼 순위가 올라가는 것과 같음
+
+    def __init__(self, max_workers, reserved=RESERVED, prefetch_max=PREFETCH_MAX, aging=AGING,
+                 thread_name_prefix="scrape"):
+        self.max_workers = max_workers
+        self.aging = aging
+        self.thread_name_prefix = thread_name_prefix
+        # 클래스별 동시에 쓸 수 있는 워커 수 (최소 1)
+        shared = max(max_workers - reserved, 1)
+        self.limits = {INTERACTIVE: max_workers, BATCH: shared, PREFETCH: max(min(prefetch_max, shared), 1)}
+        self._heap = []  # (키, 순번, 작업, 넣을 때의 클래스)
+        self._queued = {}  # Future -> 작업 (아직 꺼내지 않은 것)
+        self._running = {priority: 0 for priority in PRIORITIES}
+        self._threads = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._shutdown = False
+
+    def _push(self, item):
+        key = PRIORITIES[item.priority] * self.aging + item.enqueued
+        heapq.heappush(self._heap, (key, next(self._seq), item, item.priority))
+
+    def submit(self, fn, *args, priority=INTERACTIVE):
+        if priority not in PRIORITIES:
+            raise ValueError(f"unknown priority: {priority}")
+        item = _WorkItem(fn, args, priority)
+        with self._cond:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+            self._push(item)
+            self._queued[item.future] = item
+            queue_depth.inc(priority=priority)
+            if len(self._threads) < self.max_workers:
+                thread = threading.Thread(
+                    target=self._worker, name=f"{self.thread_name_prefix}_{len(self._threads)}", daemon=True,
+                )
+                self._threads.append(thread)
+                thread.start()
+            self._cond.notify()
+        return item.future
+
+    def promote(self, future, priority):
+        # 대기 중인 작업을 더 높은 클래스로 올림 (예: 미리 읽기 중인 키워드를 사용자가 검색)
+        with self._cond:
+            item = self._queued.get(future)
+            if item is None or PRIORITIES[priority] >= PRIORITIES[item.priority]:
+                return False
+            queue_depth.dec(priority=item.priority)
+            queue_depth.inc(priority=priority)
+            item.priority = priority
+            # 이전 항목은 힙에 남겨 두고 꺼낼 때 건너뜀
+            self._push(item)
+            self._cond.notify()
+            return True
+
+    def _next(self):
+        # 클래스별 워커 한도 안에서 키가 가장 작은 작업
+        skipped = []
+        found = None
+        while self._heap:
+            entry = heapq.heappop(self._heap)
+            item, priority = entry[2], entry[3]
+            if item.taken or item.priority != priority:
+                continue
+            if self._running[priority] < self.limits[priority]:
+                found = item
+                break
+            skipped.append(entry)
+        for entry in skipped:
+            heapq.heappush(self._heap, entry)
+        return found
+
+    def _worker(self):
+        while True:
+            with self._cond:
+                item = self._next()
+                while item is None:
+                    if self._shutdown and not self._queued:
+                        return
+                    self._cond.wait()
+                    item = self._next()
+                item.taken = True
+                del self._queued[item.future]
+                priority = item.priority
+                self._running[priority] += 1
+                queue_depth.dec(priority=priority)
+            queue_wait.observe(time.monotonic() - item.enqueued, priority=priority)
+            try:
+                if item.future.set_running_or_notify_cancel():
+                    try:
+                        result = item.fn(*item.args)
+                    except BaseException as e:
+                        item.future.set_exception(e)
+                    else:
+                        item.future.set_result(result)
+            finally:
+                with self._cond:
+                    self._running[priority] -= 1
+                    self._cond.notify_all()
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        with self._cond:
+            self._shutdown = True
+            if cancel_futures:
+                for future, item in list(self._queued.items()):
+                    item.taken = True
+                    queue_depth.dec(priority=item.priority)
+                    future.cancel()
+                self._queued.clear()
+            self._cond.notify_all()
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+
+def get_executor():
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = PriorityExecutor(MAX_WORKERS, thread_name_prefix="scrape")
+        return _executor
+
+
+def submit(keyword, source, extractor, priority=INTERACTIVE):
+    # 같은 (keyword, source) 작업이 이미 돌고 있으면 새로 띄우지 않고 그 결과를 공유
+    # 대기 중인 작업을 더 높은 클래스에서 요청하면 그 클래스로 올림
+    key = (keyword, source)
+    executor = get_executor()
+    with _lock:
+        future = _inflight.get(key)
+        if future is not None:
+            executor.promote(future, priority)
+            return future
+        future = executor.submit(extractor, keyword, priority=priority)
+        _inflight[key] = future
+    return future
+
+
+def promote(keyword, sources, priority):
+    # 대기 중인 (keyword, source) 작업만 priority 로 올림, 새로 띄우지는 않음
+    executor = get_executor()
+    with _lock:
+        for name, _ in sources:
+            future = _inflight.get((keyword, name))
+            if future is not None:
+                executor.promote(future, priority)
+
+
+def _forget(keyword, sources, futures):
+    # 결과를 캐시에 넣은 뒤에 지워야 그 사이에 들어온 같은 키워드 요청이 다시 스크래핑하지 않음
+    with _lock:
+        for (name, _), future in zip(sources, futures):
+            if _inflight.get((keyword, name)) is future:
+                del _inflight[(keyword, name)]
+
+
+def schedule(keyword, sources, priority=INTERACTIVE):
+    return [submit(keyword, name, extractor, priority) for name, extractor in sources]
+
+
+def collect(keyword, sources, futures, cache, timeout=None):
+    # 소스 순서(web3 → wework → berlin)대로 합쳐서 캐시에 저장, 하나라도 실패하면 예외 전파
+    # 표준 링크가 같은 공고는 먼저 나온 것만 남김
+    try:
+        jobs = []
+        for future in futures:
+            jobs += future.result(timeout=timeout)
+        jobs = link_index.dedup(jobs)
+        cache[keyword] = jobs
+        return jobs
+    finally:
+        _forget(keyword, sources, futures)
+
+
+def search(keyword, sources, cache, timeout=None, priority=INTERACTIVE):
+    if keyword in cache:
+        return cache[keyword]
+    return collect(keyword, sources, schedule(keyword, sources, priority), cache, timeout)
+
+
+def refresh(keyword, sources, cache, timeout=None, priority=BATCH):
+    # 캐시와 관계없이 다시 스크래핑해서 캐시를 갱신 (저장소가 이전 결과와의 차이를 기록)
+    # 실패하면 (브라우저 부하 차단 등) 캐시에 남아 있는 이전 결과를 돌려줌
+    try:
+        return collect(keyword, sources, schedule(keyword, sources, priority), cache, timeout)
+    except Exception as e:
+        if keyword not in cache:
+            raise
+        logger.warning("refresh failed, serving cached", extra={"keyword": keyword, "error": str(e)})
+        return cache[keyword]
+
+
+def search_batch(keywords, sources, cache, timeout=None, priority=BATCH):
+    # 1. 중복 키워드 제거 (입력 순서 유지)
+    keywords = list(dict.fromkeys(keywords))
+    if len(keywords) > MAX_BATCH:
+        raise ValueError(f"too many keywords (max {MAX_BATCH})")
+
+    # 2. 캐시에 없는 키워드의 모든 소스 작업을 먼저 한꺼번에 풀에 넣음
+    results = {}
+    pending = {}
+    for keyword in keywords:
+        if keyword in cache:
+            results[keyword] = {"jobs": cache[keyword], "cached": True}
+        else:
+            pending[keyword] = schedule(keyword, sources, priority)
+
+    # 3. 키워드별로 결과 수집
+    for keyword, futures in pending.items():
+        try:
+            jobs = collect(keyword, sources, futures, cache, timeout)
+            results[keyword] = {"jobs": jobs, "cached": False}
+        except Exception as e:
+            logger.warning("batch keyword failed", extra={"keyword": keyword, "error": str(e)})
+            results[keyword] = {"error": str(e)}
+    return {keyword: results[keyword] for keyword in keywords}
@@ -0,0 +1,120 @@
+import re
+import threading
+from collections import defaultdict
+import metrics
+from links import link_index
+
+# 캐시(db)에 모인 모든 공고의 제목 / 회사로 만든 역색인
+# 키워드별 결과 버전이 바뀐 것만 다시 색인하므로 매 검색마다 전체를 다시 만들지 않음
+# 공고는 표준 link (links.py) 로 구분하고, 여러 키워드 결과에 같은 공고가 있으면 마지막 키워드에서 빠질 때 색인에서 제거
+
+queries = metrics.counter(
+    "search_index_queries_total",
+    "Index-only searches by result (hit or miss)",
+    ("result",),
+)
+
+_TOKEN = re.compile(r"\w[\w+#]*")
+
+
+def tokenize(text):
+    # "C++ / Node.js Developer" -> ["c++", "node", "js", "developer"]
+    return _TOKEN.findall((text or "").lower())
+
+
+class SearchIndex:
+
+    def __init__(self):
+        self._postings = defaultdict(set)  # term -> links
+        self._docs = {}  # link -> (순서, job, 제목 단어)
+        self._refs = defaultdict(int)  # link -> 이 공고를 가진 키워드 수
+        self._keywords = {}  # keyword -> (version, links)
+        self._seq = 0
+        self._lock = threading.Lock()
+        # 색인이 바뀔 때마다 증가
+        self.generation = 0
+
+    def __len__(self):
+        return len(self._docs)
+
+    def _add_doc(self, link, job):
+        title_terms = set(tokenize(job.get("title")))
+        terms = title_terms | set(tokenize(job.get("company")))
+        self._seq += 1
+        self._docs[link] = (self._seq, job, title_terms)
+        for term in terms:
+            self._postings[term].add(link)
+
+    def _remove_doc(self, link):
+        _, job, _ = self._docs.pop(link)
+        for term in set(tokenize(job.get("title"))) | set(tokenize(job.get("company"))):
+            links = self._postings.get(term)
+            if links is not None:
+                links.discard(link)
+                if not links:
+                    del self._postings[term]
+
+    def update(self, keyword, jobs, version=None):
+        # keyword 의 결과를 jobs 로 교체 (이전 결과와 다른 공고만 색인에 넣고 뺌)
+        with self._lock:
+            _, old = self._keywords.get(keyword, (None, set()))
+            new = {link_index.key(job): job for job in jobs if job.get("link")}
+            for link in old - new.keys():
+                self._release(link)
+            for link, job in new.items():
+                if link not in old:
+                    self._refs[link] += 1
+                    if link not in self._docs:
+                        self._add_doc(link, job)
+                elif self._docs[link][1] != job:
+                    # 같은 공고의 제목 / 회사가 바뀐 경우
+                    self._remove_doc(link)
+                    self._add_doc(link, job)
+            self._keywords[keyword] = (version, set(new))
+            self.generation += 1
+
+    def remove(self, keyword):
+        with self._lock:
+            entry = self._keywords.pop(keyword, None)
+            if entry is None:
+                return
+            for link in entry[1]:
+                self._release(link)
+            self.generation += 1
+
+    def _release(self, link):
+        self._refs[link] -= 1
+        if self._refs[link] <= 0:
+            del self._refs[link]
+            self._remove_doc(link)
+
+    def sync(self, store):
+        # 저장소의 키워드별 버전과 비교해서 바뀐 키워드만 다시 색인 (다른 워커가 쓴 결과도 반영)
+        versions = store.versions()
+        for keyword in list(self._keywords):
+            if keyword not in versions:
+                self.remove(keyword)
+        for keyword, version in versions.items():
+            entry = self._keywords.get(keyword)
+            if entry is not None and entry[0] == version:
+                continue
+            try:
+                jobs = store[keyword]
+            except KeyError:
+                continue
+            self.update(keyword, jobs, version)
+
+    def search(self, query, limit=None):
+        # 모든 단어를 포함하는 공고 (AND), 제목에 맞는 단어가 많은 순 -> 먼저 색인된 순
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+        with self._lock:
+            postings = sorted((self._postings.get(term, set()) for term in terms), key=len)
+            links = set(postings[0]).intersection(*postings[1:])
+            ranked = sorted(
+                (self._docs[link] for link in links),
+                key=lambda doc: (-sum(term in doc[2] for term in terms), doc[0]),
+            )
+        jobs = [doc[1] for doc in ranked]
+        return jobs[:limit] if limit else jobs
@@ -0,0 +1,373 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import Counter, OrderedDict
+from collections.abc import MutableMapping
+from links import link_index
+
+# 키워드별로 보관하는 변경 기록 수, 이보다 오래된 버전에서 묻는 클라이언트는 전체 목록을 다시 받음
+MAX_CHANGES = 50
+
+# 검색 횟수(hit)는 요청마다 SQLite 에 쓰지 않고 워커 메모리에 모았다가 한 트랜잭션으로 씀
+# 다른 워커의 hottest 에는 쓴 뒤에야 보이고, 워커가 죽으면 아직 쓰지 않은 횟수는 잃음 (인기 순위용이라 허용)
+#   HIT_FLUSH_INTERVAL   모은 검색 횟수를 쓰는 주기 초 (기본 10, 다음 hit 때 확인)
+#   HIT_FLUSH_SIZE       이만큼 모이면 주기 전이라도 씀 (기본 100)
+HIT_FLUSH_INTERVAL = float(os.environ.get("HIT_FLUSH_INTERVAL", "10"))
+HIT_FLUSH_SIZE = int(os.environ.get("HIT_FLUSH_SIZE", "100"))
+
+
+def jobs_version(jobs):
+    # 결과 내용이 같으면 어느 프로세스에서 계산해도 같은 버전이 나오도록 내용 해시를 사용
+    payload = json.dumps(jobs, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha1(payload).hexdigest()[:16]
+
+
+def diff_jobs(old, new):
+    # 표준 link 기준으로 이전 결과에 없던 공고(added)와 사라진 공고(removed)
+    # (추적 파라미터만 다른 링크는 같은 공고로 봄)
+    old_links = {link_index.key(job): job for job in old or []}
+    new_links = {link_index.key(job): job for job in new}
+    added = [job for link, job in new_links.items() if link not in old_links]
+    removed = [job for link, job in old_links.items() if link not in new_links]
+    return added, removed
+
+
+def merge_changes(changes):
+    # 연속된 변경 기록을 하나로 합침 (추가됐다가 사라진 공고는 양쪽에서 빠짐)
+    added = {}
+    removed = {}
+    for change in changes:
+        for job in change["removed"]:
+            key = link_index.key(job)
+            if added.pop(key, None) is None:
+                removed[key] = job
+        for job in change["added"]:
+            key = link_index.key(job)
+            old = removed.pop(key, None)
+            if old != job:
+                added[key] = job
+    return list(added.values()), list(removed.values())
+
+
+def changes_since(log, since):
+    # since 버전 이후의 변경 기록, since 가 기록에 없으면 None (전체 목록을 다시 받아야 함)
+    if not since or (log and log[0]["previous"] == since):
+        return list(log)
+    for i, change in enumerate(log):
+        if change["version"] == since:
+            return list(log[i + 1:])
+    return None
+
+
+class JobStore(MutableMapping):
+    # keyword -> jobs 캐시. dict 처럼 쓰면서 키워드별 결과 버전을 함께 관리
+
+    def __init__(self):
+        self._jobs = {}
+        self._versions = {}
+        self._changes = {}  # keyword -> 변경 기록 (오래된 순)
+        self._hits = Counter()  # keyword -> 검색 횟수 (캐시를 비워도 유지)
+        self._tasks = {}  # 작업 id -> (만료 시각, 상태), tasks.py
+        self._lock = threading.Lock()
+
+    def __getitem__(self, keyword):
+        return self._jobs[keyword]
+
+    def __setitem__(self, keyword, jobs):
+        version = jobs_version(jobs)
+        with self._lock:
+            previous = self._versions.get(keyword)
+            if previous != version:
+                added, removed = diff_jobs(self._jobs.get(keyword), jobs)
+                log = self._changes.setdefault(keyword, [])
+                log.append({"version": version, "previous": previous, "time": time.time(),
+                            "added": added, "removed": removed})
+                del log[:-MAX_CHANGES]
+            self._jobs[keyword] = jobs
+            self._versions[keyword] = version
+
+    def __delitem__(self, keyword):
+        with self._lock:
+            del self._jobs[keyword]
+            del self._versions[keyword]
+            self._changes.pop(keyword, None)
+
+    def __iter__(self):
+        return iter(list(self._jobs))
+
+    def __len__(self):
+        return len(self._jobs)
+
+    def __contains__(self, keyword):
+        return keyword in self._jobs
+
+    def version(self, keyword):
+        return self._versions.get(keyword)
+
+    def versions(self):
+        # keyword -> version 전체 (색인 동기화용)
+        with self._lock:
+            return dict(self._versions)
+
+    def changes(self, keyword, since=None):
+        with self._lock:
+            return changes_since(self._changes.get(keyword, []), since)
+
+    def hit(self, keyword):
+        with self._lock:
+            self._hits[keyword] += 1
+
+    def hottest(self, n):
+        # 캐시에 결과가 있는 키워드 중 많이 검색된 순
+        with self._lock:
+            return [k for k, _ in self._hits.most_common() if k in self._jobs][:n]
+
+    def save_task(self, task_id, data, ttl):
+        now = time.time()
+        with self._lock:
+            for expired in [k for k, (expires, _) in self._tasks.items() if expires <= now]:
+                del self._tasks[expired]
+            self._tasks[task_id] = (now + ttl, data)
+
+    def load_task(self, task_id):
+        with self._lock:
+            entry = self._tasks.get(task_id)
+        if entry is None or entry[0] <= time.time():
+            return None
+        return entry[1]
+
+
+class SQLiteJobStore(MutableMapping):
+    # 여러 워커 프로세스가 같은 캐시를 보도록 SQLite 파일에 저장하는 JobStore
+    # 워커마다 dict 를 두면 같은 키워드를 워커 수만큼 스크래핑하게 됨
+
+    def __init__(self, path, hit_interval=HIT_FLUSH_INTERVAL, hit_batch=HIT_FLUSH_SIZE):
+        self.path = path
+        self._local = threading.local()
+        # 프로세스 안에서는 버전이 같으면 JSON 을 다시 파싱하지 않음
+        self._memo = {}
+        # 아직 쓰지 않은 검색 횟수: keyword -> (횟수, 마지막 검색 시각)
+        self.hit_interval = hit_interval
+        self.hit_batch = hit_batch
+        self._hits = {}
+        self._pending_hits = 0
+        self._hits_flushed = time.monotonic()
+        self._hits_lock = threading.Lock()
+        conn = self._conn()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            "keyword TEXT PRIMARY KEY, jobs TEXT NOT NULL, version TEXT NOT NULL, updated_at REAL NOT NULL)"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS changes ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, keyword TEXT NOT NULL, version TEXT NOT NULL, previous TEXT, "
+            "added TEXT NOT NULL, removed TEXT NOT NULL, created_at REAL NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS changes_keyword ON changes (keyword, id)")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS hits (keyword TEXT PRIMARY KEY, count INTEGER NOT NULL, last_hit REAL NOT NULL)"
+        )
+        # 작업 상태 (tasks.py), 작업을 만든 워커가 아닌 다른 워커로 온 /tasks/<id> 조회용
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS tasks (id TEXT PRIMARY KEY, data TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+
+    def _conn(self):
+        # sqlite3 연결은 스레드 간에 공유하지 않음
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def __getitem__(self, keyword):
+        version = self.version(keyword)
+        if version is None:
+            raise KeyError(keyword)
+        memo = self._memo.get(keyword)
+        if memo is not None and memo[0] == version:
+            return memo[1]
+        row = self._conn().execute("SELECT jobs, version FROM jobs WHERE keyword = ?", (keyword,)).fetchone()
+        if row is None:
+            raise KeyError(keyword)
+        jobs = json.loads(row[0])
+        self._memo[keyword] = (row[1], jobs)
+        return jobs
+
+    def __setitem__(self, keyword, jobs):
+        version = jobs_version(jobs)
+        now = time.time()
+        conn = self._conn()
+        # 이전 결과 읽기 ~ 변경 기록까지 한 트랜잭션 (다른 워커의 쓰기와 섞이지 않도록)
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute("SELECT jobs, version FROM jobs WHERE keyword = ?", (keyword,)).fetchone()
+            previous = row[1] if row else None
+            if previous != version:
+                added, removed = diff_jobs(json.loads(row[0]) if row else None, jobs)
+                conn.execute(
+                    "INSERT INTO changes (keyword, version, previous, added, removed, created_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (keyword, version, previous, json.dumps(added, ensure_ascii=False),
+                     json.dumps(removed, ensure_ascii=False), now),
+                )
+                conn.execute(
+                    "DELETE FROM changes WHERE keyword = ? AND id NOT IN "
+                    "(SELECT id FROM changes WHERE keyword = ? ORDER BY id DESC LIMIT ?)",
+                    (keyword, keyword, MAX_CHANGES),
+                )
+            conn.execute(
+                "INSERT OR REPLACE INTO jobs (keyword, jobs, version, updated_at) VALUES (?, ?, ?, ?)",
+                (keyword, json.dumps(jobs, ensure_ascii=False), version, now),
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        self._memo[keyword] = (version, jobs)
+
+    def __delitem__(self, keyword):
+        cursor = self._conn().execute("DELETE FROM jobs WHERE keyword = ?", (keyword,))
+        self._conn().execute("DELETE FROM changes WHERE keyword = ?", (keyword,))
+        self._memo.pop(keyword, None)
+        if cursor.rowcount == 0:
+            raise KeyError(keyword)
+
+    def __iter__(self):
+        rows = self._conn().execute("SELECT keyword FROM jobs ORDER BY updated_at").fetchall()
+        return iter([row[0] for row in rows])
+
+    def __len__(self):
+        return self._conn().execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def __contains__(self, keyword):
+        return self.version(keyword) is not None
+
+    def clear(self):
+        self._conn().execute("DELETE FROM jobs")
+        self._conn().execute("DELETE FROM changes")
+        self._memo.clear()
+
+    def version(self, keyword):
+        row = self._conn().execute("SELECT version FROM jobs WHERE keyword = ?", (keyword,)).fetchone()
+        return row[0] if row else None
+
+    def versions(self):
+        return dict(self._conn().execute("SELECT keyword, version FROM jobs").fetchall())
+
+    def changes(self, keyword, since=None):
+        rows = self._conn().execute(
+            "SELECT version, previous, created_at, added, removed FROM changes WHERE keyword = ? ORDER BY id",
+            (keyword,),
+        ).fetchall()
+        log = [
+            {"version": row[0], "previous": row[1], "time": row[2],
+             "added": json.loads(row[3]), "removed": json.loads(row[4])}
+            for row in rows
+        ]
+        return changes_since(log, since)
+
+    def hit(self, keyword):
+        with self._hits_lock:
+            count, _ = self._hits.get(keyword, (0, None))
+            self._hits[keyword] = (count + 1, time.time())
+            self._pending_hits += 1
+            due = (self._pending_hits >= self.hit_batch
+                   or time.monotonic() - self._hits_flushed >= self.hit_interval)
+        if due:
+            self.flush_hits()
+
+    def flush_hits(self):
+        # 모아 둔 검색 횟수를 한 트랜잭션으로 더함, 쓴 키워드 수를 반환
+        with self._hits_lock:
+            hits, self._hits = self._hits, {}
+            self._pending_hits = 0
+            self._hits_flushed = time.monotonic()
+        if not hits:
+            return 0
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany(
+                "INSERT INTO hits (keyword, count, last_hit) VALUES (?, ?, ?) "
+                "ON CONFLICT (keyword) DO UPDATE SET count = count + excluded.count, "
+                "last_hit = max(last_hit, excluded.last_hit)",
+                [(keyword, count, last_hit) for keyword, (count, last_hit) in hits.items()],
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return len(hits)
+
+    def hottest(self, n):
+        self.flush_hits()
+        rows = self._conn().execute(
+            "SELECT hits.keyword FROM hits JOIN jobs ON jobs.keyword = hits.keyword "
+            "ORDER BY hits.count DESC, hits.last_hit DESC LIMIT ?",
+            (n,),
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    def save_task(self, task_id, data, ttl):
+        now = time.time()
+        conn = self._conn()
+        conn.execute("DELETE FROM tasks WHERE expires_at <= ?", (now,))
+        conn.execute(
+            "INSERT OR REPLACE INTO tasks (id, data, expires_at) VALUES (?, ?, ?)",
+            (task_id, json.dumps(data, ensure_ascii=False), now + ttl),
+        )
+
+    def load_task(self, task_id):
+        row = self._conn().execute(
+            "SELECT data FROM tasks WHERE id = ? AND expires_at > ?", (task_id, time.time()),
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+
+def create_store(url=None):
+    # JOBSCRAPER_CACHE 설정값으로 캐시 백엔드 선택
+    #   (없음) / "memory"      -> 프로세스 내부 dict (개발 서버용)
+    #   "sqlite:///path/to.db" -> 여러 워커가 공유하는 SQLite 파일
+    if not url or url == "memory":
+        return JobStore()
+    if url.startswith("sqlite:///"):
+        path = url[len("sqlite:///"):]
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        return SQLiteJobStore(path)
+    raise ValueError(f"unsupported cache backend: {url}")
+
+
+class RenderCache:
+    # 렌더링된 HTML 을 (키워드, 페이지) 별로 보관, 결과 버전이 바뀌면 자동으로 무효화
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, version):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != version:
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key, version, html):
+        with self._lock:
+            self._entries[key] = (version, html)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,220 @@
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+import metrics
+import scheduler
+from log import get_logger
+
+# 웹 요청 스레드가 스크래핑이 끝날 때까지 붙잡혀 있지 않도록 검색을 작업(Task)으로 넘기고 id 로 조회
+#   /search?keyword=python&wait=2   2초 안에 끝나면 바로 결과, 아니면 202 + 작업 정보 (GET /tasks/<id> 로 확인)
+#   /tasks/<id>?wait=10             끝날 때까지 최대 10초 기다렸다가 상태 반환 (long polling)
+#   /tasks/<id>?stream=1            상태가 바뀌면 text/event-stream 으로 알림
+#
+# 스크래핑은 scheduler 의 공유 풀에서 돌고, 모든 소스가 끝나면 마지막 소스의 완료 콜백에서 결과를 모아 캐시에 저장
+# 결과를 기다리는 스레드를 따로 두지 않음
+# 작업 상태는 캐시 저장소(store.save_task)에도 써 두어서, 멀티 워커에서 다른 워커로 온 조회도 상태를 볼 수 있음
+# (다른 워커의 작업은 저장소를 POLL_INTERVAL 초마다 다시 읽어서 기다림)
+#   TASK_TTL   끝난 작업을 기억해 두는 초 (기본 600)
+#   TASK_MAX   기억해 두는 작업 수 (기본 1000, 넘으면 오래된 끝난 작업부터 버림)
+TTL = float(os.environ.get("TASK_TTL", "600"))
+MAX_TASKS = int(os.environ.get("TASK_MAX", "1000"))
+POLL_INTERVAL = 0.2
+
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+logger = get_logger("tasks")
+
+finished = metrics.counter(
+    "scrape_tasks_total",
+    "Finished scrape tasks by status (done or failed)",
+    ("status",),
+)
+
+
+class Task:
+
+    def __init__(self, keyword, store=None, ttl=TTL):
+        self.id = uuid.uuid4().hex
+        self.keyword = keyword
+        # save_task 가 있는 저장소(JobStore / SQLiteJobStore)면 상태를 함께 기록
+        self.store = store if hasattr(store, "save_task") else None
+        self.ttl = ttl
+        self.status = RUNNING
+        self.created = time.time()
+        self.finished = None
+        self.jobs = None
+        self.error = None
+        self._done = threading.Event()
+
+    def done(self):
+        return self._done.is_set()
+
+    def wait(self, timeout=None):
+        return self._done.wait(timeout)
+
+    def result(self):
+        # 끝난 작업의 공고, 실패한 작업이면 그 예외
+        if self.error is not None:
+            raise self.error
+        return self.jobs
+
+    def _finish(self, jobs=None, error=None):
+        self.jobs = jobs
+        self.error = error
+        self.status = FAILED if error is not None else DONE
+        self.finished = time.time()
+        finished.inc(status=self.status)
+        self._save()
+        self._done.set()
+
+    def _save(self):
+        if self.store is None:
+            return
+        try:
+            self.store.save_task(self.id, self.to_dict(), self.ttl)
+        except Exception as e:
+            logger.warning("task save failed", extra={"task": self.id, "error": str(e)})
+
+    def to_dict(self):
+        data = {
+            "id": self.id,
+            "keyword": self.keyword,
+            "status": self.status,
+            "created": self.created,
+            "finished": self.finished,
+        }
+        if self.status == DONE:
+            data["total"] = len(self.jobs)
+        elif self.status == FAILED:
+            data["error"] = str(self.error)
+        return data
+
+
+class StoredTask:
+    # 다른 워커가 만든 작업, 저장소에 기록된 상태만 알 수 있음
+
+    def __init__(self, data, store):
+        self.store = store
+        self._data = data
+        self.id = data["id"]
+        self.keyword = data["keyword"]
+
+    @property
+    def status(self):
+        return self._data["status"]
+
+    def done(self):
+        return self.status != RUNNING
+
+    def wait(self, timeout=None):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self.done():
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return False
+            time.sleep(POLL_INTERVAL if remaining is None else min(POLL_INTERVAL, remaining))
+            data = self.store.load_task(self.id)
+            if data is not None:
+                self._data = data
+        return True
+
+    def to_dict(self):
+        return dict(self._data)
+
+
+class TaskRegistry:
+
+    def __init__(self, ttl=TTL, max_tasks=MAX_TASKS):
+        self.ttl = ttl
+        self.max_tasks = max_tasks
+        self._tasks = OrderedDict()  # id -> Task
+        self._running = {}  # keyword -> Task
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._tasks)
+
+    def get(self, task_id, store=None):
+        # 이 워커의 작업, 없으면 저장소에 기록된 다른 워커의 작업
+        with self._lock:
+            task = self._tasks.get(task_id)
+        if task is not None or not hasattr(store, "load_task"):
+            return task
+        data = store.load_task(task_id)
+        return StoredTask(data, store) if data is not None else None
+
+    def submit(self, keyword, sources, cache, priority=scheduler.INTERACTIVE):
+        # 같은 키워드의 작업이 돌고 있으면 그 작업을 돌려줌, 캐시에 있으면 바로 끝난 작업
+        # 백그라운드에서 미리 읽을 때는 priority=scheduler.PREFETCH
+        with self._lock:
+            task = self._running.get(keyword)
+            if task is not None:
+                # 더 높은 클래스에서 요청하면 대기 중인 소스 작업을 올림
+                scheduler.promote(keyword, sources, priority)
+                return task
+            task = Task(keyword, cache, self.ttl)
+            self._add(task)
+            if keyword in cache:
+                task._finish(cache[keyword])
+                return task
+            self._running[keyword] = task
+        task._save()
+        try:
+            futures = scheduler.schedule(keyword, sources, priority)
+        except Exception as e:
+            self._complete(task, error=e)
+            return task
+
+        remaining = [len(futures)]
+        lock = threading.Lock()
+
+        def on_done(_):
+            with lock:
+                remaining[0] -= 1
+                if remaining[0]:
+                    return
+            finish()
+
+        def finish():
+            # 모든 소스가 끝났으므로 collect 는 기다리지 않음
+            try:
+                jobs = scheduler.collect(keyword, sources, futures, cache)
+            except Exception as e:
+                logger.warning("task failed", extra={"keyword": keyword, "task": task.id, "error": str(e)})
+                self._complete(task, error=e)
+            else:
+                self._complete(task, jobs)
+
+        if not futures:
+            finish()
+        for future in futures:
+            future.add_done_callback(on_done)
+        return task
+
+    def _complete(self, task, jobs=None, error=None):
+        with self._lock:
+            if self._running.get(task.keyword) is task:
+                del self._running[task.keyword]
+        task._finish(jobs, error)
+
+    def _add(self, task):
+        # 오래된 끝난 작업 정리 (돌고 있는 작업은 버리지 않음)
+        now = time.time()
+        for task_id, old in list(self._tasks.items()):
+            if len(self._tasks) < self.max_tasks and (old.finished is None or now - old.finished < self.ttl):
+                break
+            if old.done():
+                del self._tasks[task_id]
+        self._tasks[task.id] = task
+
+    def clear(self):
+        with self._lock:
+            self._tasks.clear()
+            self._running.clear()
+
+
+registry = TaskRegistry()
@@ -0,0 +1,72 @@
+import json
+import pytest
+import sys
+import os
+
+# 프로젝트 루트 디렉토리를 Python path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from benchmarks import importtime, run
+from benchmarks.offline import SOURCES, build_page, offline
+
+
+class TestBenchmarks:
+
+    @pytest.mark.parametrize("source", SOURCES)
+    def test_offline_extract_matches_size(self, source):
+        """저장된 페이지를 size 개로 늘려서 추출기가 모두 읽는지 테스트"""
+        page = build_page(source, 7)
+        with offline(source, page) as extract:
+            jobs = extract("python")
+
+        assert len(jobs) == 7
+        assert all(job['title'] and job['company'] and job['link'] for job in jobs)
+
+    def test_measure_reports_throughput_and_memory(self):
+        """측정 결과에 처리량 / 메모리 항목이 들어 있는지 테스트"""
+        result = run.measure("berlin", 5, repeat=1)
+
+        assert result['jobs'] == 5
+        assert result['pages_per_sec'] > 0
+        assert result['jobs_per_sec'] > 0
+        assert result['peak_kb'] > 0
+        assert result['retained_blocks'] > 0
+
+    def test_compare_detects_regression(self):
+        """기준값보다 느려지거나 메모리가 늘면 회귀로 잡는지 테스트"""
+        result = {"source": "berlin", "size": 10, "jobs_per_sec": 500.0, "peak_kb": 100.0}
+        baseline = {"berlin:10": {"jobs_per_sec": 1000.0, "peak_kb": 50.0}}
+
+        failures = run.compare([result], baseline, tolerance=0.25)
+
+        assert len(failures) == 2
+        assert run.compare([result], {"berlin:10": {"jobs_per_sec": 600.0, "peak_kb": 90.0}}, 0.25) == []
+
+    def test_main_exit_code(self, tmp_path, capsys):
+        """회귀가 있으면 exit code 1, 기준값 저장 테스트"""
+        saved = tmp_path / "baseline.json"
+        assert run.main(["--sources", "wework", "--sizes", "5", "--repeat", "1", "--save", str(saved)]) == 0
+        assert "wework:5" in json.loads(saved.read_text())
+
+        impossible = tmp_path / "impossible.json"
+        impossible.write_text(json.dumps({"wework:5": {"jobs_per_sec": 1e12, "peak_kb": 1e12}}))
+        assert run.main(["--sources", "wework", "--sizes", "5", "--repeat", "1", "--baseline", str(impossible)]) == 1
+        assert "REGRESSION" in capsys.readouterr().err
+
+    def test_parse_importtime(self):
+        """-X importtime 출력에서 모듈별 self / 누적 시간을 읽는지 테스트"""
+        stderr = (
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       120 |        120 |   json.decoder\n"
+            "import time:       300 |        420 | json\n"
+        )
+        assert importtime.parse_importtime(stderr) == {"json.decoder": (120, 120), "json": (300, 420)}
+
+    def test_main_import_is_lazy(self):
+        """main 을 import 해도 selenium / cloudscraper / bs4 등을 불러오지 않는지 테스트"""
+        result = importtime.measure(repeat=1, top=3)
+
+        assert result["import_ms"] > 0
+        assert result["heavy_loaded"] == []
+        assert importtime.compare(result, {"import_ms": result["import_ms"]}, tolerance=0.25) == []
+        assert importtime.compare(dict(result, heavy_loaded=["selenium"]), {"import_ms": 1e9}, 0.25)
@@ -3,12 +3,14 @@ import requests
 from unittest.mock import patch, MagicMock
 from bs4 import BeautifulSoup
 import sys
+from urllib.parse import urljoin
 import os
 
 # 프로젝트 루트 디렉토리를 Python path에 추가
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from extractors.berlin import extract_berlin_jobs, BASE_URL
+from extractors import berlin, engine
+from extractors.berlin import extract_berlin_jobs, BASE_URL, TIMEOUT
 
 
 class TestBerlinJobs:
@@ -67,7 +69,7 @@ class TestBerlinJobs:
         """
         return html_content
 
-    @patch('extractors.berlin.requests.get')
+    @patch.object(berlin.scraper(), 'get')
     def test_extract_berlin_jobs_success(self, mock_get, mock_html_response):
         """정상적인 경우 테스트"""
         # Mock response 설정
@@ -87,21 +89,21 @@ class TestBerlinJobs:
         first_job = result[0]
         assert first_job['title'] == 'Python Developer'
         assert first_job['company'] == 'Test Company'
-        assert first_job['link'] == '/job/python-developer'
+        assert first_job['link'] == urljoin(BASE_URL, '/job/python-developer')
         
         # 두 번째 job 검증
         second_job = result[1]
         assert second_job['title'] == 'Software Engineer'
         assert second_job['company'] == 'Another Company'
-        assert second_job['link'] == '/job/software-engineer'
+        assert second_job['link'] == urljoin(BASE_URL, '/job/software-engineer')
         
         # API 호출 검증
         expected_url = f"{BASE_URL}/skill-areas/python/"
         mock_get.assert_called_once_with(expected_url, headers={
             "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/135.0.0.0 Safari/537.36"
-        })
+        }, timeout=TIMEOUT)
 
-    @patch('extractors.berlin.requests.get')
+    @patch.object(berlin.scraper(), 'get')
     def test_extract_berlin_jobs_empty_result(self, mock_get, mock_empty_response):
         """빈 결과인 경우 테스트"""
         # Mock response 설정
@@ -117,7 +119,7 @@ class TestBerlinJobs:
         assert isinstance(result, list)
         assert len(result) == 0
 
-    @patch('extractors.berlin.requests.get')
+    @patch.object(berlin.scraper(), 'get')
     def test_extract_berlin_jobs_http_error(self, mock_get):
         """HTTP 에러 발생시 테스트"""
         # Mock response 설정 (에러 발생)
@@ -127,7 +129,7 @@ class TestBerlinJobs:
         with pytest.raises(requests.exceptions.RequestException):
             extract_berlin_jobs("python")
 
-    @patch('extractors.berlin.requests.get')
+    @patch.object(berlin.scraper(), 'get')
     def test_extract_berlin_jobs_invalid_html(self, mock_get, mock_invalid_html):
         """잘못된 HTML 구조인 경우 테스트"""
         # Mock response 설정
@@ -136,11 +138,13 @@ class TestBerlinJobs:
         mock_response.status_code = 200
         mock_get.return_value = mock_response
         
-        # 함수 실행시 AttributeError 발생 검증 (h4 태그가 없어서)
-        with pytest.raises(AttributeError):
-            extract_berlin_jobs("python")
+        skipped = engine.skipped.value(source="berlin", field="title", selector="h4")
+
+        # h4 태그가 없는 행은 건너뛰고 메트릭에 기록
+        assert extract_berlin_jobs("python") == []
+        assert engine.skipped.value(source="berlin", field="title", selector="h4") == skipped + 1
 
-    @patch('extractors.berlin.requests.get')
+    @patch.object(berlin.scraper(), 'get')
     def test_extract_berlin_jobs_different_keywords(self, mock_get, mock_html_response):
         """다른 키워드로 호출시 URL 변경 테스트"""
         # Mock response 설정
@@ -157,9 +161,9 @@ class TestBerlinJobs:
             expected_url = f"{BASE_URL}/skill-areas/{keyword}/"
             mock_get.assert_called_with(expected_url, headers={
                 "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/135.0.0.0 Safari/537.36"
-            })
+            }, timeout=TIMEOUT)
 
-    @patch('extractors.berlin.requests.get')
+    @patch.object(berlin.scraper(), 'get')
     def test_extract_berlin_jobs_return_structure(self, mock_get, mock_html_response):
         """반환값 구조 검증 테스트"""
         # Mock response 설정
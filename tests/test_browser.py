@@ -0,0 +1,280 @@
+import pytest
+import subprocess
+import sys
+import threading
+import time
+import os
+from unittest.mock import MagicMock, patch
+
+# 프로젝트 루트 디렉토리를 Python path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from extractors import browser
+from benchmarks import browser as browser_bench
+
+
+class TestBrowserProfile:
+
+    def test_lean_profile_options(self):
+        """lean 프로필은 eager 로딩 + 이미지 비활성화 옵션을 쓰는지 테스트"""
+        options = browser.chrome_options("web3", "lean")
+
+        assert options.page_load_strategy == "eager"
+        assert "--headless=new" in options.arguments
+        assert "--blink-settings=imagesEnabled=false" in options.arguments
+        assert options.experimental_options["prefs"]["profile.managed_default_content_settings.images"] == 2
+
+    def test_full_profile_options(self):
+        """full 프로필은 기본 로딩 전략을 쓰고 이미지를 막지 않는지 테스트"""
+        options = browser.chrome_options("web3", "full")
+
+        assert options.page_load_strategy == "normal"
+        assert "--blink-settings=imagesEnabled=false" not in options.arguments
+        assert "prefs" not in options.experimental_options
+
+    def test_source_profile_default(self):
+        """web3 는 lean, 설정이 없는 소스는 full 프로필을 쓰는지 테스트"""
+        with patch.dict(browser.SOURCE_PROFILES, {"web3": "lean"}):
+            assert browser.get_profile("web3") is browser.PROFILES["lean"]
+            assert browser.get_profile("unknown") is browser.PROFILES["full"]
+
+    def test_unknown_profile(self):
+        """존재하지 않는 프로필 이름이면 ValueError"""
+        with pytest.raises(ValueError):
+            browser.get_profile("web3", "nope")
+
+    def test_apply_blocking_sets_blocked_urls(self):
+        """lean 프로필은 DevTools 로 트래커 / 리소스 URL 을 차단하는지 테스트"""
+        driver = MagicMock()
+        browser.apply_blocking(driver, "web3", "lean")
+
+        driver.execute_cdp_cmd.assert_any_call("Network.enable", {})
+        method, params = driver.execute_cdp_cmd.call_args.args
+        assert method == "Network.setBlockedURLs"
+        assert "*googletagmanager.com*" in params["urls"]
+        assert "*.css" in params["urls"]
+        assert "*.woff2" in params["urls"]
+
+    def test_apply_blocking_full_profile_noop(self):
+        """full 프로필은 URL 차단을 걸지 않는지 테스트"""
+        driver = MagicMock()
+        browser.apply_blocking(driver, "web3", "full")
+
+        driver.execute_cdp_cmd.assert_not_called()
+
+
+class TestBrowserLifecycle:
+
+    def process(self, name, ppid=1, age=10.0, rss=1000, cmdline="--headless=new", uid=None):
+        """find_orphans 에 넘기는 가짜 /proc 정보"""
+        return (name, cmdline, ppid, age, rss, os.getuid() if uid is None else uid)
+
+    def test_session_quits_on_error(self):
+        """with 블록에서 예외가 나도 드라이버를 종료하는지 테스트"""
+        driver = MagicMock()
+        with pytest.raises(RuntimeError):
+            with browser.driver_session(driver, "web3"):
+                raise RuntimeError("page load failed")
+
+        driver.quit.assert_called_once()
+        assert not browser._active
+
+    def test_quit_failure_kills_process_tree(self):
+        """quit 이 실패하면 chromedriver 와 자식 프로세스를 직접 종료하는지 테스트"""
+        driver = MagicMock()
+        driver.service.process.pid = 4321
+        driver.quit.side_effect = Exception("session lost")
+
+        with patch.object(browser, "process_tree", return_value=[4322, 4321]) as tree, \
+                patch.object(browser, "_kill") as kill:
+            browser.quit_driver(driver)
+
+        tree.assert_called_once_with(4321)
+        assert [c.args[0] for c in kill.call_args_list] == [4322, 4321]
+
+    def test_find_orphans_thresholds(self):
+        """나이 / 메모리 기준을 넘은 고아 브라우저만 찾는지 테스트"""
+        processes = {
+            10: self.process("chromedriver", age=1000),
+            11: self.process("chrome", ppid=10, age=5, rss=5_000_000),
+            12: self.process("chrome", age=5),                          # 기준 이내
+            13: self.process("chrome", age=1000, cmdline="--type=renderer"),  # 헤드리스 아님 (사용자 크롬)
+            14: self.process("python3", age=1000),
+            15: self.process("chromedriver", age=1000, uid=os.getuid() + 1),
+        }
+
+        orphans = browser.find_orphans(max_age=300, max_rss_kb=1_000_000, processes=processes)
+
+        assert {o["pid"]: o["reason"] for o in orphans} == {10: "age", 11: "memory"}
+
+    def test_find_orphans_skips_active_sessions(self):
+        """사용 중인 세션의 chromedriver 와 그 자식은 건드리지 않는지 테스트"""
+        processes = {
+            20: self.process("chromedriver", age=1000),
+            21: self.process("chrome", ppid=20, age=1000),
+            30: self.process("chromedriver", age=1000),
+        }
+        driver = MagicMock()
+        driver.service.process.pid = 20
+
+        with browser.driver_session(driver, "web3"):
+            orphans = browser.find_orphans(max_age=300, processes=processes)
+
+        assert [o["pid"] for o in orphans] == [30]
+
+    def test_find_orphans_skips_other_workers(self):
+        """살아 있는 다른 워커가 띄운 브라우저는 건드리지 않고, 이 프로세스나 init 아래의 것만 찾는지 테스트"""
+        me = os.getpid()
+        processes = {
+            40: self.process("python3", ppid=1),               # 다른 gunicorn 워커
+            41: self.process("chromedriver", ppid=40, age=1000),
+            42: self.process("chrome", ppid=41, age=1000),
+            50: self.process("chromedriver", ppid=me, age=1000),  # 이 워커가 놓친 세션
+            51: self.process("chrome", ppid=50, age=1000),
+            60: self.process("chrome", ppid=1, age=1000),        # 띄운 프로세스가 죽어서 init 에 입양됨
+        }
+
+        orphans = browser.find_orphans(max_age=300, processes=processes)
+
+        assert sorted(o["pid"] for o in orphans) == [50, 51, 60]
+
+    def test_reap_counts_reclaimed(self):
+        """정리한 프로세스 수를 이유별로 세는지 테스트"""
+        orphans = [{"pid": 1, "name": "chrome", "age": 400.0, "rss_kb": 10, "reason": "age"}]
+        before = browser.reaped.value(reason="age")
+        with patch.object(browser, "find_orphans", return_value=orphans), \
+                patch.object(browser, "_kill", return_value=True):
+            assert browser.reap_orphans() == orphans
+
+        assert browser.reaped.value(reason="age") == before + 1
+
+    def test_reap_real_process(self, tmp_path):
+        """/proc 에서 읽은 고아 chromedriver 프로세스를 실제로 종료하는지 테스트"""
+        if not os.path.isdir("/proc"):
+            pytest.skip("requires /proc")
+        sleep = subprocess.run(["which", "sleep"], capture_output=True, text=True).stdout.strip()
+        if not sleep:
+            pytest.skip("requires sleep")
+        fake = tmp_path / "chromedriver"
+        fake.symlink_to(sleep)
+        proc = subprocess.Popen([str(fake), "30"])
+        try:
+            # exec 가 끝나서 프로세스 이름이 chromedriver 로 바뀔 때까지 대기
+            for _ in range(100):
+                processes = {pid: info for pid, info in browser._list_processes().items() if pid == proc.pid}
+                if processes and processes[proc.pid][0] == "chromedriver":
+                    break
+                time.sleep(0.02)
+            orphans = browser.find_orphans(max_age=-1, processes=processes)
+            assert [o["pid"] for o in orphans] == [proc.pid]
+
+            with patch.object(browser, "find_orphans", return_value=orphans):
+                assert len(browser.reap_orphans()) == 1
+            assert proc.wait(timeout=5) != 0
+        finally:
+            proc.kill()
+            proc.wait()
+
+    def test_reaper_thread_disabled(self):
+        """주기가 0 이면 리퍼 스레드를 띄우지 않는지 테스트"""
+        assert browser.start_reaper(0) is None
+
+
+class TestGovernor:
+
+    def test_slots_and_queue_timeout(self):
+        """슬롯이 모두 차면 기다리다가 시간이 지나면 BrowserBusy"""
+        governor = browser.Governor(slots=1, memory_budget_kb=10_000, session_kb=100, queue_timeout=0.05)
+        governor.acquire()
+        try:
+            with pytest.raises(browser.BrowserBusy):
+                governor.acquire()
+            assert governor.waiting == 0
+        finally:
+            governor.release()
+
+        with governor.slot():
+            assert governor.in_use == 1
+            assert browser.slots_in_use.value() == 1
+        assert governor.in_use == 0
+
+    def test_waiter_admitted_on_release(self):
+        """자리가 나면 기다리던 작업이 들어가는지 테스트"""
+        governor = browser.Governor(slots=1, memory_budget_kb=10_000, session_kb=100, queue_timeout=5)
+        governor.acquire()
+        admitted = threading.Event()
+
+        def waiter():
+            with governor.slot():
+                admitted.set()
+
+        thread = threading.Thread(target=waiter)
+        thread.start()
+        time.sleep(0.05)
+        assert governor.waiting == 1
+        assert browser.queue_depth.value() == 1
+        governor.release()
+        thread.join(5)
+
+        assert admitted.is_set()
+        assert governor.in_use == 0
+
+    def test_memory_budget(self):
+        """실제 메모리 사용량이 예산을 넘으면 슬롯이 남아도 들여보내지 않는지 테스트"""
+        governor = browser.Governor(slots=4, memory_budget_kb=1000, session_kb=300, queue_timeout=0)
+        governor.acquire()
+        governor.acquire()
+        governor.acquire()  # 예상치 900KB
+        with pytest.raises(browser.BrowserBusy):
+            governor.acquire()
+        for _ in range(3):
+            governor.release()
+
+        with patch.object(governor, "memory_kb", return_value=800):
+            with pytest.raises(browser.BrowserBusy):
+                governor.acquire()
+
+    def test_memory_measured_outside_lock_and_cached(self):
+        """/proc 읽기는 governor 락 밖에서 하고, 짧은 시간 안의 다른 요청은 잰 값을 다시 쓰는지 테스트"""
+        governor = browser.Governor(slots=4, memory_budget_kb=10_000, session_kb=100, queue_timeout=0)
+        lock_free = []
+
+        def listing():
+            # 다른 스레드에서 governor 락을 바로 잡을 수 있어야 함
+            def probe():
+                acquired = governor._cond.acquire(blocking=False)
+                lock_free.append(acquired)
+                if acquired:
+                    governor._cond.release()
+            thread = threading.Thread(target=probe)
+            thread.start()
+            thread.join()
+            return {20: ("chromedriver", "", 1, 10.0, 1000, os.getuid())}
+
+        driver = MagicMock()
+        driver.service.process.pid = 20
+        with patch.object(browser, "_list_processes", side_effect=listing) as list_processes, \
+                browser.driver_session(driver, "web3"):
+            governor.acquire()
+            governor.acquire()
+            assert list_processes.call_count == 1
+            governor.release()
+            governor.acquire()
+            assert list_processes.call_count == 2
+
+        assert lock_free == [True, True]
+
+
+class TestBrowserBenchmark:
+
+    def test_skips_without_chrome(self, capsys):
+        """크롬이 없으면 벤치마크를 건너뛰고 0 을 반환하는지 테스트"""
+        with patch.object(browser_bench, "find_chrome", return_value=None):
+            assert browser_bench.main([]) == 0
+        assert "skipping" in capsys.readouterr().err
+
+    def test_process_tree_rss(self):
+        """현재 프로세스의 RSS 를 읽을 수 있는지 테스트"""
+        if not os.path.isdir("/proc"):
+            pytest.skip("requires /proc")
+        assert browser_bench.process_tree_rss_kb(os.getpid()) > 0
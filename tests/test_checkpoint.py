@@ -0,0 +1,70 @@
+import json
+import sys
+import os
+
+# 프로젝트 루트 디렉토리를 Python path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from checkpoint import Checkpoint, DONE, FAILED, STARTED
+
+
+class TestCheckpoint:
+
+    def test_mark_appends_and_reloads(self, tmp_path):
+        """기록은 한 줄씩 추가되고 다시 열면 마지막 상태를 읽는지 테스트"""
+        path = tmp_path / "run.checkpoint"
+        with Checkpoint(path) as log:
+            log.mark("python", "web3", STARTED)
+            log.mark("python", "web3", DONE, jobs=3, offset=120)
+            log.mark("java", "berlin", STARTED)
+            log.mark("java", "berlin", FAILED, error="boom")
+
+        assert len(path.read_text(encoding="utf-8").splitlines()) == 4
+        log = Checkpoint(path)
+        assert log.is_done("python", "web3")
+        assert log.status("java", "berlin") == FAILED
+        assert log.status("go", "web3") is None
+        assert log.offset == 120
+
+    def test_pending_unit_is_not_done(self, tmp_path):
+        """시작만 하고 끝나지 않은 단위는 다시 실행 대상인지 테스트"""
+        path = tmp_path / "run.checkpoint"
+        with Checkpoint(path) as log:
+            log.mark("python", "web3", STARTED)
+
+        log = Checkpoint(path)
+        assert log.status("python", "web3") == STARTED
+        assert not log.is_done("python", "web3")
+
+    def test_pages_are_separate_units(self, tmp_path):
+        """같은 키워드 / 소스라도 페이지가 다르면 다른 단위인지 테스트"""
+        with Checkpoint(tmp_path / "run.checkpoint") as log:
+            log.mark("python", "web3", DONE, page=1)
+
+            assert log.is_done("python", "web3", page=1)
+            assert not log.is_done("python", "web3", page=2)
+
+    def test_truncated_line_is_ignored(self, tmp_path):
+        """기록 중에 죽어서 잘린 마지막 줄은 무시하는지 테스트"""
+        path = tmp_path / "run.checkpoint"
+        done = {"keyword": "python", "source": "web3", "page": 1, "status": DONE, "offset": 10}
+        path.write_text(json.dumps(done) + "\n" + '{"keyword": "java", "sou', encoding="utf-8")
+
+        log = Checkpoint(path)
+        assert log.is_done("python", "web3")
+        assert list(log.units) == [("python", "web3", 1)]
+
+        # 다시 시작한 뒤의 기록은 잘린 줄에 붙지 않고 다음 로드에서도 읽힘
+        log.mark("java", "berlin", DONE, offset=20)
+        log.close()
+        assert Checkpoint(path).is_done("java", "berlin")
+
+    def test_reset(self, tmp_path):
+        """reset 하면 기록 파일을 지우고 처음부터 시작하는지 테스트"""
+        path = tmp_path / "run.checkpoint"
+        log = Checkpoint(path)
+        log.mark("python", "web3", DONE)
+        log.reset()
+
+        assert not path.exists()
+        assert log.status("python", "web3") is None
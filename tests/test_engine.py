@@ -0,0 +1,95 @@
+import pytest
+import sys
+import os
+
+# 프로젝트 루트 디렉토리를 Python path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from extractors import engine
+from extractors.engine import Field, Spec, MissingField
+
+
+HTML = """
+<ul>
+    <li class="row featured"><a href="/a">Apply</a><h4>  Python  Dev </h4><span class="co">Acme</span></li>
+    <li class="other"><h4>Not a row</h4></li>
+    <li class="row"><a href="/b">Apply</a><h4>Go Dev</h4><span class="co">Beta</span><i class="x y"></i></li>
+</ul>
+"""
+
+
+class TestEngine:
+
+    @pytest.fixture
+    def spec(self):
+        return Spec("test", row="li.row", fields={
+            "title": Field("h4"),
+            "company": Field("span.co"),
+            "link": Field("a", attr="href"),
+        })
+
+    def test_extract_rows_in_document_order(self, spec):
+        """행 선택자에 맞는 행만 문서 순서대로, 텍스트는 strip / 속성은 그대로 뽑는지 테스트"""
+        jobs = engine.extract(spec, engine.parse(HTML))
+
+        assert jobs == [
+            {"title": "Python  Dev", "company": "Acme", "link": "/a"},
+            {"title": "Go Dev", "company": "Beta", "link": "/b"},
+        ]
+
+    def test_compiled_once(self, spec):
+        """선택자를 한 번만 컴파일하고 다시 쓰는지 테스트"""
+        spec.compile()
+        row, title = spec._row, spec.fields["title"].compiled
+
+        engine.extract(spec, engine.parse(HTML))
+
+        assert spec._row is row
+        assert spec.fields["title"].compiled is title
+
+    def test_normalize_and_optional(self):
+        """normalize 함수, 없어도 되는 필드(None), 여러 값 속성을 처리하는지 테스트"""
+        spec = Spec("test", row="li.row", fields={
+            "title": Field("h4", normalize=lambda text: " ".join(text.split()).lower()),
+            "tags": Field("i", attr="class", required=False),
+        })
+
+        jobs = engine.extract(spec, engine.parse(HTML))
+
+        assert jobs == [
+            {"title": "python dev", "tags": None},
+            {"title": "go dev", "tags": "x y"},
+        ]
+
+    def test_skip_rows_missing_required_field(self):
+        """필수 필드가 없는 행만 건너뛰고 출처 / 선택자별로 세는지 테스트"""
+        spec = Spec("skip", row="li", fields={"link": Field("a", attr="href")})
+        before = engine.skipped.value(source="skip", field="link", selector="a")
+
+        jobs = engine.extract(spec, engine.parse(HTML))
+
+        assert jobs == [{"link": "/a"}, {"link": "/b"}]
+        assert engine.skipped.value(source="skip", field="link", selector="a") == before + 1
+
+    def test_skip_rows_normalize_error(self):
+        """값 정리 함수가 실패한 행도 건너뛰는지 테스트"""
+        spec = Spec("skip", row="li.row", fields={"title": Field("h4", normalize=lambda text: int(text))})
+        before = engine.skipped.value(source="skip", field="title", selector="h4")
+
+        assert engine.extract(spec, engine.parse(HTML)) == []
+        assert engine.skipped.value(source="skip", field="title", selector="h4") == before + 2
+
+    def test_strict_raises(self):
+        """strict=True 면 필수 필드가 없을 때 MissingField (AttributeError) 를 내는지 테스트"""
+        spec = Spec("test", row="li", fields={"link": Field("a", attr="href")})
+
+        with pytest.raises(AttributeError) as excinfo:
+            engine.extract(spec, engine.parse(HTML), strict=True)
+
+        assert isinstance(excinfo.value, MissingField)
+        assert excinfo.value.source == "test"
+        assert excinfo.value.field == "link"
+
+    def test_no_rows(self, spec):
+        """행이 없으면 빈 리스트를 반환하는지 테스트"""
+        assert engine.extract(spec, engine.parse("<html></html>")) == []
@@ -0,0 +1,174 @@
+import pytest
+import threading
+from unittest.mock import patch, MagicMock
+import sys
+import os
+
+# 프로젝트 루트 디렉토리를 Python path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import enrich
+import scheduler
+from enrich import DetailCache, Enricher, HostLimiter, fetch_detail
+from extractors import berlin
+from extractors.berlin import BASE_URL
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 100.0
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+
+
+class TestDetailCache:
+
+    def test_ttl_and_size(self):
+        """TTL 이 지나면 없는 것으로 보고, 크기를 넘으면 오래 안 쓴 것부터 버리는지 테스트"""
+        clock = FakeClock()
+        cache = DetailCache(ttl=60, max_entries=2, clock=clock)
+
+        cache.set("a", {"salary": "1"})
+        cache.set("b", {"salary": "2"})
+        assert cache.get("a") == {"salary": "1"}
+        cache.set("c", {"salary": "3"})
+        assert cache.get("b") is None
+        assert len(cache) == 2
+
+        clock.now += 61
+        assert cache.get("a") is None
+
+
+class TestHostLimiter:
+
+    def test_requests_spaced_per_host(self):
+        """같은 host 는 interval 간격으로, 다른 host 는 기다리지 않고 요청하는지 테스트"""
+        clock = FakeClock()
+        limiter = HostLimiter(interval=0.5, clock=clock, sleep=clock.sleep)
+
+        assert limiter.acquire("a.com") == 0
+        assert limiter.acquire("a.com") == 0.5
+        assert limiter.acquire("a.com") == 1.0
+        assert limiter.acquire("b.com") == 0
+        assert clock.slept == [0.5, 1.0]
+
+
+class TestEnricher:
+
+    @pytest.fixture
+    def jobs(self):
+        return [
+            {"title": "A", "company": "X", "link": "https://example.com/a"},
+            {"title": "A again", "company": "X", "link": "https://example.com/a?utm_source=feed"},
+            {"title": "B", "company": "Y", "link": "https://example.com/b"},
+            {"title": "no link", "company": "Z", "link": ""},
+        ]
+
+    def test_enrich_fetches_once_per_canonical_link(self, jobs):
+        """표준 링크마다 한 번만 읽고, 다음 요청은 캐시에서 붙이는지 테스트"""
+        fetch = MagicMock(side_effect=lambda link: {"description": link, "extra": "ignored"})
+        enricher = Enricher(fetch=fetch, workers=2)
+
+        results, pending = enricher.enrich(jobs)
+
+        assert pending == 0
+        assert fetch.call_count == 2
+        assert results[0] == {**jobs[0], "description": "https://example.com/a", "salary": None, "tags": None}
+        assert results[1]["description"] == "https://example.com/a"
+        assert results[3] == jobs[3]
+        assert "description" not in jobs[0]
+
+        enricher.enrich(jobs)
+        assert fetch.call_count == 2
+        enricher.shutdown()
+
+    def test_enrich_timeout_returns_pending(self, jobs):
+        """wait 안에 못 받은 공고는 상세 정보 없이 돌려주고 나중 요청에서 붙이는지 테스트"""
+        release = threading.Event()
+
+        def fetch(link):
+            release.wait(5)
+            return {"salary": "100k"}
+
+        enricher = Enricher(fetch=fetch, workers=4)
+
+        results, pending = enricher.enrich(jobs, wait=0.05)
+        assert pending == 3
+        assert results == jobs
+
+        release.set()
+        results, pending = enricher.enrich(jobs, wait=5)
+        assert pending == 0
+        assert results[2]["salary"] == "100k"
+        enricher.shutdown()
+
+    def test_fetch_error_cached_briefly(self, jobs):
+        """상세 페이지를 못 읽으면 pending 으로 세지 않고, error_ttl 동안 다시 읽지 않다가 지나면 다시 시도하는지 테스트"""
+        clock = FakeClock()
+        fetch = MagicMock(side_effect=RuntimeError("boom"))
+        enricher = Enricher(fetch=fetch, cache=DetailCache(ttl=1000, clock=clock), error_ttl=60)
+        errors = enrich.fetches.value(host="example.com", result="error")
+
+        for _ in range(3):
+            results, pending = enricher.enrich(jobs[:1])
+            assert pending == 0
+            assert results[0]["description"] is None
+
+        assert fetch.call_count == 1
+        assert enrich.fetches.value(host="example.com", result="error") == errors + 1
+
+        clock.now += 61
+        enricher.enrich(jobs[:1])
+        assert fetch.call_count == 2
+        enricher.shutdown()
+
+    def test_prefetch_bounded(self, jobs):
+        """백그라운드 요청은 스크래핑 풀의 prefetch 클래스로 넣고 대기 수를 넘으면 버리는지 테스트"""
+        release = threading.Event()
+        enricher = Enricher(fetch=lambda link: release.wait(5) and {}, workers=1, max_pending=1)
+        dropped = enrich.dropped.value()
+        executor = MagicMock(wraps=scheduler.PriorityExecutor(1))
+
+        with patch('enrich.scheduler.get_executor', return_value=executor):
+            assert enricher.prefetch(jobs) == 1
+        assert enrich.dropped.value() == dropped + 1
+        assert executor.submit.call_args.kwargs == {"priority": scheduler.PREFETCH}
+        assert enricher._executor is None
+
+        release.set()
+        enricher.shutdown()
+        executor.shutdown()
+
+
+class TestFetchDetail:
+
+    @patch('enrich.limiter', HostLimiter(interval=0))
+    @patch.object(berlin.scraper(), 'get')
+    def test_fetch_berlin_detail(self, mock_get):
+        """berlin 상세 페이지에서 설명 / 태그를 읽는지 테스트"""
+        mock_response = MagicMock()
+        mock_response.text = """
+        <html><body>
+            <div class="job-details"><p>Build   things.</p>
+            <p>With Python.</p></div>
+            <div class="links-box"><a class="bjs-bl">Python</a><a class="bjs-bl">Django</a></div>
+        </body></html>
+        """
+        mock_get.return_value = mock_response
+        link = f"{BASE_URL}/job/python-developer"
+
+        details = fetch_detail(link)
+
+        mock_response.raise_for_status.assert_called_once()
+        assert mock_get.call_args[0][0] == link
+        assert details == {"description": "Build things. With Python.", "salary": None, "tags": ["Python", "Django"]}
+
+    def test_unknown_host(self):
+        """모르는 사이트의 링크는 요청하지 않는지 테스트"""
+        assert fetch_detail("https://unknown.example/job/1") == {}
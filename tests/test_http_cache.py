@@ -0,0 +1,103 @@
+import pytest
+import gzip
+from unittest.mock import patch
+import sys
+import os
+
+# 프로젝트 루트 디렉토리를 Python path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import main
+import http_cache
+
+
+class TestHttpCache:
+
+    @pytest.fixture
+    def client(self):
+        """Flask 테스트 클라이언트 (db 초기화)"""
+        main.app.config['TESTING'] = True
+        main.db.clear()
+        main.db['python'] = [
+            {"title": f"Python Developer {i}", "company": "TechCorp", "link": f"/job/{i}"} for i in range(50)
+        ]
+        return main.app.test_client()
+
+    def test_cache_control_per_route(self, client):
+        """라우트별 Cache-Control 이 붙는지 테스트"""
+        assert client.get('/search?keyword=python').headers['Cache-Control'] == http_cache.CACHE_CONTROL['search']
+        assert client.get('/api/search?keyword=python').headers['Cache-Control'] == http_cache.CACHE_CONTROL['api_search']
+
+    def test_cache_control_configurable(self, client):
+        """app.config 로 Cache-Control 을 바꿀 수 있는지 테스트"""
+        with patch.dict(main.app.config['CACHE_CONTROL'], {'search': 'no-cache'}):
+            assert client.get('/search?keyword=python').headers['Cache-Control'] == 'no-cache'
+
+    def test_gzip_html_and_json(self, client):
+        """gzip 을 허용하면 HTML / JSON 을 압축하는지 테스트"""
+        for url in ('/search?keyword=python', '/api/search?keyword=python&limit=50'):
+            response = client.get(url, headers={'Accept-Encoding': 'gzip'})
+            assert response.headers['Content-Encoding'] == 'gzip'
+            assert 'Accept-Encoding' in response.headers['Vary']
+            assert b'Python Developer 49' in gzip.decompress(response.data)
+
+    def test_no_compression_without_accept_encoding(self, client):
+        """Accept-Encoding 이 없으면 압축하지 않는지 테스트"""
+        response = client.get('/search?keyword=python')
+        assert 'Content-Encoding' not in response.headers
+        assert b'Python Developer 49' in response.data
+
+    def test_compressed_etag_conditional_get(self, client):
+        """압축된 응답의 ETag 로도 304 를 받는지 테스트"""
+        first = client.get('/search?keyword=python', headers={'Accept-Encoding': 'gzip'})
+        etag = first.headers['ETag']
+        assert etag.endswith('-gz"')
+
+        second = client.get('/search?keyword=python', headers={'Accept-Encoding': 'gzip', 'If-None-Match': etag})
+        assert second.status_code == 304
+        # 304 도 200 과 같은 ETag / Vary 를 보냄
+        assert second.headers['ETag'] == etag
+        assert 'Accept-Encoding' in second.headers['Vary']
+
+        plain = client.get('/search?keyword=python')
+        revalidated = client.get('/search?keyword=python', headers={'If-None-Match': plain.headers['ETag']})
+        assert revalidated.status_code == 304
+        assert revalidated.headers['ETag'] == plain.headers['ETag']
+
+    def test_keywords_with_same_results(self, client):
+        """결과가 같은 두 키워드가 ETag / 압축 본문을 공유하지 않는지 테스트"""
+        main.db['golang'] = main.db['python']
+        headers = {'Accept-Encoding': 'gzip'}
+
+        python_page = client.get('/search?keyword=python', headers=headers)
+        golang_page = client.get('/search?keyword=golang', headers=headers)
+        assert python_page.headers['ETag'] != golang_page.headers['ETag']
+        assert b'golang' in gzip.decompress(golang_page.data)
+
+        client.get('/api/search?keyword=python&limit=50', headers=headers)
+        golang_api = client.get('/api/search?keyword=golang&limit=50', headers=headers)
+        assert b'"keyword":"golang"' in gzip.decompress(golang_api.data).replace(b' ', b'')
+
+        etag = client.get('/api/changes?keyword=python').headers['ETag']
+        assert client.get('/api/changes?keyword=golang', headers={'If-None-Match': etag}).status_code == 200
+
+    def test_api_search_conditional_get(self, client):
+        """/api/search 도 결과 버전이 같으면 304 를 반환하는지 테스트"""
+        etag = client.get('/api/search?keyword=python').headers['ETag']
+        assert client.get('/api/search?keyword=python', headers={'If-None-Match': etag}).status_code == 304
+        # 다른 페이지는 다른 ETag
+        assert client.get('/api/search?keyword=python&offset=20', headers={'If-None-Match': etag}).status_code == 200
+
+    def test_export_gzip_and_conditional_get(self, client, tmp_path, monkeypatch):
+        """/export 의 CSV 압축과 304 처리 테스트"""
+        monkeypatch.chdir(tmp_path)
+
+        first = client.get('/export?keyword=python', headers={'Accept-Encoding': 'gzip'})
+        assert first.status_code == 200
+        assert first.headers['Content-Encoding'] == 'gzip'
+        assert gzip.decompress(first.data).startswith(b'Title,Company,Link')
+
+        with patch('main.save_to_file') as mock_save:
+            second = client.get('/export?keyword=python', headers={'If-None-Match': first.headers['ETag']})
+            assert second.status_code == 304
+            mock_save.assert_not_called()
@@ -0,0 +1,121 @@
+import csv
+import json
+import pytest
+from unittest.mock import MagicMock, patch
+import sys
+import os
+
+# 프로젝트 루트 디렉토리를 Python path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import jobscraper
+
+
+def read_jsonl(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+class TestJobscraperCli:
+
+    @pytest.fixture
+    def sources(self):
+        """소스별로 키워드를 제목에 담아 돌려주는 mock extractor"""
+        web3 = MagicMock(side_effect=lambda k: [{"title": f"web3 {k}", "company": "A", "link": f"/web3/{k}"}])
+        berlin = MagicMock(side_effect=lambda k: [{"title": f"berlin {k}", "company": "C", "link": f"/berlin/{k}"}])
+        return [("web3", web3), ("berlin", berlin)]
+
+    def test_read_keywords(self, tmp_path):
+        """빈 줄 / 주석 / 중복을 건너뛰고 순서를 유지하는지 테스트"""
+        path = tmp_path / "keywords.txt"
+        path.write_text("python\n\n# comment\njava\npython\n  go  \n", encoding="utf-8")
+
+        assert jobscraper.read_keywords(path) == ["python", "java", "go"]
+
+    def test_scrape_jsonl(self, tmp_path, sources):
+        """모든 (keyword, source) 단위의 공고를 jsonl 로 쓰는지 테스트"""
+        output = tmp_path / "jobs.jsonl"
+        summary = jobscraper.scrape(["python", "java"], sources, str(output), concurrency=2)
+
+        rows = read_jsonl(output)
+        assert summary["done"] == 4 and summary["failed"] == 0 and summary["jobs"] == 4
+        assert {(r["keyword"], r["source"]) for r in rows} == {
+            ("python", "web3"), ("python", "berlin"), ("java", "web3"), ("java", "berlin"),
+        }
+        assert all(r["title"] == f"{r['source']} {r['keyword']}" for r in rows)
+
+    def test_scrape_csv(self, tmp_path, sources):
+        """csv 형식은 헤더 한 줄과 공고 행을 쓰는지 테스트"""
+        output = tmp_path / "jobs.csv"
+        jobscraper.scrape(["python"], sources, str(output), fmt="csv")
+
+        with open(output, encoding="utf-8", newline="") as f:
+            rows = list(csv.DictReader(f))
+        assert len(rows) == 2
+        assert set(rows[0]) == set(jobscraper.FIELDS)
+
+    def test_resume_skips_done_units(self, tmp_path, sources):
+        """실패한 단위만 다시 실행하고 끝난 단위는 건너뛰는지 테스트"""
+        output = tmp_path / "jobs.jsonl"
+        name, web3 = sources[0]
+        web3.side_effect = [RuntimeError("boom"), [{"title": "web3 python", "company": "A", "link": "/web3/python"}]]
+
+        first = jobscraper.scrape(["python"], sources, str(output), concurrency=1)
+        assert first["done"] == 1 and first["failed"] == 1
+
+        second = jobscraper.scrape(["python"], sources, str(output), concurrency=1)
+        assert second["skipped"] == 1 and second["done"] == 1 and second["failed"] == 0
+        assert sources[1][1].call_count == 1
+        # 첫 실행 결과에 이어서 씀
+        assert sorted(r["source"] for r in read_jsonl(output)) == ["berlin", "web3"]
+
+    def test_scrape_nothing_pending(self, tmp_path, sources):
+        """모든 단위가 끝나 있으면 추출기를 부르지 않는지 테스트"""
+        output = tmp_path / "jobs.jsonl"
+        jobscraper.scrape(["python"], sources, str(output))
+        summary = jobscraper.scrape(["python"], sources, str(output))
+
+        assert summary["skipped"] == 2 and summary["done"] == 0
+        assert sources[0][1].call_count == 1
+
+    def test_main(self, tmp_path, sources):
+        """명령행 인자로 소스 / 형식 / 출력 경로를 고르는지 테스트"""
+        keywords = tmp_path / "keywords.txt"
+        keywords.write_text("python\n", encoding="utf-8")
+        output = tmp_path / "out.jsonl"
+        with patch.object(jobscraper, "extractors", return_value=dict(sources)), \
+                patch.object(jobscraper, "setup_logging"):
+            code = jobscraper.main([
+                "scrape", "--keywords-file", str(keywords), "--sources", "berlin", "--output", str(output),
+            ])
+
+        assert code == 0
+        assert [r["source"] for r in read_jsonl(output)] == ["berlin"]
+
+    def test_main_unknown_source(self, tmp_path):
+        """알 수 없는 소스면 인자 오류로 종료하는지 테스트"""
+        with pytest.raises(SystemExit):
+            jobscraper.main(["scrape", "--keywords-file", "x", "--sources", "nope"])
+
+    def test_resume_truncates_unfinished_rows(self, tmp_path, sources):
+        """완료 기록 뒤에 쓰다 만 공고는 잘라내고 이어 쓰는지 테스트"""
+        output = tmp_path / "jobs.jsonl"
+        jobscraper.scrape(["python"], sources[:1], str(output))
+        # 완료 기록 없이 쓰인 공고 (기록 직전에 죽은 경우)
+        with open(output, "a", encoding="utf-8") as f:
+            f.write('{"keyword": "python", "source": "berlin", "title": "half')
+
+        summary = jobscraper.scrape(["python"], sources, str(output))
+
+        assert summary["skipped"] == 1 and summary["done"] == 1
+        assert [r["source"] for r in read_jsonl(output)] == ["web3", "berlin"]
+
+    def test_failed_unit_is_retried(self, tmp_path, sources):
+        """실패 기록이 남은 단위는 다음 실행에서 다시 시도하는지 테스트"""
+        output = tmp_path / "jobs.jsonl"
+        sources[1][1].side_effect = [RuntimeError("boom"), [{"title": "b", "company": "C", "link": "/b"}]]
+        jobscraper.scrape(["python"], sources, str(output))
+
+        summary = jobscraper.scrape(["python"], sources, str(output))
+
+        assert summary["retried"] == 1 and summary["done"] == 1
@@ -0,0 +1,58 @@
+import pytest
+import threading
+from unittest.mock import MagicMock
+import sys
+import os
+
+# 프로젝트 루트 디렉토리를 Python path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from lazy import Lazy
+
+
+class TestLazy:
+
+    def test_nothing_loaded_until_used(self):
+        """처음 부르기 전에는 팩토리를 호출하지 않는지 테스트"""
+        factory = MagicMock(return_value="session")
+        scraper = Lazy(factory)
+
+        assert not scraper.loaded()
+        factory.assert_not_called()
+
+    def test_factory_called_once(self):
+        """팩토리는 한 번만 호출되고 같은 값을 돌려주는지 테스트"""
+        factory = MagicMock(return_value="session")
+        scraper = Lazy(factory)
+
+        assert scraper() == "session"
+        assert scraper() == "session"
+        assert scraper.loaded()
+        factory.assert_called_once()
+
+    def test_concurrent_first_use(self):
+        """여러 스레드가 동시에 처음 불러도 한 번만 만드는지 테스트"""
+        started = threading.Event()
+
+        def factory():
+            started.wait(1)
+            return object()
+
+        scraper = Lazy(factory)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(scraper())) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        started.set()
+        for thread in threads:
+            thread.join()
+
+        assert len(set(map(id, results))) == 1
+
+    def test_extractors_have_no_lazy_globals(self):
+        """추출기 모듈의 이름이 import 할 때 모두 정의되어 있는지 테스트 (정적 분석기가 볼 수 있도록)"""
+        from extractors import berlin, web3, wework
+
+        for module in (berlin, web3, wework):
+            assert isinstance(module.scraper, Lazy)
+            assert not hasattr(module, "__getattr__")
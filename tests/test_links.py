@@ -0,0 +1,64 @@
+import pytest
+import sys
+import os
+
+# 프로젝트 루트 디렉토리를 Python path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import links
+from links import LinkIndex, canonicalize
+from store import diff_jobs
+
+
+class TestCanonicalize:
+
+    @pytest.mark.parametrize("url, base, expected", [
+        ("/job/python-dev", "https://berlinstartupjobs.com/skill-areas/python/", "https://berlinstartupjobs.com/job/python-dev"),
+        ("listing/1", "https://weworkremotely.com/remote-jobs/search?term=go", "https://weworkremotely.com/remote-jobs/listing/1"),
+        ("HTTPS://Web3.Career:443/job?id=1&utm_source=x&gclid=y#apply", None, "https://web3.career/job?id=1"),
+        ("http://example.com:8080", None, "http://example.com:8080/"),
+        ("/job/a?ref=home&page=2", None, "/job/a?page=2"),
+        ("https://example.com/a?q=a%20b&b=1", None, "https://example.com/a?q=a%20b&b=1"),
+        ("mailto:jobs@example.com", "https://example.com", "mailto:jobs@example.com"),
+        ("", "https://example.com", ""),
+    ])
+    def test_canonicalize(self, url, base, expected):
+        """절대 경로로 바꾸고 host 소문자 / 기본 포트 / fragment / 추적 파라미터를 정리하는지 테스트"""
+        assert canonicalize(url, base) == expected
+
+
+class TestLinkIndex:
+
+    def test_canonical_memoized_and_bounded(self):
+        """같은 링크는 같은 (intern 된) 문자열을 돌려주고 크기를 넘으면 오래된 것부터 잊는지 테스트"""
+        index = LinkIndex(size=2)
+
+        first = index.canonical("/a?utm_medium=x", "https://example.com")
+        assert first == "https://example.com/a"
+        assert index.canonical("/a?utm_medium=x", "https://example.com") is first
+
+        index.canonical("/b")
+        index.canonical("/c")
+        assert len(index) == 2
+
+    def test_dedup_keeps_first(self):
+        """표준 링크가 같은 공고는 처음 것만 남기고 링크 없는 공고는 그대로 두는지 테스트"""
+        index = LinkIndex()
+        before = links.duplicates.value()
+        jobs = [
+            {"title": "A", "link": "https://example.com/a"},
+            {"title": "A again", "link": "https://EXAMPLE.com/a?utm_source=feed"},
+            {"title": "no link"},
+            {"title": "no link either", "link": ""},
+            {"title": "B", "link": "https://example.com/b"},
+        ]
+
+        assert [job["title"] for job in index.dedup(jobs)] == ["A", "no link", "no link either", "B"]
+        assert links.duplicates.value() == before + 1
+
+    def test_diff_ignores_tracking_params(self):
+        """추적 파라미터만 다른 링크는 결과 비교에서 같은 공고로 보는지 테스트"""
+        old = [{"title": "A", "link": "https://example.com/a?utm_source=x"}]
+        new = [{"title": "A", "link": "https://example.com/a"}]
+
+        assert diff_jobs(old, new) == ([], [])
@@ -0,0 +1,84 @@
+import pytest
+import requests
+from unittest.mock import patch
+import sys
+import os
+
+# 프로젝트 루트 디렉토리를 Python path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import main
+import extractors.web3
+from loadtest import run
+from loadtest.fake_boards import FakeBoards
+
+
+class TestFakeBoards:
+
+    def test_serves_pages_for_each_source(self):
+        """소스별 경로에 설정한 크기의 페이지를 돌려주는지 테스트"""
+        with FakeBoards(page_size=4) as boards:
+            urls = boards.base_urls()
+            berlin = requests.get(f"{urls['berlin']}/skill-areas/python/")
+            wework = requests.get(f"{urls['wework']}python")
+            web3 = requests.get(f"{urls['web3']}/python-jobs")
+            missing = requests.get(f"{boards.url}/nope")
+
+        assert berlin.text.count('class="bjs-jlid"') == 4
+        assert wework.text.count('new-listing__header__title') == 4
+        assert web3.text.count('<h2') == 4
+        assert missing.status_code == 404
+        assert boards.hits == {"berlin": 1, "wework": 1, "web3": 1}
+
+    def test_error_injection(self):
+        """error_rate 에 맞춰 500 을 돌려주는지 테스트"""
+        with FakeBoards(seed=1) as boards:
+            boards.configure("berlin", error_rate=1.0)
+            response = requests.get(f"{boards.base_urls()['berlin']}/skill-areas/python/")
+
+        assert response.status_code == 500
+        assert boards.errors["berlin"] == 1
+
+
+class TestLoadRun:
+
+    def test_percentile(self):
+        """nearest-rank 백분위 테스트"""
+        values = list(range(1, 101))
+        assert run.percentile(values, 50) == 50
+        assert run.percentile(values, 99) == 99
+        assert run.percentile([], 50) == 0.0
+
+    def test_web3_over_http_uses_extractor_path(self):
+        """web3 대체 추출기가 추출기의 행 추출 / 링크 표준화를 그대로 쓰는지 테스트"""
+        with FakeBoards(page_size=4) as boards:
+            url = boards.base_urls()['web3']
+            with patch.object(extractors.web3, 'BASE_URL', url):
+                jobs = run.web3_over_http(url)('python')
+
+        assert len(jobs) == 4
+        assert all(job['link'].startswith(boards.url + '/') for job in jobs)
+        assert len({job['link'] for job in jobs}) == 4
+
+    def test_run_in_process(self):
+        """앱을 띄워서 부하를 주고 지표를 보고하는지 테스트"""
+        original = main.extract_web3_jobs
+        main.db['kept'] = [{"title": "kept", "company": "c", "link": "/kept"}]
+
+        report = run.run(requests_count=30, concurrency=4, distinct=3, latency=0.0, jitter=0.0,
+                         page_size=5, seed=7)
+
+        assert report['requests'] == 30
+        assert report['failures'] == 0
+        assert report['p50_ms'] <= report['p95_ms'] <= report['p99_ms']
+        assert report['throughput_rps'] > 0
+        # 키워드가 3개뿐이므로 나머지는 캐시에서 처리
+        assert report['upstream_hits']['berlin'] <= 3
+        assert report['cache_hit_rate'] >= 0.9
+        assert report['peak_rss_kb'] > 0
+        # 부하 테스트가 끝나면 바꿔 끼운 추출기가 원래대로 돌아옴
+        assert main.extract_web3_jobs is original
+        # 앱의 저장소는 비우지도, 가짜 결과로 채우지도 않음
+        assert main.db['kept'][0]['title'] == "kept"
+        assert 'kw0' not in main.db
+        del main.db['kept']
@@ -0,0 +1,99 @@
+import io
+import json
+import logging
+import pytest
+from unittest.mock import patch, MagicMock
+import sys
+import os
+
+# 프로젝트 루트 디렉토리를 Python path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import log
+
+
+class TestLogging:
+
+    @pytest.fixture
+    def stream(self):
+        """로그 출력을 받을 스트림, 테스트가 끝나면 로깅 설정 원복"""
+        stream = io.StringIO()
+        yield stream
+        log.stop_logging()
+        logger = log.get_logger()
+        for handler in list(logger.handlers):
+            logger.removeHandler(handler)
+        logger.setLevel(logging.NOTSET)
+        logger.propagate = True
+
+    def lines(self, stream):
+        log.stop_logging()  # 큐에 남은 로그를 모두 내보냄
+        return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+    def test_json_output_with_extra_fields(self, stream):
+        """extra 필드가 JSON 필드로 출력되는지 테스트"""
+        log.setup_logging(level="INFO", fmt="json", stream=stream)
+        log.get_logger("berlin").info("scraped", extra={"source": "berlin", "jobs": 3})
+
+        [line] = self.lines(stream)
+        assert line['severity'] == 'INFO'
+        assert line['logger'] == 'jobscraper.berlin'
+        assert line['message'] == 'scraped'
+        assert line['source'] == 'berlin'
+        assert line['jobs'] == 3
+
+    def test_exception_field(self, stream):
+        """예외 traceback 이 exception 필드로 분리되는지 테스트"""
+        log.setup_logging(level="INFO", fmt="json", stream=stream)
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            log.get_logger("app").exception("search failed")
+
+        [line] = self.lines(stream)
+        assert line['message'] == 'search failed'
+        assert 'ValueError: boom' in line['exception']
+
+    def test_level_filtering(self, stream):
+        """설정한 레벨 아래는 출력되지 않는지 테스트"""
+        log.setup_logging(level="WARNING", fmt="json", stream=stream)
+        log.get_logger("web3").info("hidden")
+        log.get_logger("web3").warning("shown")
+
+        assert [line['message'] for line in self.lines(stream)] == ['shown']
+
+    def test_debug_sampling(self, stream):
+        """DEBUG 는 샘플링되고 INFO 이상은 항상 남는지 테스트"""
+        log.setup_logging(level="DEBUG", fmt="json", debug_sample_rate=0.0, stream=stream)
+        logger = log.get_logger("web3")
+        for _ in range(20):
+            logger.debug("job")
+        logger.info("scraped")
+
+        assert [line['message'] for line in self.lines(stream)] == ['scraped']
+
+    def test_sampling_filter_rate(self):
+        """SamplingFilter 가 대략 rate 비율만 통과시키는지 테스트"""
+        sampler = log.SamplingFilter(0.5)
+        sampler._random.seed(0)
+        record = logging.LogRecord("x", logging.DEBUG, "", 0, "debug", (), None)
+        passed = sum(sampler.filter(record) for _ in range(1000))
+        assert 400 < passed < 600
+
+    @patch('extractors.web3.time.sleep')
+    @patch('webdriver_manager.chrome.ChromeDriverManager')
+    @patch('selenium.webdriver.Chrome')
+    def test_web3_does_not_print(self, mock_chrome, mock_driver_manager, mock_sleep, capsys, caplog):
+        """web3 추출기가 stdout 에 공고를 출력하지 않고 로그로 남기는지 테스트"""
+        from extractors.web3 import extract_web3_jobs
+        mock_chrome.return_value.execute_script.return_value = json.dumps([
+            {"jobid": "1", "title": "Solidity Dev", "company": "Chain Inc", "link": "https://web3.career/job/1"}
+        ])
+
+        with caplog.at_level(logging.DEBUG, logger="jobscraper"):
+            extract_web3_jobs("solidity")
+
+        assert capsys.readouterr().out == ''
+        messages = [(r.name, r.getMessage()) for r in caplog.records]
+        assert ('jobscraper.web3', 'job') in messages
+        assert ('jobscraper.web3', 'scraped') in messages
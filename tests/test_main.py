@@ -2,6 +2,7 @@ import pytest
 import os
 import tempfile
 from unittest.mock import patch, MagicMock
+import threading
 import sys
 
 # 프로젝트 루트 디렉토리를 Python path에 추가
@@ -382,7 +383,7 @@ class TestMainApp:
     @patch('main.extract_wework_jobs')
     @patch('main.extract_berlin_jobs')
     def test_search_duplicate_results_from_different_sources(self, mock_berlin, mock_wework, mock_web3, client):
-        """다른 소스에서 중복된 결과가 나올 때도 모두 포함되는지 테스트"""
+        """다른 소스에서 같은 링크의 공고가 나오면 먼저 나온 하나만 남기는지 테스트"""
         # 의도적으로 중복된 job 데이터 설정
         duplicate_job = {"title": "Full Stack Developer", "company": "Tech Company", "link": "/job/fullstack"}
         
@@ -392,11 +393,292 @@ class TestMainApp:
         
         response = client.get('/search?keyword=fullstack')
         
-        # 검증 - 중복 제거 없이 모든 결과 포함
+        # 검증 - 표준 링크 기준으로 중복 제거
         assert response.status_code == 200
-        assert 'fullstack' in main.db
-        assert len(main.db['fullstack']) == 3  # 중복이어도 3개 모두 포함
-        
-        # 모든 결과가 동일한지 확인
-        for job in main.db['fullstack']:
-            assert job == duplicate_job 
\ No newline at end of file
+        assert main.db['fullstack'] == [duplicate_job]
+
+    @patch('main.extract_web3_jobs')
+    @patch('main.extract_wework_jobs')
+    @patch('main.extract_berlin_jobs')
+    def test_search_batch_json(self, mock_berlin, mock_wework, mock_web3, client, mock_job_data):
+        """POST /search/batch 로 여러 키워드를 한 번에 검색하는 테스트"""
+        mock_web3.return_value = [mock_job_data[0]]
+        mock_wework.return_value = [mock_job_data[1]]
+        mock_berlin.return_value = [mock_job_data[2]]
+        main.db['cached'] = [mock_job_data[0]]
+
+        response = client.post('/search/batch', json={"keywords": ["python", "cached", "python"]})
+
+        assert response.status_code == 200
+        data = response.get_json()
+        assert set(data) == {"python", "cached"}
+        assert data["python"]["jobs"] == mock_job_data
+        assert data["cached"]["cached"] is True
+        assert main.db['python'] == mock_job_data
+        mock_web3.assert_called_once_with('python')
+
+    def test_search_batch_query_string(self, client, mock_job_data):
+        """GET /search/batch?keyword=...&keyword=... 테스트"""
+        main.db['a'] = [mock_job_data[0]]
+        main.db['b'] = [mock_job_data[1]]
+
+        response = client.get('/search/batch?keyword=a&keyword=b')
+
+        assert response.status_code == 200
+        assert set(response.get_json()) == {"a", "b"}
+
+    def test_search_batch_without_keywords(self, client):
+        """키워드 없이 배치 검색 시 400 테스트"""
+        assert client.post('/search/batch', json={"keywords": []}).status_code == 400
+        assert client.post('/search/batch', json={"keywords": "python"}).status_code == 400
+        assert client.post('/search/batch', json=["python"]).status_code == 400
+        assert client.post('/search/batch', json="python").status_code == 400
+        assert client.get('/search/batch').status_code == 400
+
+    def test_api_search_pagination(self, client):
+        """/api/search 가 캐시에서 요청한 페이지만 돌려주는지 테스트"""
+        main.db['python'] = [
+            {"title": f"Job {i}", "company": f"Company {i}", "link": f"/job/{i}"} for i in range(25)
+        ]
+
+        response = client.get('/api/search?keyword=python&offset=20&limit=10')
+
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data['total'] == 25
+        assert data['offset'] == 20
+        assert data['next_offset'] is None
+        assert [job['title'] for job in data['jobs']] == [f"Job {i}" for i in range(20, 25)]
+
+        first = client.get('/api/search?keyword=python').get_json()
+        assert len(first['jobs']) == main.DEFAULT_LIMIT
+        assert first['next_offset'] == main.DEFAULT_LIMIT
+
+    def test_api_search_field_selection(self, client, mock_job_data):
+        """fields 파라미터로 필요한 필드만 반환하는지 테스트"""
+        main.db['python'] = mock_job_data
+
+        data = client.get('/api/search?keyword=python&fields=title,link').get_json()
+
+        assert data['jobs'][0] == {"title": "Python Developer", "link": "/job/python-dev"}
+
+    def test_api_search_invalid_params(self, client, mock_job_data):
+        """잘못된 파라미터는 400 을 반환하는지 테스트"""
+        main.db['python'] = mock_job_data
+
+        assert client.get('/api/search').status_code == 400
+        assert client.get('/api/search?keyword=python&limit=0').status_code == 400
+        assert client.get(f'/api/search?keyword=python&limit={main.MAX_LIMIT + 1}').status_code == 400
+        assert client.get('/api/search?keyword=python&offset=-1').status_code == 400
+        assert client.get('/api/search?keyword=python&fields=bogus').status_code == 400
+
+    @patch('main.extract_web3_jobs')
+    @patch('main.extract_wework_jobs')
+    @patch('main.extract_berlin_jobs')
+    def test_api_search_extractor_error(self, mock_berlin, mock_wework, mock_web3, client, mock_job_data):
+        """스크래핑 중 에러가 나면 500 JSON 을 반환하는지 테스트"""
+        mock_web3.return_value = [mock_job_data[0]]
+        mock_wework.return_value = []
+        mock_berlin.side_effect = Exception("Network error")
+
+        response = client.get('/api/search?keyword=python')
+
+        assert response.status_code == 500
+        assert 'python' not in main.db
+
+    def test_search_etag_not_modified(self, client, mock_job_data):
+        """ETag 가 같으면 304 를 반환하는지 테스트"""
+        main.db['python'] = mock_job_data
+
+        first = client.get('/search?keyword=python')
+        etag = first.headers['ETag']
+        second = client.get('/search?keyword=python', headers={'If-None-Match': etag})
+
+        assert first.status_code == 200
+        assert second.status_code == 304
+        assert second.data == b''
+
+        # 결과가 바뀌면 ETag 도 바뀜
+        main.db['python'] = mock_job_data[:1]
+        third = client.get('/search?keyword=python', headers={'If-None-Match': etag})
+        assert third.status_code == 200
+        assert third.headers['ETag'] != etag
+
+    def test_search_uses_render_cache(self, client, mock_job_data):
+        """같은 버전의 결과는 다시 렌더링하지 않는지 테스트"""
+        main.db['render'] = mock_job_data
+
+        with patch('main.render_search', wraps=main.render_search) as mock_render:
+            main.render_cache.clear()
+            client.get('/search?keyword=render')
+            client.get('/search?keyword=render')
+            assert mock_render.call_count == 1
+
+            main.db['render'] = mock_job_data[:2]
+            client.get('/search?keyword=render')
+            assert mock_render.call_count == 2
+
+    def test_search_pagination(self, client):
+        """page 파라미터로 결과를 나눠서 보여주는지 테스트"""
+        main.db['paged'] = [
+            {"title": f"Job {i}", "company": f"Company {i}", "link": f"/job/{i}"} for i in range(main.PAGE_SIZE + 5)
+        ]
+
+        first = client.get('/search?keyword=paged&page=1')
+        second = client.get('/search?keyword=paged&page=2')
+
+        assert b'Job 0<' in first.data
+        assert f'Job {main.PAGE_SIZE}<'.encode() not in first.data
+        assert f'Job {main.PAGE_SIZE}<'.encode() in second.data
+        assert b'Page 2 / 2' in second.data
+        assert first.headers['ETag'] != second.headers['ETag']
+
+    def test_api_changes(self, client):
+        """since 버전 이후 추가/삭제된 공고만 돌려주는지 테스트"""
+        a = {"title": "A", "company": "X", "link": "/a"}
+        b = {"title": "B", "company": "Y", "link": "/b"}
+        c = {"title": "C", "company": "Z", "link": "/c"}
+        main.db['python'] = [a, b]
+        since = main.db.version('python')
+
+        with patch('main.extract_web3_jobs', return_value=[b, c]), \
+                patch('main.extract_wework_jobs', return_value=[]), \
+                patch('main.extract_berlin_jobs', return_value=[]):
+            response = client.get(f'/api/changes?keyword=python&since={since}&refresh=1')
+
+        data = response.get_json()
+        assert response.status_code == 200
+        assert data['full'] is False
+        assert data['added'] == [c]
+        assert data['removed'] == [a]
+        assert data['version'] == main.db.version('python')
+
+        # 최신 버전에서 물으면 변경 없음, 같은 ETag 면 304
+        latest = client.get(f"/api/changes?keyword=python&since={data['version']}")
+        assert latest.get_json()['added'] == []
+        again = client.get(f"/api/changes?keyword=python&since={data['version']}",
+                           headers={'If-None-Match': latest.headers['ETag']})
+        assert again.status_code == 304
+
+    def test_api_changes_unknown_since(self, client, mock_job_data):
+        """모르는 버전이면 전체 목록을 added 로 돌려주는지 테스트"""
+        main.db['python'] = mock_job_data
+
+        data = client.get('/api/changes?keyword=python&since=deadbeef').get_json()
+
+        assert data['full'] is True
+        assert data['added'] == mock_job_data
+        assert client.get('/api/changes').status_code == 400
+
+    def test_api_search_index_mode(self, client):
+        """mode=index 는 모아 둔 공고에서 찾고, 없으면 실제 스크래핑으로 넘어가는지 테스트"""
+        main.db['python'] = [
+            {"title": "Python Django Developer", "company": "A", "link": "/1"},
+            {"title": "Python Developer", "company": "B", "link": "/2"},
+        ]
+
+        with patch('main.scheduler.search') as mock_search:
+            data = client.get('/api/search?keyword=django&mode=index').get_json()
+            mock_search.assert_not_called()
+        assert data['mode'] == 'index'
+        assert [job['link'] for job in data['jobs']] == ["/1"]
+
+        with patch('main.scheduler.search', return_value=[]) as mock_search:
+            data = client.get('/api/search?keyword=rust&mode=index').get_json()
+            mock_search.assert_called_once()
+        assert data['mode'] == 'live'
+
+        assert client.get('/api/search?keyword=python&mode=nope').status_code == 400
+
+    def test_api_search_enrich(self, client, mock_job_data):
+        """enrich=1 이면 요청한 페이지의 공고에만 상세 정보를 붙이는지 테스트"""
+        import enrich
+        main.db['python'] = mock_job_data
+        fake = enrich.Enricher(fetch=lambda link: {"description": f"about {link}", "tags": ["python"]})
+
+        with patch('main.enrich.enricher', fake):
+            data = client.get('/api/search?keyword=python&limit=2&enrich=1').get_json()
+            picked = client.get('/api/search?keyword=python&limit=1&fields=title,salary').get_json()
+            plain = client.get('/api/search?keyword=python&limit=1').get_json()
+        fake.shutdown()
+
+        assert data['pending'] == 0
+        assert [job['description'] for job in data['jobs']] == ["about /job/python-dev", "about /job/backend-eng"]
+        assert data['jobs'][0]['tags'] == ["python"]
+        assert data['jobs'][0]['salary'] is None
+        assert len(fake.cache) == 2
+        assert picked['jobs'] == [{"title": "Python Developer", "salary": None}]
+        assert 'pending' not in plain and 'description' not in plain['jobs'][0]
+
+    def test_api_search_enrich_pending_not_cached(self, client, mock_job_data):
+        """상세 정보를 아직 못 받은 응답은 공유 캐시에 max-age 로 남지 않고 Retry-After 를 주는지 테스트"""
+        import enrich
+        main.db['python'] = mock_job_data
+        release = threading.Event()
+        slow = enrich.Enricher(fetch=lambda link: release.wait(5) and {})
+        wait_briefly = slow.enrich
+
+        with patch('main.enrich.enricher', slow), \
+                patch.object(slow, 'enrich', side_effect=lambda page: wait_briefly(page, wait=0.01)):
+            response = client.get('/api/search?keyword=python&limit=1&enrich=1')
+            revalidated = client.get('/api/search?keyword=python&limit=1&enrich=1',
+                                     headers={'If-None-Match': response.headers['ETag']})
+        release.set()
+        slow.shutdown()
+
+        assert response.get_json()['pending'] == 1
+        assert response.headers['Cache-Control'] == 'no-cache'
+        assert response.headers['Retry-After'] == '1'
+        assert revalidated.status_code == 304
+        assert revalidated.headers['Cache-Control'] == 'no-cache'
+
+    def test_search_async_task(self, client, mock_job_data):
+        """async=1 이면 작업 id 를 202 로 돌려주고 /tasks/<id> 로 결과를 확인하는지 테스트"""
+        release = threading.Event()
+
+        def slow(keyword):
+            release.wait(5)
+            return mock_job_data
+
+        with patch('main.sources', return_value=[("slow", slow)]):
+            response = client.get('/search?keyword=asyncjob&async=1')
+            assert response.status_code == 202
+            task = response.get_json()
+            assert task['status'] == 'running'
+            assert response.headers['Location'] == task['url']
+
+            assert client.get(task['url']).get_json()['status'] == 'running'
+            release.set()
+            done = client.get(f"{task['url']}?wait=5").get_json()
+            assert done['status'] == 'done'
+            assert done['total'] == 3
+            assert done['result'] == '/api/search?keyword=asyncjob'
+
+            stream = client.get(f"{task['url']}?stream=1")
+            assert stream.mimetype == 'text/event-stream'
+            assert stream.get_data(as_text=True).startswith('event: done\n')
+
+            # 끝난 뒤에는 wait 안에 결과가 나오므로 바로 렌더링
+            assert client.get('/search?keyword=asyncjob&wait=1').status_code == 200
+            assert client.get('/api/search?keyword=asyncjob&wait=1').get_json()['total'] == 3
+
+        assert client.get('/tasks/nope').status_code == 404
+
+    def test_cached_search_skips_task(self, client, mock_job_data):
+        """캐시에 있는 키워드는 wait 가 있어도 작업을 만들거나 저장하지 않는지 테스트"""
+        import tasks
+        main.db['cachedjob'] = mock_job_data
+        before = len(tasks.registry)
+
+        with patch.object(main.db, 'save_task') as save_task:
+            for _ in range(5):
+                assert client.get('/search?keyword=cachedjob&wait=2').status_code == 200
+            assert client.get('/api/search?keyword=cachedjob&wait=2').get_json()['total'] == 3
+
+        assert len(tasks.registry) == before
+        save_task.assert_not_called()
+
+    def test_search_wait_failure(self, client):
+        """작업이 wait 안에 실패하면 500 을 반환하는지 테스트"""
+        with patch('main.sources', return_value=[("bad", MagicMock(side_effect=RuntimeError("boom")))]):
+            assert client.get('/search?keyword=failjob&wait=5').status_code == 500
@@ -0,0 +1,119 @@
+import json
+import pytest
+from unittest.mock import patch, MagicMock
+import sys
+import os
+
+# 프로젝트 루트 디렉토리를 Python path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import metrics
+from metrics import Counter, Gauge, Histogram, Registry
+from extractors import berlin
+
+
+class TestMetrics:
+
+    def test_histogram_render(self):
+        """히스토그램이 누적 버킷 / sum / count 로 출력되는지 테스트"""
+        registry = Registry()
+        hist = registry.get_or_create(Histogram, "demo_seconds", "Demo", ("source",), buckets=(0.1, 1.0))
+        hist.observe(0.05, source="berlin")
+        hist.observe(0.5, source="berlin")
+        hist.observe(5, source="berlin")
+
+        text = registry.render()
+
+        assert '# TYPE demo_seconds histogram' in text
+        assert 'demo_seconds_bucket{source="berlin",le="0.1"} 1' in text
+        assert 'demo_seconds_bucket{source="berlin",le="1"} 2' in text
+        assert 'demo_seconds_bucket{source="berlin",le="+Inf"} 3' in text
+        assert 'demo_seconds_sum{source="berlin"} 5.55' in text
+        assert 'demo_seconds_count{source="berlin"} 3' in text
+
+    def test_counter_and_gauge(self):
+        """카운터 / 게이지 출력 테스트"""
+        registry = Registry()
+        counter = registry.get_or_create(Counter, "demo_total", "Demo", ("source",))
+        gauge = registry.get_or_create(Gauge, "demo_slots", "Demo")
+        counter.inc(source='we"work')
+        counter.inc(2, source='we"work')
+        gauge.set(3)
+        gauge.dec()
+
+        text = registry.render()
+
+        assert 'demo_total{source="we\\"work"} 3' in text
+        assert 'demo_slots 2' in text
+
+    def test_labels_must_match(self):
+        """정의하지 않은 라벨은 거부되는지 테스트"""
+        counter = Counter("demo_total", "Demo", ("source",))
+        with pytest.raises(ValueError):
+            counter.inc(stage="fetch")
+
+    def test_registry_returns_same_metric(self):
+        """같은 이름은 같은 메트릭을 돌려주고, 종류가 다르면 에러인지 테스트"""
+        registry = Registry()
+        first = registry.get_or_create(Counter, "demo_total", "Demo")
+        assert registry.get_or_create(Counter, "demo_total", "Demo") is first
+        with pytest.raises(ValueError):
+            registry.get_or_create(Gauge, "demo_total", "Demo")
+
+    def test_timed_records_on_error(self):
+        """예외가 나도 소요 시간이 기록되는지 테스트"""
+        before = metrics.stage_seconds.count(source="test", stage="boom")
+        with pytest.raises(RuntimeError):
+            with metrics.timed("test", "boom"):
+                raise RuntimeError("boom")
+        assert metrics.stage_seconds.count(source="test", stage="boom") == before + 1
+
+    @patch.object(berlin.scraper(), 'get')
+    def test_extractor_stages_recorded(self, mock_get):
+        """berlin 추출기가 fetch / parse / extract / total 단계를 기록하는지 테스트"""
+        from extractors.berlin import extract_berlin_jobs
+        mock_get.return_value = MagicMock(text="<html><body></body></html>")
+        stages = ("fetch", "parse", "extract", "total")
+        before = {stage: metrics.stage_seconds.count(source="berlin", stage=stage) for stage in stages}
+
+        extract_berlin_jobs("python")
+
+        for stage in stages:
+            assert metrics.stage_seconds.count(source="berlin", stage=stage) == before[stage] + 1
+
+    def test_metrics_endpoint(self):
+        """/metrics 가 Prometheus 텍스트 포맷을 반환하는지 테스트"""
+        import main
+        metrics.stage_seconds.observe(0.2, source="web3", stage="wait")
+
+        response = main.app.test_client().get('/metrics')
+
+        assert response.status_code == 200
+        assert response.mimetype == 'text/plain'
+        assert b'scrape_stage_seconds_bucket{source="web3",stage="wait",le="0.25"}' in response.data
+
+    def test_render_merges_workers(self, tmp_path):
+        """METRICS_DIR 의 워커별 스냅숏을 합치고, 끝난 워커의 게이지는 빼는지 테스트"""
+        counter = metrics.counter("demo_worker_requests_total", "Demo", ("route",))
+        gauge = metrics.gauge("demo_worker_busy", "Demo")
+        counter.inc(route="search")
+        gauge.set(1)
+
+        def other_worker(pid, requests, busy):
+            registry = Registry()
+            registry.get_or_create(Counter, "demo_worker_requests_total", "Demo", ("route",)).inc(requests, route="search")
+            registry.get_or_create(Gauge, "demo_worker_busy", "Demo").set(busy)
+            registry.get_or_create(Histogram, "demo_worker_seconds", "Demo", buckets=(1.0,)).observe(0.5)
+            (tmp_path / f"{pid}.json").write_text(json.dumps(registry.snapshot()))
+
+        dead = max(int(p) for p in os.listdir("/proc") if p.isdigit()) + 1000
+        other_worker(os.getppid(), 2, 3)
+        other_worker(dead, 4, 5)
+
+        text = metrics.render_workers(str(tmp_path))
+
+        assert (tmp_path / f"{os.getpid()}.json").exists()
+        assert f'demo_worker_requests_total{{route="search"}} {counter.value(route="search") + 6}' in text
+        assert 'demo_worker_busy 4' in text
+        assert 'demo_worker_seconds_count 2' in text
+        assert 'demo_worker_seconds_bucket{le="1"} 2' in text
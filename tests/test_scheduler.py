@@ -0,0 +1,234 @@
+import pytest
+import threading
+import time
+from unittest.mock import MagicMock
+import sys
+import os
+
+# 프로젝트 루트 디렉토리를 Python path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import scheduler
+
+
+class TestScheduler:
+
+    @pytest.fixture
+    def sources(self):
+        """소스별로 키워드를 제목에 담아 돌려주는 mock extractor"""
+        web3 = MagicMock(side_effect=lambda k: [{"title": f"web3 {k}", "company": "A", "link": f"/web3/{k}"}])
+        wework = MagicMock(side_effect=lambda k: [{"title": f"wework {k}", "company": "B", "link": f"/wework/{k}"}])
+        berlin = MagicMock(side_effect=lambda k: [{"title": f"berlin {k}", "company": "C", "link": f"/berlin/{k}"}])
+        return [("web3", web3), ("wework", wework), ("berlin", berlin)]
+
+    def test_search_batch_combines_sources_in_order(self, sources):
+        """키워드별로 web3 → wework → berlin 순서로 합쳐지는지 테스트"""
+        cache = {}
+        results = scheduler.search_batch(["python", "java"], sources, cache)
+
+        assert list(results) == ["python", "java"]
+        titles = [job["title"] for job in results["python"]["jobs"]]
+        assert titles == ["web3 python", "wework python", "berlin python"]
+        assert results["java"]["cached"] is False
+        assert cache["java"] == results["java"]["jobs"]
+
+    def test_search_batch_uses_cache(self, sources):
+        """캐시에 있는 키워드는 스크래핑하지 않는지 테스트"""
+        cache = {"python": [{"title": "cached", "company": "X", "link": "/x"}]}
+        results = scheduler.search_batch(["python"], sources, cache)
+
+        assert results["python"] == {"jobs": cache["python"], "cached": True}
+        for _, extractor in sources:
+            extractor.assert_not_called()
+
+    def test_search_batch_deduplicates_keywords(self, sources):
+        """중복 키워드는 한 번만 스크래핑하는지 테스트"""
+        results = scheduler.search_batch(["go", "go", "go"], sources, {})
+
+        assert list(results) == ["go"]
+        for _, extractor in sources:
+            extractor.assert_called_once_with("go")
+
+    def test_search_batch_reports_error_per_keyword(self, sources):
+        """한 키워드가 실패해도 다른 키워드 결과는 반환되는지 테스트"""
+        sources[0][1].side_effect = lambda k: (_ for _ in ()).throw(Exception("boom")) if k == "bad" else []
+        cache = {}
+        results = scheduler.search_batch(["bad", "good"], sources, cache)
+
+        assert results["bad"] == {"error": "boom"}
+        assert "bad" not in cache
+        assert results["good"]["cached"] is False
+
+    def test_search_batch_too_many_keywords(self, sources):
+        """최대 개수를 넘는 배치는 거부되는지 테스트"""
+        keywords = [f"k{i}" for i in range(scheduler.MAX_BATCH + 1)]
+        with pytest.raises(ValueError):
+            scheduler.search_batch(keywords, sources, {})
+
+    def test_submit_shares_inflight_future(self):
+        """진행 중인 같은 작업은 Future 를 공유하는지 테스트"""
+        release = threading.Event()
+        extractor = MagicMock(side_effect=lambda k: release.wait(5) and [])
+
+        first = scheduler.submit("rust", "web3", extractor)
+        second = scheduler.submit("rust", "web3", extractor)
+        release.set()
+
+        assert first is second
+        assert first.result(timeout=5) == []
+        extractor.assert_called_once_with("rust")
+
+    def test_refresh_ignores_cache(self, sources):
+        """refresh 는 캐시에 있어도 다시 스크래핑하는지 테스트"""
+        cache = {"python": []}
+        jobs = scheduler.refresh("python", sources, cache)
+
+        assert len(jobs) == 3
+        assert cache["python"] == jobs
+        for _, extractor in sources:
+            extractor.assert_called_once_with("python")
+
+    def test_refresh_failure_serves_cached(self, sources):
+        """다시 스크래핑하다 실패하면 캐시에 있던 결과를 돌려주는지 테스트"""
+        sources[0][1].side_effect = Exception("browser busy")
+        cached = [{"title": "old", "company": "A", "link": "/old"}]
+        cache = {"python": cached}
+
+        assert scheduler.refresh("python", sources, cache) == cached
+        with pytest.raises(Exception):
+            scheduler.refresh("java", sources, {})
+
+
+class TestPriorityExecutor:
+
+    @pytest.fixture
+    def gate(self):
+        """워커 하나를 붙잡아 두는 작업, set() 하면 끝남"""
+        return threading.Event()
+
+    def run_order(self, executor, gate, submissions):
+        order = []
+        executor.submit(gate.wait, 5)
+        futures = [executor.submit(order.append, name, priority=priority) for name, priority in submissions]
+        gate.set()
+        for future in futures:
+            future.result(timeout=5)
+        return order
+
+    def test_higher_class_first(self, gate):
+        """대기열에서는 interactive > batch > prefetch 순서로 꺼내는지 테스트"""
+        executor = scheduler.PriorityExecutor(1, reserved=0)
+
+        order = self.run_order(executor, gate, [
+            ("prefetch", scheduler.PREFETCH),
+            ("batch", scheduler.BATCH),
+            ("interactive", scheduler.INTERACTIVE),
+            ("interactive 2", scheduler.INTERACTIVE),
+        ])
+
+        assert order == ["interactive", "interactive 2", "batch", "prefetch"]
+        executor.shutdown()
+
+    def test_aging_prevents_starvation(self, gate):
+        """오래 기다린 낮은 클래스 작업은 나중에 들어온 높은 클래스보다 먼저 꺼내는지 테스트"""
+        executor = scheduler.PriorityExecutor(1, reserved=0, aging=0.05)
+        order = []
+        executor.submit(gate.wait, 5)
+        old = executor.submit(order.append, "prefetch", priority=scheduler.PREFETCH)
+        time.sleep(0.2)
+        new = executor.submit(order.append, "interactive", priority=scheduler.INTERACTIVE)
+        gate.set()
+        old.result(timeout=5)
+        new.result(timeout=5)
+
+        assert order == ["prefetch", "interactive"]
+        executor.shutdown()
+
+    def test_reserved_slot_for_interactive(self):
+        """batch 가 워커를 다 차지하지 못하고 남겨 둔 워커에서 interactive 가 바로 도는지 테스트"""
+        executor = scheduler.PriorityExecutor(2, reserved=1)
+        release = threading.Event()
+        started = []
+
+        def slow(name):
+            started.append(name)
+            release.wait(5)
+
+        batch = [executor.submit(slow, f"batch {i}", priority=scheduler.BATCH) for i in range(2)]
+        interactive = executor.submit(lambda: "ok", priority=scheduler.INTERACTIVE)
+
+        assert interactive.result(timeout=5) == "ok"
+        assert started == ["batch 0"]
+        release.set()
+        for future in batch:
+            future.result(timeout=5)
+        executor.shutdown()
+
+    def test_promote_queued(self, gate):
+        """대기 중인 prefetch 작업을 interactive 로 올리면 batch 보다 먼저 도는지 테스트"""
+        executor = scheduler.PriorityExecutor(1, reserved=0)
+        order = []
+        executor.submit(gate.wait, 5)
+        batch = executor.submit(order.append, "batch", priority=scheduler.BATCH)
+        prefetch = executor.submit(order.append, "prefetch", priority=scheduler.PREFETCH)
+
+        assert executor.promote(prefetch, scheduler.INTERACTIVE)
+        assert not executor.promote(prefetch, scheduler.BATCH)
+        gate.set()
+        batch.result(timeout=5)
+        prefetch.result(timeout=5)
+
+        assert order == ["prefetch", "batch"]
+        executor.shutdown()
+
+    def test_queue_metrics(self, gate):
+        """클래스별 대기 시간과 대기열 길이를 기록하는지 테스트"""
+        executor = scheduler.PriorityExecutor(1, reserved=0)
+        waited = scheduler.queue_wait.count(priority=scheduler.PREFETCH)
+        depth = scheduler.queue_depth.value(priority=scheduler.PREFETCH)
+
+        executor.submit(gate.wait, 5)
+        future = executor.submit(lambda: None, priority=scheduler.PREFETCH)
+        assert scheduler.queue_depth.value(priority=scheduler.PREFETCH) == depth + 1
+        gate.set()
+        future.result(timeout=5)
+
+        assert scheduler.queue_depth.value(priority=scheduler.PREFETCH) == depth
+        assert scheduler.queue_wait.count(priority=scheduler.PREFETCH) == waited + 1
+        executor.shutdown()
+
+    def test_errors_and_cancel(self, gate):
+        """예외는 Future 로 전달하고, shutdown(cancel_futures=True) 는 대기 작업을 취소하는지 테스트"""
+        executor = scheduler.PriorityExecutor(1, reserved=0)
+        failing = executor.submit(lambda: 1 / 0)
+        with pytest.raises(ZeroDivisionError):
+            failing.result(timeout=5)
+
+        executor.submit(gate.wait, 5)
+        queued = executor.submit(lambda: None, priority=scheduler.BATCH)
+        executor.shutdown(wait=False, cancel_futures=True)
+        gate.set()
+
+        assert queued.cancelled()
+        with pytest.raises(RuntimeError):
+            executor.submit(lambda: None)
+        with pytest.raises(ValueError):
+            scheduler.PriorityExecutor(1).submit(lambda: None, priority="urgent")
+
+    def test_search_promotes_inflight(self, gate):
+        """미리 읽기로 대기 중인 키워드를 검색하면 같은 Future 를 interactive 로 올리는지 테스트"""
+        executor = scheduler.PriorityExecutor(1, reserved=0)
+        extractor = MagicMock(return_value=[])
+        original = scheduler._executor
+        scheduler._executor = executor
+        try:
+            executor.submit(gate.wait, 5)
+            background = scheduler.submit("promote-me", "web3", extractor, scheduler.PREFETCH)
+            assert scheduler.submit("promote-me", "web3", extractor) is background
+            assert executor._queued[background].priority == scheduler.INTERACTIVE
+            gate.set()
+            assert background.result(timeout=5) == []
+        finally:
+            scheduler._inflight.pop(("promote-me", "web3"), None)
+            scheduler._executor = original
+            executor.shutdown()
@@ -0,0 +1,86 @@
+import sys
+import os
+
+# 프로젝트 루트 디렉토리를 Python path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from search_index import SearchIndex, tokenize
+from store import JobStore
+
+
+def job(title, company, link):
+    return {"title": title, "company": company, "link": link}
+
+
+class TestSearchIndex:
+
+    def test_tokenize(self):
+        """소문자로 바꾸고 C++ / C# 같은 단어를 유지하는지 테스트"""
+        assert tokenize("Senior C++ / Node.js Developer") == ["senior", "c++", "node", "js", "developer"]
+        assert tokenize("C# Engineer") == ["c#", "engineer"]
+        assert tokenize(None) == []
+
+    def test_multi_term_and_ranking(self):
+        """모든 단어를 포함하는 공고만, 제목에 맞는 단어가 많은 순으로 찾는지 테스트"""
+        index = SearchIndex()
+        index.update("python", [
+            job("Backend Engineer", "Python Labs", "/1"),
+            job("Python Backend Engineer", "Acme", "/2"),
+            job("Python Developer", "Acme", "/3"),
+        ])
+
+        assert [j["link"] for j in index.search("python backend")] == ["/2", "/1"]
+        assert [j["link"] for j in index.search("ACME")] == ["/2", "/3"]
+        assert index.search("rust") == []
+        assert index.search("  ") == []
+        assert len(index.search("python", limit=1)) == 1
+
+    def test_incremental_update(self):
+        """키워드 결과가 바뀌면 빠진 공고는 색인에서 지우는지 테스트"""
+        index = SearchIndex()
+        index.update("python", [job("Python Developer", "A", "/1"), job("Django Developer", "B", "/2")])
+        index.update("python", [job("Python Developer", "A", "/1"), job("Flask Developer", "C", "/3")])
+
+        assert index.search("django") == []
+        assert [j["link"] for j in index.search("flask")] == ["/3"]
+        assert len(index) == 2
+
+    def test_shared_job_kept_until_last_keyword(self):
+        """여러 키워드에 있는 공고는 마지막 키워드가 빠질 때 지우는지 테스트"""
+        index = SearchIndex()
+        shared = job("Python Go Developer", "A", "/1")
+        index.update("python", [shared])
+        index.update("go", [shared])
+
+        index.remove("python")
+        assert index.search("developer") == [shared]
+        index.remove("go")
+        assert index.search("developer") == []
+        assert len(index) == 0
+
+    def test_changed_job_is_reindexed(self):
+        """같은 link 의 제목이 바뀌면 새 제목으로 찾아지는지 테스트"""
+        index = SearchIndex()
+        index.update("python", [job("Python Developer", "A", "/1")])
+        index.update("python", [job("Rust Developer", "A", "/1")])
+
+        assert index.search("python") == []
+        assert index.search("rust")[0]["title"] == "Rust Developer"
+
+    def test_sync_only_changed_keywords(self):
+        """저장소와 동기화할 때 버전이 바뀐 키워드만 다시 색인하는지 테스트"""
+        store = JobStore()
+        store["python"] = [job("Python Developer", "A", "/1")]
+        store["go"] = [job("Go Developer", "B", "/2")]
+        index = SearchIndex()
+        index.sync(store)
+        generation = index.generation
+
+        index.sync(store)
+        assert index.generation == generation
+
+        store["go"] = [job("Go Engineer", "B", "/2")]
+        del store["python"]
+        index.sync(store)
+        assert index.search("python") == []
+        assert [j["title"] for j in index.search("go")] == ["Go Engineer"]
@@ -0,0 +1,258 @@
+import pytest
+import sys
+import os
+
+# 프로젝트 루트 디렉토리를 Python path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from store import JobStore, SQLiteJobStore, RenderCache, create_store, diff_jobs, jobs_version, merge_changes
+
+
+class TestJobStore:
+
+    @pytest.fixture
+    def jobs(self):
+        """테스트용 job 데이터"""
+        return [
+            {"title": "Python Developer", "company": "TechCorp", "link": "/job/python-dev"},
+            {"title": "Backend Engineer", "company": "StartupXYZ", "link": "/job/backend-eng"},
+        ]
+
+    def test_behaves_like_dict(self, jobs):
+        """dict 처럼 저장/조회/삭제되는지 테스트"""
+        store = JobStore()
+        store['python'] = jobs
+
+        assert 'python' in store
+        assert store['python'] == jobs
+        assert len(store) == 1
+        assert list(store) == ['python']
+
+        store.clear()
+        assert len(store) == 0
+        assert store.version('python') is None
+
+    def test_version_follows_content(self, jobs):
+        """내용이 같으면 버전이 같고, 바뀌면 버전도 바뀌는지 테스트"""
+        store = JobStore()
+        store['python'] = jobs
+        first = store.version('python')
+
+        store['python'] = list(jobs)
+        assert store.version('python') == first == jobs_version(jobs)
+
+        store['python'] = jobs[:1]
+        assert store.version('python') != first
+        assert store.versions() == {'python': jobs_version(jobs[:1])}
+
+
+    def test_changes_since_version(self, jobs):
+        """결과가 바뀔 때마다 link 기준 추가/삭제가 기록되는지 테스트"""
+        store = JobStore()
+        store['python'] = jobs[:1]
+        v1 = store.version('python')
+        store['python'] = jobs[:1]  # 내용이 같으면 기록하지 않음
+        store['python'] = jobs[1:]
+        v2 = store.version('python')
+
+        assert len(store.changes('python')) == 2
+        assert store.changes('python', v2) == []
+        [change] = store.changes('python', v1)
+        assert change['previous'] == v1
+        assert change['added'] == jobs[1:]
+        assert change['removed'] == jobs[:1]
+        assert store.changes('python', 'unknown') is None
+
+        del store['python']
+        assert store.changes('python') == []
+
+
+    def test_hottest_keywords(self, jobs):
+        """캐시에 있는 키워드 중 많이 검색된 순으로 돌려주는지 테스트"""
+        store = JobStore()
+        store['python'] = jobs
+        store['go'] = jobs
+        for keyword in ['go', 'python', 'python', 'rust', 'rust', 'rust']:
+            store.hit(keyword)
+
+        assert store.hottest(5) == ['python', 'go']
+        assert store.hottest(1) == ['python']
+
+
+class TestChanges:
+
+    def test_diff_by_link(self):
+        """link 가 같으면 같은 공고로 보는지 테스트"""
+        old = [{"title": "A", "link": "/a"}, {"title": "B", "link": "/b"}]
+        new = [{"title": "B (edited)", "link": "/b"}, {"title": "C", "link": "/c"}]
+
+        added, removed = diff_jobs(old, new)
+        assert added == [{"title": "C", "link": "/c"}]
+        assert removed == [{"title": "A", "link": "/a"}]
+        assert diff_jobs(None, new) == (new, [])
+
+    def test_merge_changes(self):
+        """추가됐다가 사라진 공고는 합친 결과에서 빠지는지 테스트"""
+        a, b, c = ({"link": link} for link in ("/a", "/b", "/c"))
+        changes = [
+            {"added": [a, b], "removed": []},
+            {"added": [c], "removed": [a]},
+            {"added": [a], "removed": [b]},
+        ]
+
+        added, removed = merge_changes(changes)
+        assert sorted(j["link"] for j in added) == ["/a", "/c"]
+        assert removed == []
+
+    def test_changes_trimmed(self, monkeypatch):
+        """오래된 기록이 잘리면 그 이전 버전은 None (전체 목록 필요)"""
+        monkeypatch.setattr("store.MAX_CHANGES", 2)
+        store = JobStore()
+        versions = []
+        for i in range(4):
+            store['python'] = [{"link": f"/{i}"}]
+            versions.append(store.version('python'))
+
+        assert len(store.changes('python')) == 2
+        assert store.changes('python', versions[0]) is None
+        # 남은 기록의 가장 오래된 이전 버전에서는 이어서 받을 수 있음
+        assert len(store.changes('python', versions[1])) == 2
+
+
+class TestSQLiteJobStore:
+
+    @pytest.fixture
+    def jobs(self):
+        """테스트용 job 데이터"""
+        return [{"title": "Python Developer", "company": "TechCorp", "link": "/job/python-dev"}]
+
+    def test_shared_between_instances(self, tmp_path, jobs):
+        """같은 파일을 여는 두 store(워커)가 결과를 공유하는지 테스트"""
+        path = str(tmp_path / "jobs.db")
+        worker1 = SQLiteJobStore(path)
+        worker2 = SQLiteJobStore(path)
+
+        worker1['python'] = jobs
+
+        assert 'python' in worker2
+        assert worker2['python'] == jobs
+        assert worker2.version('python') == worker1.version('python') == jobs_version(jobs)
+        assert list(worker2) == ['python']
+        assert len(worker2) == 1
+        assert worker2.versions() == {'python': jobs_version(jobs)}
+
+    def test_update_and_delete(self, tmp_path, jobs):
+        """갱신/삭제가 다른 인스턴스에도 반영되는지 테스트"""
+        path = str(tmp_path / "jobs.db")
+        worker1 = SQLiteJobStore(path)
+        worker2 = SQLiteJobStore(path)
+        worker1['python'] = jobs
+        assert worker2['python'] == jobs
+
+        worker1['python'] = []
+        assert worker2['python'] == []
+
+        del worker2['python']
+        assert 'python' not in worker1
+        with pytest.raises(KeyError):
+            worker1['python']
+        with pytest.raises(KeyError):
+            del worker1['python']
+
+    def test_changes_shared_between_instances(self, tmp_path, jobs):
+        """한 워커가 기록한 변경분을 다른 워커에서 읽을 수 있는지 테스트"""
+        path = str(tmp_path / "jobs.db")
+        worker1 = SQLiteJobStore(path)
+        worker2 = SQLiteJobStore(path)
+        worker1['python'] = jobs
+        v1 = worker1.version('python')
+        new_job = {"title": "Go Developer", "company": "GoCorp", "link": "/job/go-dev"}
+        worker2['python'] = jobs + [new_job]
+
+        [change] = worker1.changes('python', v1)
+        assert change['added'] == [new_job]
+        assert change['removed'] == []
+        assert worker1.changes('python', worker2.version('python')) == []
+
+        worker1.clear()
+        assert worker2.changes('python') == []
+
+    def test_hottest_shared_between_instances(self, tmp_path, jobs):
+        """여러 워커의 검색 횟수를 합쳐서 인기 키워드를 고르는지 테스트"""
+        path = str(tmp_path / "jobs.db")
+        worker1 = SQLiteJobStore(path)
+        worker2 = SQLiteJobStore(path)
+        worker1['python'] = jobs
+        worker1['go'] = jobs
+        worker1.hit('go')
+        worker2.hit('python')
+        worker2.hit('python')
+        worker2.hit('rust')
+        # 다른 워커의 검색 횟수는 그 워커가 쓴 뒤에 보임
+        worker2.flush_hits()
+
+        assert worker1.hottest(5) == ['python', 'go']
+
+    def test_hits_batched(self, tmp_path, jobs):
+        """검색 횟수를 요청마다 쓰지 않고 모아서 한 번에 쓰는지 테스트"""
+        path = str(tmp_path / "jobs.db")
+        worker = SQLiteJobStore(path, hit_interval=3600, hit_batch=3)
+        reader = SQLiteJobStore(path)
+        worker['python'] = jobs
+        worker['go'] = jobs
+
+        worker.hit('go')
+        worker.hit('python')
+        assert reader.hottest(5) == []
+
+        worker.hit('python')
+        assert reader.hottest(5) == ['python', 'go']
+
+        worker.hit('go')
+        worker.hit('go')
+        assert worker.hottest(5) == ['go', 'python']
+
+    def test_clear(self, tmp_path, jobs):
+        """clear 테스트"""
+        store = SQLiteJobStore(str(tmp_path / "jobs.db"))
+        store['a'] = jobs
+        store['b'] = jobs
+        store.clear()
+        assert len(store) == 0
+
+
+class TestCreateStore:
+
+    def test_backends(self, tmp_path):
+        """설정값에 맞는 백엔드를 만드는지 테스트"""
+        assert isinstance(create_store(None), JobStore)
+        assert isinstance(create_store("memory"), JobStore)
+        store = create_store(f"sqlite:///{tmp_path}/nested/jobs.db")
+        assert isinstance(store, SQLiteJobStore)
+        assert os.path.exists(tmp_path / "nested" / "jobs.db")
+        with pytest.raises(ValueError):
+            create_store("redis://localhost")
+
+
+class TestRenderCache:
+
+    def test_hit_requires_same_version(self):
+        """버전이 다르면 캐시 미스가 되는지 테스트"""
+        cache = RenderCache()
+        cache.set(('python', None), 'v1', '<html>v1</html>')
+
+        assert cache.get(('python', None), 'v1') == '<html>v1</html>'
+        assert cache.get(('python', None), 'v2') is None
+        assert cache.get(('python', 1), 'v1') is None
+
+    def test_evicts_least_recently_used(self):
+        """최대 개수를 넘으면 가장 오래 안 쓴 항목이 제거되는지 테스트"""
+        cache = RenderCache(max_entries=2)
+        cache.set('a', 'v', 'A')
+        cache.set('b', 'v', 'B')
+        cache.get('a', 'v')
+        cache.set('c', 'v', 'C')
+
+        assert cache.get('a', 'v') == 'A'
+        assert cache.get('b', 'v') is None
+        assert cache.get('c', 'v') == 'C'
@@ -0,0 +1,106 @@
+import pytest
+import threading
+from unittest.mock import MagicMock
+import sys
+import os
+
+# 프로젝트 루트 디렉토리를 Python path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import tasks
+from tasks import TaskRegistry
+from store import SQLiteJobStore
+
+
+class TestTaskRegistry:
+
+    @pytest.fixture
+    def release(self):
+        return threading.Event()
+
+    @pytest.fixture
+    def sources(self, release):
+        """release 될 때까지 끝나지 않는 mock extractor"""
+        def slow(k):
+            release.wait(5)
+            return [{"title": f"slow {k}", "company": "A", "link": f"/slow/{k}"}]
+        fast = MagicMock(side_effect=lambda k: [{"title": f"fast {k}", "company": "B", "link": f"/fast/{k}"}])
+        return [("slow", slow), ("fast", fast)]
+
+    def test_task_runs_without_waiting_thread(self, sources, release):
+        """작업을 넘기면 바로 돌아오고, 모든 소스가 끝나면 결과를 캐시에 넣는지 테스트"""
+        registry = TaskRegistry()
+        cache = {}
+
+        task = registry.submit("tasks-python", sources, cache)
+
+        assert not task.wait(0.05)
+        assert task.to_dict()["status"] == tasks.RUNNING
+        assert registry.get(task.id) is task
+        release.set()
+        assert task.wait(5)
+        assert task.status == tasks.DONE
+        assert [job["title"] for job in task.result()] == ["slow tasks-python", "fast tasks-python"]
+        assert cache["tasks-python"] == task.result()
+        assert task.to_dict()["total"] == 2
+
+    def test_same_keyword_shares_task(self, sources, release):
+        """같은 키워드가 돌고 있으면 같은 작업을 돌려주고, 캐시에 있으면 바로 끝난 작업인지 테스트"""
+        registry = TaskRegistry()
+        cache = {}
+
+        first = registry.submit("tasks-go", sources, cache)
+        assert registry.submit("tasks-go", sources, cache) is first
+        release.set()
+        first.wait(5)
+
+        cached = registry.submit("tasks-go", sources, cache)
+        assert cached is not first
+        assert cached.done()
+        assert cached.result() == first.result()
+        sources[1][1].assert_called_once_with("tasks-go")
+
+    def test_failed_task(self, sources, release):
+        """소스가 실패하면 작업이 failed 가 되고 result() 가 예외를 내는지 테스트"""
+        registry = TaskRegistry()
+        sources[1][1].side_effect = RuntimeError("boom")
+        release.set()
+
+        task = registry.submit("tasks-fail", sources, {})
+
+        assert task.wait(5)
+        assert task.status == tasks.FAILED
+        assert task.to_dict()["error"] == "boom"
+        with pytest.raises(RuntimeError):
+            task.result()
+
+    def test_prunes_finished_tasks(self, sources, release):
+        """기억해 둘 수를 넘으면 오래된 끝난 작업부터 버리는지 테스트"""
+        registry = TaskRegistry(max_tasks=2)
+        cache = {"a": [], "b": [], "c": []}
+
+        a = registry.submit("a", sources, cache)
+        registry.submit("b", sources, cache)
+        c = registry.submit("c", sources, cache)
+
+        assert len(registry) == 2
+        assert registry.get(a.id) is None
+        assert registry.get(c.id) is c
+
+    def test_poll_from_other_worker(self, sources, release, tmp_path):
+        """다른 워커(레지스트리)에서도 같은 저장소를 통해 작업 상태를 보고 기다릴 수 있는지 테스트"""
+        store = SQLiteJobStore(str(tmp_path / "jobs.db"))
+        worker_a, worker_b = TaskRegistry(), TaskRegistry()
+
+        task = worker_a.submit("tasks-shared", sources, store)
+        seen = worker_b.get(task.id, SQLiteJobStore(store.path))
+
+        assert seen is not None and seen is not task
+        assert seen.to_dict()["status"] == tasks.RUNNING
+        assert not seen.wait(0.05)
+        release.set()
+        assert seen.wait(5)
+        assert seen.status == tasks.DONE
+        assert seen.to_dict()["total"] == 2
+        assert worker_b.get("unknown", store) is None
+        assert worker_b.get(task.id) is None
@@ -0,0 +1,125 @@
+import pytest
+from unittest.mock import MagicMock, patch
+import sys
+import os
+
+# 프로젝트 루트 디렉토리를 Python path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import warmup
+from extractors import berlin, web3, wework
+from extractors import browser
+from extractors.browser import BrowserPool, browser_pool, governor
+from search_index import SearchIndex
+from store import JobStore
+
+
+def live_driver():
+    driver = MagicMock()
+    driver.service.process.poll.return_value = None
+    return driver
+
+
+class TestWarmup:
+
+    @pytest.fixture
+    def store(self):
+        """인기 키워드가 집계된 저장소"""
+        store = JobStore()
+        store['python'] = [{"title": "Python Developer", "company": "A", "link": "/1"}]
+        store['go'] = [{"title": "Go Developer", "company": "B", "link": "/2"}]
+        for keyword in ['python', 'python', 'go', 'rust']:
+            store.hit(keyword)
+        return store
+
+    def test_load_hot_keywords(self, store):
+        """많이 검색된 키워드부터 검색 색인에 올리는지 테스트"""
+        index = SearchIndex()
+
+        assert warmup.load_hot_keywords(store, index, 1) == 1
+        assert [j['link'] for j in index.search("developer")] == ["/1"]
+
+    def test_open_connections(self):
+        """세 사이트의 첫 페이지로 연결을 열어 두는지 테스트"""
+        with patch.object(berlin.scraper(), 'head') as berlin_head, \
+                patch.object(wework.scraper(), 'head') as wework_head, \
+                patch.object(web3.scraper(), 'head', side_effect=Exception("timeout")):
+            assert warmup.open_connections() == 2
+
+        berlin_head.assert_called_once()
+        assert wework_head.call_args.args[0] == "https://weworkremotely.com/"
+
+    def test_prespawn_browsers_limited_by_slots(self):
+        """브라우저 슬롯 수보다 많이 띄우지 않는지 테스트"""
+        drivers = [live_driver() for _ in range(governor.slots + 2)]
+        try:
+            with patch.object(web3, 'new_driver', side_effect=drivers):
+                assert warmup.prespawn_browsers(governor.slots + 2) == governor.slots
+            assert browser_pool.take() is drivers[governor.slots - 1]
+        finally:
+            browser_pool.close()
+
+    def test_web3_uses_prespawned_browser(self):
+        """미리 띄운 브라우저가 있으면 새로 띄우지 않는지 테스트"""
+        driver = live_driver()
+        driver.execute_script.return_value = "[]"
+        browser_pool.put(driver)
+        with patch.object(web3, 'new_driver') as new_driver, patch.object(web3.time, 'sleep'):
+            assert web3.extract_web3_jobs("solidity") == []
+
+        new_driver.assert_not_called()
+        driver.quit.assert_called_once()
+        assert len(browser_pool) == 0
+
+    def test_pool_skips_dead_browser(self):
+        """꺼낼 때 이미 죽은 브라우저는 종료하고 다음 브라우저를 주는지 테스트"""
+        pool = BrowserPool()
+        alive, dead = live_driver(), live_driver()
+        dead.service.process.poll.return_value = 1
+        pool.put(alive)
+        pool.put(dead)
+        before = browser.discarded.value(reason="dead")
+
+        assert pool.take() is alive
+        assert pool.take() is None
+        dead.quit.assert_called_once()
+        assert browser.discarded.value(reason="dead") == before + 1
+
+    def test_pool_max_idle(self):
+        """오래 대기한 브라우저는 꺼내지 않고 정리하는지 테스트"""
+        now = [0.0]
+        pool = BrowserPool(max_idle=60, clock=lambda: now[0])
+        old, fresh = live_driver(), live_driver()
+        pool.put(old)
+        now[0] = 50
+        pool.put(fresh)
+        now[0] = 100
+
+        assert pool.prune() == 1
+        old.quit.assert_called_once()
+        assert pool.take() is fresh
+
+        pool.put(old)
+        now[0] = 200
+        assert pool.take() is None
+        assert len(pool) == 0
+
+    def test_run_continues_after_failed_step(self, store):
+        """한 단계가 실패해도 나머지 단계를 진행하는지 테스트"""
+        with patch.object(warmup, 'resolve_driver', side_effect=Exception("offline")), \
+                patch.object(warmup, 'open_connections', return_value=3):
+            report = warmup.run(store, SearchIndex(), browsers=0, hot_keywords=5)
+
+        assert report['driver']['result'] is None
+        assert report['connections']['result'] == 3
+        assert report['hot_keywords']['result'] == 2
+
+    def test_start_is_opt_in(self, store):
+        """JOBSCRAPER_WARMUP 이 꺼져 있으면 스레드를 띄우지 않는지 테스트"""
+        with patch.object(warmup, 'ENABLED', False):
+            assert warmup.start(store) is None
+
+        with patch.object(warmup, 'run') as run:
+            thread = warmup.start(store, delay=0, force=True, browsers=0)
+            thread.join(5)
+        run.assert_called_once_with(store, None, browsers=0)
@@ -1,7 +1,7 @@
 import pytest
+import json
 from unittest.mock import patch, MagicMock, call
 from selenium.common.exceptions import WebDriverException, TimeoutException
-from selenium.webdriver.common.by import By
 import sys
 import os
 import time
@@ -9,50 +9,39 @@ import time
 # 프로젝트 루트 디렉토리를 Python path에 추가
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from extractors.web3 import extract_web3_jobs, BASE_URL
+from extractors import web3
+from extractors.web3 import extract_web3_jobs, BASE_URL, HEADERS, JOBS_SCRIPT, TIMEOUT
+from extractors.browser import BrowserBusy
 
 
 class TestWeb3Jobs:
     
     @pytest.fixture
     def mock_web_elements(self):
-        """mock WebElement 객체들을 생성하는 fixture"""
-        # Title elements
-        title1 = MagicMock()
-        title1.text = "Senior Blockchain Developer"
-        title2 = MagicMock()
-        title2.text = "Smart Contract Engineer"
-        
-        # Company elements
-        company1 = MagicMock()
-        company1.text = "CryptoTech Corp"
-        company2 = MagicMock()
-        company2.text = "Web3 Solutions"
-        
-        # Link elements
-        link1 = MagicMock()
-        link1.get_attribute.return_value = "https://web3.career/job/blockchain-dev"
-        link2 = MagicMock()
-        link2.get_attribute.return_value = "https://web3.career/job/smart-contract"
-        
-        return {
-            'titles': [title1, title2],
-            'companies': [company1, company2],
-            'links': [link1, link2]
-        }
+        """JOBS_SCRIPT 가 돌려주는 공고 행 JSON 을 생성하는 fixture"""
+        return json.dumps([
+            {
+                "jobid": "101",
+                "title": "Senior Blockchain Developer",
+                "company": "CryptoTech Corp",
+                "link": "https://web3.career/job/blockchain-dev",
+            },
+            {
+                "jobid": "102",
+                "title": "Smart Contract Engineer",
+                "company": "Web3 Solutions",
+                "link": "https://web3.career/job/smart-contract",
+            },
+        ])
     
     @pytest.fixture
     def mock_empty_elements(self):
         """빈 결과를 위한 fixture"""
-        return {
-            'titles': [],
-            'companies': [],
-            'links': []
-        }
+        return "[]"
     
     @patch('extractors.web3.time.sleep')
-    @patch('extractors.web3.ChromeDriverManager')
-    @patch('extractors.web3.webdriver.Chrome')
+    @patch('webdriver_manager.chrome.ChromeDriverManager')
+    @patch('selenium.webdriver.Chrome')
     def test_extract_web3_jobs_success(self, mock_chrome, mock_driver_manager, mock_sleep, mock_web_elements):
         """정상적인 경우 테스트"""
         # Mock ChromeDriverManager
@@ -62,12 +51,8 @@ class TestWeb3Jobs:
         mock_driver = MagicMock()
         mock_chrome.return_value = mock_driver
         
-        # Mock find_elements 반환값 설정
-        mock_driver.find_elements.side_effect = [
-            mock_web_elements['titles'],
-            mock_web_elements['companies'],
-            mock_web_elements['links']
-        ]
+        # Mock execute_script 반환값 설정
+        mock_driver.execute_script.return_value = mock_web_elements
         
         # 함수 실행
         result = extract_web3_jobs("blockchain")
@@ -95,20 +80,16 @@ class TestWeb3Jobs:
         # sleep 호출 검증
         mock_sleep.assert_called_once_with(3)
         
-        # find_elements 호출 검증 (By.CSS_SELECTOR 포함)
-        expected_calls = [
-            call(By.CSS_SELECTOR, "h2[data-jobid]"),
-            call(By.CSS_SELECTOR, "h3[data-jobid]"),
-            call(By.CSS_SELECTOR, "a[data-jobid]")
-        ]
-        mock_driver.find_elements.assert_has_calls(expected_calls)
+        # 공고 행을 한 번의 execute_script 로 가져오는지 검증
+        mock_driver.execute_script.assert_called_once_with(JOBS_SCRIPT)
+        mock_driver.find_elements.assert_not_called()
         
         # 브라우저 종료 검증
         mock_driver.quit.assert_called_once()
     
     @patch('extractors.web3.time.sleep')
-    @patch('extractors.web3.ChromeDriverManager')
-    @patch('extractors.web3.webdriver.Chrome')
+    @patch('webdriver_manager.chrome.ChromeDriverManager')
+    @patch('selenium.webdriver.Chrome')
     def test_extract_web3_jobs_empty_result(self, mock_chrome, mock_driver_manager, mock_sleep, mock_empty_elements):
         """빈 결과인 경우 테스트"""
         # Mock ChromeDriverManager
@@ -118,12 +99,8 @@ class TestWeb3Jobs:
         mock_driver = MagicMock()
         mock_chrome.return_value = mock_driver
         
-        # Mock find_elements 반환값 설정 (빈 리스트)
-        mock_driver.find_elements.side_effect = [
-            mock_empty_elements['titles'],
-            mock_empty_elements['companies'],
-            mock_empty_elements['links']
-        ]
+        # Mock execute_script 반환값 설정 (빈 배열)
+        mock_driver.execute_script.return_value = mock_empty_elements
         
         # 함수 실행
         result = extract_web3_jobs("nonexistent")
@@ -136,8 +113,8 @@ class TestWeb3Jobs:
         mock_driver.quit.assert_called_once()
     
     @patch('extractors.web3.time.sleep')
-    @patch('extractors.web3.ChromeDriverManager')
-    @patch('extractors.web3.webdriver.Chrome')
+    @patch('webdriver_manager.chrome.ChromeDriverManager')
+    @patch('selenium.webdriver.Chrome')
     def test_extract_web3_jobs_webdriver_error(self, mock_chrome, mock_driver_manager, mock_sleep):
         """WebDriver 생성 에러 테스트"""
         # Mock ChromeDriverManager
@@ -151,8 +128,8 @@ class TestWeb3Jobs:
             extract_web3_jobs("blockchain")
     
     @patch('extractors.web3.time.sleep')
-    @patch('extractors.web3.ChromeDriverManager')
-    @patch('extractors.web3.webdriver.Chrome')
+    @patch('webdriver_manager.chrome.ChromeDriverManager')
+    @patch('selenium.webdriver.Chrome')
     def test_extract_web3_jobs_page_load_error(self, mock_chrome, mock_driver_manager, mock_sleep):
         """페이지 로딩 에러 테스트"""
         # Mock ChromeDriverManager
@@ -169,12 +146,12 @@ class TestWeb3Jobs:
         with pytest.raises(TimeoutException):
             extract_web3_jobs("blockchain")
         
-        # 실제 코드에서는 에러 발생 시 quit이 호출되지 않음 (try-except 블록 없음)
-        mock_driver.quit.assert_not_called()
+        # 에러가 나도 브라우저는 종료됨
+        mock_driver.quit.assert_called_once()
     
     @patch('extractors.web3.time.sleep')
-    @patch('extractors.web3.ChromeDriverManager')
-    @patch('extractors.web3.webdriver.Chrome')
+    @patch('webdriver_manager.chrome.ChromeDriverManager')
+    @patch('selenium.webdriver.Chrome')
     def test_extract_web3_jobs_different_keywords(self, mock_chrome, mock_driver_manager, mock_sleep, mock_web_elements):
         """다른 키워드로 호출시 URL 변경 테스트"""
         # Mock ChromeDriverManager
@@ -184,12 +161,8 @@ class TestWeb3Jobs:
         mock_driver = MagicMock()
         mock_chrome.return_value = mock_driver
         
-        # Mock find_elements 반환값 설정
-        mock_driver.find_elements.side_effect = [
-            mock_web_elements['titles'],
-            mock_web_elements['companies'],
-            mock_web_elements['links']
-        ]
+        # Mock execute_script 반환값 설정
+        mock_driver.execute_script.return_value = mock_web_elements
         
         # 여러 키워드로 테스트
         keywords = ["defi", "nft", "dao", "solidity"]
@@ -197,19 +170,15 @@ class TestWeb3Jobs:
         for keyword in keywords:
             # 각 테스트마다 새로운 driver mock 생성
             mock_driver.reset_mock()
-            mock_driver.find_elements.side_effect = [
-                mock_web_elements['titles'],
-                mock_web_elements['companies'],
-                mock_web_elements['links']
-            ]
+            mock_driver.execute_script.return_value = mock_web_elements
             
             extract_web3_jobs(keyword)
             expected_url = f"{BASE_URL}/{keyword}-jobs"
             mock_driver.get.assert_called_with(expected_url)
     
     @patch('extractors.web3.time.sleep')
-    @patch('extractors.web3.ChromeDriverManager')
-    @patch('extractors.web3.webdriver.Chrome')
+    @patch('webdriver_manager.chrome.ChromeDriverManager')
+    @patch('selenium.webdriver.Chrome')
     def test_extract_web3_jobs_return_structure(self, mock_chrome, mock_driver_manager, mock_sleep, mock_web_elements):
         """반환값 구조 검증 테스트"""
         # Mock ChromeDriverManager
@@ -219,12 +188,8 @@ class TestWeb3Jobs:
         mock_driver = MagicMock()
         mock_chrome.return_value = mock_driver
         
-        # Mock find_elements 반환값 설정
-        mock_driver.find_elements.side_effect = [
-            mock_web_elements['titles'],
-            mock_web_elements['companies'],
-            mock_web_elements['links']
-        ]
+        # Mock execute_script 반환값 설정
+        mock_driver.execute_script.return_value = mock_web_elements
         
         # 함수 실행
         result = extract_web3_jobs("blockchain")
@@ -246,10 +211,10 @@ class TestWeb3Jobs:
             assert job['link'].strip() != ''
     
     @patch('extractors.web3.time.sleep')
-    @patch('extractors.web3.ChromeDriverManager')
-    @patch('extractors.web3.webdriver.Chrome')
-    def test_extract_web3_jobs_driver_quit_not_called_on_error(self, mock_chrome, mock_driver_manager, mock_sleep):
-        """에러 발생 시 driver.quit()이 호출되지 않는지 테스트 (try-except 블록 없음)"""
+    @patch('webdriver_manager.chrome.ChromeDriverManager')
+    @patch('selenium.webdriver.Chrome')
+    def test_extract_web3_jobs_driver_quit_called_on_error(self, mock_chrome, mock_driver_manager, mock_sleep):
+        """에러 발생 시에도 driver.quit()이 호출되는지 테스트"""
         # Mock ChromeDriverManager
         mock_driver_manager.return_value.install.return_value = "/path/to/chromedriver"
         
@@ -257,19 +222,19 @@ class TestWeb3Jobs:
         mock_driver = MagicMock()
         mock_chrome.return_value = mock_driver
         
-        # Mock find_elements에서 에러 발생
-        mock_driver.find_elements.side_effect = Exception("Element not found")
+        # Mock execute_script에서 에러 발생
+        mock_driver.execute_script.side_effect = Exception("Element not found")
         
         # 함수 실행시 예외 발생 검증
-        with pytest.raises(Exception):
+        with pytest.raises(Exception, match="Element not found"):
             extract_web3_jobs("blockchain")
         
-        # 실제 코드에서는 에러 발생 시 quit이 호출되지 않음 (try-except 블록 없음)
-        mock_driver.quit.assert_not_called()
+        # 브라우저가 남지 않도록 에러가 나도 종료됨
+        mock_driver.quit.assert_called_once()
     
     @patch('extractors.web3.time.sleep')
-    @patch('extractors.web3.ChromeDriverManager')
-    @patch('extractors.web3.webdriver.Chrome')
+    @patch('webdriver_manager.chrome.ChromeDriverManager')
+    @patch('selenium.webdriver.Chrome')
     def test_extract_web3_jobs_chrome_options(self, mock_chrome, mock_driver_manager, mock_sleep, mock_web_elements):
         """Chrome 옵션 설정 테스트"""
         # Mock ChromeDriverManager
@@ -279,12 +244,8 @@ class TestWeb3Jobs:
         mock_driver = MagicMock()
         mock_chrome.return_value = mock_driver
         
-        # Mock find_elements 반환값 설정
-        mock_driver.find_elements.side_effect = [
-            mock_web_elements['titles'],
-            mock_web_elements['companies'],
-            mock_web_elements['links']
-        ]
+        # Mock execute_script 반환값 설정
+        mock_driver.execute_script.return_value = mock_web_elements
         
         # 함수 실행
         extract_web3_jobs("blockchain")
@@ -300,5 +261,57 @@ class TestWeb3Jobs:
         assert 'options' in call_args.kwargs
         options = call_args.kwargs['options']
         
-        # 옵션 내용은 실제 Options 객체이므로 직접 검증하기 어려움
-        # 대신 webdriver.Chrome이 올바른 인자로 호출되었는지만 확인 
\ No newline at end of file
+        # web3 프로필(lean): eager 로딩 + 트래커 / 리소스 차단
+        assert options.page_load_strategy == "eager"
+        assert "--headless=new" in options.arguments
+        mock_driver.execute_cdp_cmd.assert_any_call("Network.enable", {})
+
+    @patch('extractors.web3.time.sleep')
+    @patch('webdriver_manager.chrome.ChromeDriverManager')
+    @patch('selenium.webdriver.Chrome')
+    def test_extract_web3_jobs_skips_incomplete_rows(self, mock_chrome, mock_driver_manager, mock_sleep):
+        """data-jobid 로 묶었을 때 제목/회사/링크가 빠진 행은 건너뛰는지 테스트"""
+        # Mock ChromeDriverManager
+        mock_driver_manager.return_value.install.return_value = "/path/to/chromedriver"
+        
+        # Mock WebDriver
+        mock_driver = MagicMock()
+        mock_chrome.return_value = mock_driver
+        mock_driver.execute_script.return_value = json.dumps([
+            {"jobid": "1", "title": "Rust Engineer", "company": "", "link": "https://web3.career/job/1"},
+            {"jobid": "2", "title": "Go Engineer", "company": "Chain Inc", "link": "https://web3.career/job/2"},
+        ])
+        
+        # 함수 실행
+        result = extract_web3_jobs("rust")
+        
+        # 회사가 빠진 행은 다른 행과 섞이지 않고 제외됨
+        assert result == [
+            {"title": "Go Engineer", "company": "Chain Inc", "link": "https://web3.career/job/2"}
+        ]
+
+    @patch.object(web3.scraper(), 'get')
+    @patch('extractors.web3.governor.acquire', side_effect=BrowserBusy("no slot"))
+    @patch('selenium.webdriver.Chrome')
+    def test_extract_web3_jobs_sheds_to_http(self, mock_chrome, mock_acquire, mock_get):
+        """브라우저 자리가 없으면 크롬 없이 HTTP 로 읽는지 테스트"""
+        mock_get.return_value.text = """
+        <table>
+          <tr data-jobid="1"><td><a data-jobid="1" href="/job/1"><h2 data-jobid="1">Solidity Dev</h2></a></td>
+              <td><h3 data-jobid="1">DeFi Co</h3></td></tr>
+          <tr data-jobid="2"><td><h2 data-jobid="2">No Link</h2><h3 data-jobid="2">X</h3></td></tr>
+        </table>
+        """
+
+        result = extract_web3_jobs("solidity")
+
+        mock_chrome.assert_not_called()
+        mock_get.assert_called_once_with(f"{BASE_URL}/solidity-jobs", headers=HEADERS, timeout=TIMEOUT)
+        assert result == [{"title": "Solidity Dev", "company": "DeFi Co", "link": f"{BASE_URL}/job/1"}]
+
+    @patch.object(web3.scraper(), 'get', side_effect=Exception("blocked"))
+    @patch('extractors.web3.governor.acquire', side_effect=BrowserBusy("no slot"))
+    def test_extract_web3_jobs_shed_fallback_failure(self, mock_acquire, mock_get):
+        """HTTP 로도 못 읽으면 BrowserBusy 를 그대로 올리는지 테스트"""
+        with pytest.raises(BrowserBusy):
+            extract_web3_jobs("solidity")
@@ -3,12 +3,14 @@ import requests
 from unittest.mock import patch, MagicMock
 from bs4 import BeautifulSoup
 import sys
+from urllib.parse import urljoin
 import os
 
 # 프로젝트 루트 디렉토리를 Python path에 추가
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from extractors.wework import extract_wework_jobs, BASE_URL
+from extractors import engine, wework
+from extractors.wework import extract_wework_jobs, BASE_URL, TIMEOUT
 
 
 class TestWeworkJobs:
@@ -78,7 +80,7 @@ class TestWeworkJobs:
         """
         return html_content
 
-    @patch('extractors.wework.requests.get')
+    @patch.object(wework.scraper(), 'get')
     def test_extract_wework_jobs_success(self, mock_get, mock_html_response):
         """정상적인 경우 테스트"""
         # Mock response 설정
@@ -98,27 +100,27 @@ class TestWeworkJobs:
         first_job = result[0]
         assert first_job['title'] == 'Senior Python Developer'
         assert first_job['company'] == 'TechCorp Inc'
-        assert first_job['link'] == '/job/remote-python-developer'
+        assert first_job['link'] == urljoin(BASE_URL, '/job/remote-python-developer')
         
         # 두 번째 job 검증 (normal)
         second_job = result[1]
         assert second_job['title'] == 'Full Stack Engineer'
         assert second_job['company'] == 'StartupXYZ'
-        assert second_job['link'] == '/job/remote-fullstack-engineer'
+        assert second_job['link'] == urljoin(BASE_URL, '/job/remote-fullstack-engineer')
         
         # 세 번째 job 검증 (feature)
         third_job = result[2]
         assert third_job['title'] == 'DevOps Engineer'
         assert third_job['company'] == 'CloudSolutions'
-        assert third_job['link'] == '/job/remote-devops-engineer'
+        assert third_job['link'] == urljoin(BASE_URL, '/job/remote-devops-engineer')
         
         # API 호출 검증
         expected_url = f"{BASE_URL}python"
         mock_get.assert_called_once_with(expected_url, headers={
             "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/135.0.0.0 Safari/537.36"
-        })
+        }, timeout=TIMEOUT)
 
-    @patch('extractors.wework.requests.get')
+    @patch.object(wework.scraper(), 'get')
     def test_extract_wework_jobs_empty_result(self, mock_get, mock_empty_response):
         """빈 결과인 경우 테스트"""
         # Mock response 설정
@@ -134,7 +136,7 @@ class TestWeworkJobs:
         assert isinstance(result, list)
         assert len(result) == 0
 
-    @patch('extractors.wework.requests.get')
+    @patch.object(wework.scraper(), 'get')
     def test_extract_wework_jobs_http_error(self, mock_get):
         """HTTP 에러 발생시 테스트"""
         # Mock response 설정 (에러 발생)
@@ -144,7 +146,7 @@ class TestWeworkJobs:
         with pytest.raises(requests.exceptions.RequestException):
             extract_wework_jobs("python")
 
-    @patch('extractors.wework.requests.get')
+    @patch.object(wework.scraper(), 'get')
     def test_extract_wework_jobs_invalid_html(self, mock_get, mock_invalid_html):
         """잘못된 HTML 구조인 경우 테스트"""
         # Mock response 설정
@@ -153,11 +155,15 @@ class TestWeworkJobs:
         mock_response.status_code = 200
         mock_get.return_value = mock_response
         
-        # 함수 실행시 AttributeError 발생 검증 (h4 또는 p 태그가 없어서)
-        with pytest.raises(AttributeError):
-            extract_wework_jobs("python")
+        skipped = engine.skipped.value(source="wework", field="title", selector="h4.new-listing__header__title")
+
+        # h4 / p 태그가 없는 행은 건너뛰고 (처음 실패한 필드로) 메트릭에 기록
+        assert extract_wework_jobs("python") == []
+        assert engine.skipped.value(
+            source="wework", field="title", selector="h4.new-listing__header__title"
+        ) == skipped + 1
 
-    @patch('extractors.wework.requests.get')
+    @patch.object(wework.scraper(), 'get')
     def test_extract_wework_jobs_different_keywords(self, mock_get, mock_html_response):
         """다른 키워드로 호출시 URL 변경 테스트"""
         # Mock response 설정
@@ -174,9 +180,9 @@ class TestWeworkJobs:
             expected_url = f"{BASE_URL}{keyword}"
             mock_get.assert_called_with(expected_url, headers={
                 "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/135.0.0.0 Safari/537.36"
-            })
+            }, timeout=TIMEOUT)
 
-    @patch('extractors.wework.requests.get')
+    @patch.object(wework.scraper(), 'get')
     def test_extract_wework_jobs_return_structure(self, mock_get, mock_html_response):
         """반환값 구조 검증 테스트"""
         # Mock response 설정
@@ -204,7 +210,7 @@ class TestWeworkJobs:
             assert job['company'].strip() != ''
             assert job['link'].strip() != ''
 
-    @patch('extractors.wework.requests.get')
+    @patch.object(wework.scraper(), 'get')
     def test_extract_wework_jobs_both_listing_types(self, mock_get):
         """feature와 normal 두 가지 listing 타입 모두 처리하는지 테스트"""
         # 각각 다른 타입의 listing만 있는 HTML
@@ -252,7 +258,7 @@ class TestWeworkJobs:
         assert len(result_normal) == 1
         assert result_normal[0]['title'] == 'Normal Job'
 
-    @patch('extractors.wework.requests.get')
+    @patch.object(wework.scraper(), 'get')
     def test_extract_wework_jobs_url_encoding(self, mock_get, mock_html_response):
         """키워드에 공백이나 특수문자가 있을 때 URL 처리 테스트"""
         # Mock response 설정
@@ -268,7 +274,7 @@ class TestWeworkJobs:
         expected_url = f"{BASE_URL}{keyword_with_space}"
         mock_get.assert_called_with(expected_url, headers={
             "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/135.0.0.0 Safari/537.36"
-        })
+        }, timeout=TIMEOUT)
 
     @pytest.fixture
     def mock_partial_data_html(self):
@@ -289,7 +295,7 @@ class TestWeworkJobs:
         """
         return html_content
 
-    @patch('extractors.wework.requests.get')
+    @patch.object(wework.scraper(), 'get')
     def test_extract_wework_jobs_with_partial_data(self, mock_get, mock_partial_data_html):
         """일부 데이터만 있는 경우에도 정상 처리되는지 테스트"""
         # Mock response 설정
@@ -308,4 +314,4 @@ class TestWeworkJobs:
         job = result[0]
         assert job['title'] == 'Partial Job Title'
         assert job['company'] == 'Partial Company'
-        assert job['link'] == '/job/partial-job' 
\ No newline at end of file
+        assert job['link'] == urljoin(BASE_URL, '/job/partial-job') 
\ No newline at end of file
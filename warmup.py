@@ -0,0 +1,103 @@
+import os
+import threading
+import time
+from urllib.parse import urlsplit
+from log import get_logger
+
+# 서버가 뜬 뒤 백그라운드에서 첫 검색이 느리지 않도록 미리 준비하는 단계 (기본 꺼짐)
+#   JOBSCRAPER_WARMUP     1 이면 사용
+#   WARMUP_DELAY          시작 전 대기 초, 서버가 먼저 요청을 받기 시작하도록 (기본 1)
+#   WARMUP_BROWSERS       미리 띄울 헤드리스 크롬 수, 브라우저 슬롯(BROWSER_SLOTS)을 넘지 않음 (기본 1)
+#   WARMUP_HOT_KEYWORDS   저장소에서 미리 읽어 둘 인기 키워드 수 (기본 20)
+#
+# 단계
+#   1. ChromeDriver 경로 확인 (webdriver_manager 버전 확인 요청을 첫 검색 전에 끝냄)
+#   2. 브라우저 미리 띄우기 (extractors.browser.browser_pool)
+#   3. 세 사이트에 keep-alive 연결 열기 (추출기별 cloudscraper 세션)
+#   4. 많이 검색된 키워드의 결과를 저장소에서 읽어서 메모리 / 검색 색인에 올림
+# 각 단계는 실패해도 다음 단계로 넘어감
+ENABLED = os.environ.get("JOBSCRAPER_WARMUP", "").lower() in ("1", "true", "yes")
+DELAY = float(os.environ.get("WARMUP_DELAY", "1"))
+BROWSERS = int(os.environ.get("WARMUP_BROWSERS", "1"))
+HOT_KEYWORDS = int(os.environ.get("WARMUP_HOT_KEYWORDS", "20"))
+
+logger = get_logger("warmup")
+
+_thread = None
+
+
+def resolve_driver():
+    from extractors import web3
+    return web3.driver_path()
+
+
+def prespawn_browsers(count):
+    from extractors import web3
+    from extractors.browser import browser_pool, governor
+    count = min(count, governor.slots)
+    for _ in range(count - len(browser_pool)):
+        browser_pool.put(web3.new_driver())
+    return len(browser_pool)
+
+
+def open_connections():
+    # 사이트 첫 페이지에 HEAD 요청을 보내서 세션의 연결 풀에 TCP / TLS 연결을 만들어 둠
+    from extractors import berlin, web3, wework
+    opened = 0
+    for module in (berlin, wework, web3):
+        parts = urlsplit(module.BASE_URL)
+        try:
+            module.scraper().head(f"{parts.scheme}://{parts.netloc}/", headers=module.HEADERS, timeout=module.TIMEOUT)
+            opened += 1
+        except Exception as e:
+            logger.warning("warm-up connection failed", extra={"url": module.BASE_URL, "error": str(e)})
+    return opened
+
+
+def load_hot_keywords(store, index, count):
+    loaded = 0
+    for keyword in store.hottest(count):
+        try:
+            jobs = store[keyword]
+        except KeyError:
+            continue
+        if index is not None:
+            index.update(keyword, jobs, store.version(keyword))
+        loaded += 1
+    return loaded
+
+
+def run(store, index=None, browsers=BROWSERS, hot_keywords=HOT_KEYWORDS):
+    steps = [
+        ("driver", resolve_driver),
+        ("browsers", lambda: prespawn_browsers(browsers) if browsers > 0 else 0),
+        ("connections", open_connections),
+        ("hot_keywords", lambda: load_hot_keywords(store, index, hot_keywords) if hot_keywords > 0 else 0),
+    ]
+    report = {}
+    for name, step in steps:
+        start = time.perf_counter()
+        try:
+            result = step()
+        except Exception as e:
+            logger.warning("warm-up step failed", extra={"step": name, "error": str(e)})
+            result = None
+        report[name] = {"result": result, "seconds": round(time.perf_counter() - start, 3)}
+    logger.info("warm-up finished", extra={"steps": report})
+    return report
+
+
+def start(store, index=None, delay=None, force=False, **kwargs):
+    # JOBSCRAPER_WARMUP 이 켜져 있을 때만 (force=True 면 항상) 백그라운드 스레드로 실행
+    global _thread
+    if not (ENABLED or force) or (_thread is not None and _thread.is_alive()):
+        return None
+    delay = DELAY if delay is None else delay
+
+    def target():
+        time.sleep(delay)
+        run(store, index, **kwargs)
+
+    _thread = threading.Thread(target=target, name="warmup", daemon=True)
+    _thread.start()
+    return _thread
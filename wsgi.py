@@ -0,0 +1,16 @@
+# 운영용 진입점: gunicorn -c gunicorn.conf.py wsgi:app
+from log import setup_logging
+import metrics
+import warmup
+from main import app, db, search_index
+from extractors.browser import start_reaper
+
+setup_logging()
+# 남은 헤드리스 크롬을 주기적으로 정리 (BROWSER_REAPER_INTERVAL)
+start_reaper()
+# METRICS_DIR 이 있으면 이 워커의 메트릭을 주기적으로 써서 /metrics 가 모든 워커 것을 합쳐 보여주도록 (metrics.py)
+metrics.start_flusher()
+# JOBSCRAPER_WARMUP=1 이면 워커가 요청을 받기 시작한 뒤 백그라운드에서 준비 (warmup.py)
+warmup.start(db, search_index)
+
+application = app